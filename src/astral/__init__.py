@@ -39,24 +39,26 @@ The package also provides a self contained geocoder to turn a small set of
 location names into timezone, latitude and longitude. The lookups
 can be perfomed using the :func:`~astral.geocoder.lookup` function defined in
 :mod:`astral.geocoder`
+
+The submodules are imported the first time they are accessed as an attribute
+of the package, so ``import astral`` on its own only loads the types defined here.
 """
 
 import datetime
-import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from importlib import import_module
 from math import radians, tan
-from typing import Optional, Tuple, Union
-
-try:
-    import zoneinfo
-except ImportError:
-    from backports import zoneinfo  # type: ignore
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 
 __all__ = [
     "Depression",
     "SunDirection",
+    "EventStatus",
+    "EventResult",
+    "HorizonProfile",
     "Observer",
     "LocationInfo",
     "AstralBodyPosition",
@@ -66,12 +68,56 @@ __all__ = [
     "refraction_at_zenith",
 ]
 
+_SUBMODULES = (
+    "alignment",
+    "cache",
+    "dataframe",
+    "ephemeris",
+    "eventtable",
+    "fleet",
+    "geocoder",
+    "instrumentation",
+    "intervals",
+    "julian",
+    "location",
+    "moon",
+    "prayer",
+    "schedule",
+    "search",
+    "sidereal",
+    "sun",
+    "table4",
+    "timer",
+    "vectorized",
+)
+
+# Submodules which need numpy or pandas are only listed by dir() once imported,
+# so that tools which look up every attribute of a module, such as freezegun, do
+# not import them
+_OPTIONAL_SUBMODULES = ("dataframe", "fleet", "vectorized")
+
 __version__ = "3.2"
 __author__ = "Simon Kennedy <sffjunkie+code@gmail.com>"
 
 
+def __getattr__(name: str) -> Any:
+    """Import the submodules on first access e.g. ``astral.sun``"""
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    submodules = [
+        name
+        for name in _SUBMODULES
+        if name not in _OPTIONAL_SUBMODULES or f"{__name__}.{name}" in sys.modules
+    ]
+    return sorted(list(globals()) + submodules)
+
+
 TimePeriod = Tuple[datetime.datetime, datetime.datetime]
-Elevation = Union[float, Tuple[float, float]]
+Elevation = Union[float, Tuple[float, float], "HorizonProfile"]
 Degrees = float
 Radians = float
 Minutes = float
@@ -111,6 +157,8 @@ def dms_to_float(
     try:
         res = float(dms)  # type: ignore
     except (ValueError, TypeError) as exc:
+        import re
+
         _dms_re = r"(?P<deg>\d{1,3})[°]((?P<min>\d{1,2})[′'])?((?P<sec>\d{1,2})[″\"])?(?P<dir>[NSEW])?"  # noqa
         dms_match = re.match(_dms_re, str(dms), flags=re.IGNORECASE)
         if dms_match:
@@ -217,6 +265,35 @@ class SunDirection(Enum):
     SETTING = -1
 
 
+class EventStatus(Enum):
+    """Whether an event such as sunrise occurs on a date.
+
+    ``ALWAYS_ABOVE`` and ``ALWAYS_BELOW`` mean that the body stays above or below
+    the elevation which defines the event for the whole day e.g. during the
+    midnight sun the sun is ``ALWAYS_ABOVE`` the horizon. ``NOT_ON_DATE`` means
+    that the body crosses the elevation but not on the date requested.
+    """
+
+    OCCURS = 0
+    ALWAYS_ABOVE = 1
+    ALWAYS_BELOW = 2
+    NOT_ON_DATE = 3
+
+
+@dataclass(frozen=True)
+class EventResult:
+    """The time of an event, or the reason that it does not occur.
+
+    The result is truthy only if the event occurs, in which case `time` is set.
+    """
+
+    status: EventStatus
+    time: Optional[datetime.datetime] = None
+
+    def __bool__(self) -> bool:
+        return self.status == EventStatus.OCCURS
+
+
 @dataclass
 class AstralBodyPosition:
     """The position of an astral body as seen from earth"""
@@ -226,6 +303,71 @@ class AstralBodyPosition:
     distance: Radians = field(default_factory=float)
 
 
+@dataclass
+class HorizonProfile:
+    """The altitude of the visible horizon around an observer e.g. the
+    terrain surrounding a valley.
+
+    The altitudes are for equally spaced azimuths, with the first at North
+    (0 degrees) and continuing clockwise. Altitudes at azimuths between these
+    are linearly interpolated.
+
+    Args:
+        altitudes: Altitudes of the horizon in degrees above the true horizon
+    """
+
+    altitudes: Tuple[float, ...] = (0.0,)
+
+    def __post_init__(self):
+        self.altitudes = tuple(float(altitude) for altitude in self.altitudes)
+        if not self.altitudes:
+            raise ValueError("A horizon profile needs at least one altitude")
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[Tuple[float, float]], bins: int = 360
+    ) -> "HorizonProfile":
+        """Create a profile from a set of (azimuth, altitude) pairs which are not
+        necessarily equally spaced, for instance from a survey of the horizon.
+
+        Args:
+            points: (azimuth, altitude) pairs in degrees
+            bins:   Number of equally spaced azimuths to resample the points to
+        """
+        ordered = sorted((azimuth % 360.0, altitude) for azimuth, altitude in points)
+        if not ordered:
+            raise ValueError("A horizon profile needs at least one altitude")
+
+        # Wrap the first and last points around North to interpolate across it
+        first, last = ordered[0], ordered[-1]
+        ordered.insert(0, (last[0] - 360.0, last[1]))
+        ordered.append((first[0] + 360.0, first[1]))
+
+        altitudes = []
+        idx = 0
+        for index in range(bins):
+            azimuth = index * 360.0 / bins
+            while ordered[idx + 1][0] < azimuth:
+                idx += 1
+            (az0, alt0), (az1, alt1) = ordered[idx], ordered[idx + 1]
+            if az1 == az0:
+                altitudes.append(alt1)
+            else:
+                altitudes.append(alt0 + (alt1 - alt0) * (azimuth - az0) / (az1 - az0))
+        return cls(tuple(altitudes))
+
+    def altitude(self, azimuth: float) -> float:
+        """The altitude of the horizon in degrees at `azimuth` degrees clockwise
+        from North"""
+        count = len(self.altitudes)
+        position = (azimuth % 360.0) * count / 360.0
+        idx = int(position)
+        fraction = position - idx
+        alt0 = self.altitudes[idx % count]
+        alt1 = self.altitudes[(idx + 1) % count]
+        return alt0 + (alt1 - alt0) * fraction
+
+
 @dataclass
 class Observer:
     """Defines the location of an observer on Earth.
@@ -243,6 +385,9 @@ class Observer:
       obscuring feature is the horizon
     * or a tuple of the elevation in metres and the distance in metres to the
       nearest obscuring feature.
+    * or a :class:`HorizonProfile` giving the altitude of the visible horizon
+      at each azimuth. Sunrise and sunset are then the times the sun clears the
+      profile.
 
     Args:
         latitude:   Latitude - Northern latitudes should be positive
@@ -261,7 +406,9 @@ class Observer:
         elif name == "longitude":
             value = dms_to_float(value, 180.0)
         elif name == "elevation":
-            if isinstance(value, tuple):
+            if isinstance(value, HorizonProfile):
+                pass
+            elif isinstance(value, tuple):
                 value = (float(value[0]), float(value[1]))
             else:
                 value = float(value)
@@ -309,6 +456,11 @@ class LocationInfo:
     @property
     def tzinfo(self):  # type: ignore
         """Return a zoneinfo.ZoneInfo for this location"""
+        try:
+            import zoneinfo
+        except ImportError:
+            from backports import zoneinfo  # type: ignore
+
         return zoneinfo.ZoneInfo(self.timezone)  # type: ignore
 
     @property
@@ -1,72 +1,361 @@
+"""Command line interface to the sun (and optionally moon) calculations.
+
+Single location mode::
+
+    python -m astral [-d yyyy-mm-dd] [-t tzname] latitude longitude [elevation]
+
+Batch mode reads one observer per line from a CSV file (with a header row) or
+a JSON Lines file and writes one result per observer and date to stdout, in the
+same format as the input::
+
+    python -m astral --batch locations.csv --end 2024-12-31 --moon --jobs 4
+
+Recognised batch fields are ``latitude``, ``longitude``, ``elevation``, ``name``,
+``region``, ``tzname`` (or ``timezone``), ``date`` and ``end``. Fields missing from
+a row are taken from the corresponding command line options. A row which cannot
+be read, e.g. with a missing latitude, an invalid date or an unknown time zone,
+gives a result with an ``error`` field and the following rows are still
+calculated.
+"""
+
 import argparse
+import csv
 import datetime
 import json
-from typing import Any, Dict
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-from astral import LocationInfo, Observer, sun
+from astral import LocationInfo, Observer, moon, sun, today
 
 try:
     import zoneinfo
 except ImportError:
     from backports import zoneinfo  # type: ignore
 
-options = argparse.ArgumentParser()
-options.add_argument(
-    "-n",
-    "--name",
-    dest="name",
-    default="Somewhere",
-    help="Location name (free-form text)",
-)
-options.add_argument(
-    "-r", "--region", dest="region", default="On Earth", help="Region (free-form text)"
-)
-options.add_argument(
-    "-d", "--date", dest="date", help="Date to compute times for (yyyy-mm-dd)"
-)
-options.add_argument("-t", "--tzname", help="Timezone name")
-options.add_argument("latitude", type=float, help="Location latitude (float)")
-options.add_argument("longitude", type=float, help="Location longitude (float)")
-options.add_argument(
-    "elevation", nargs="?", type=float, default=0.0, help="Elevation in metres (float)"
-)
-args = options.parse_args()
-
-loc = LocationInfo(
-    args.name,
-    args.region,
-    args.tzname,
-    args.latitude,
-    args.longitude,
-)
+# latitude, longitude, elevation, name, region, tzname, date, include moon
+Task = Tuple[
+    float, float, float, str, str, Optional[str], Optional[datetime.date], bool
+]
 
-obs = Observer(args.latitude, args.longitude, args.elevation)
+# The columns of the CSV output, with the moon's only when it is included
+_SUN_COLUMNS = ["date", "dawn", "sunrise", "noon", "sunset", "dusk"]
+_MOON_COLUMNS = ["moonrise", "moonset", "moon_phase"]
+_INFO_COLUMNS = ["timezone", "location", "error"]
 
-kwargs: Dict[str, Any] = {}
-kwargs["observer"] = obs
 
-if args.date is not None:
+def _parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    if value is None or value == "":
+        return None
+
     try:
-        kwargs["date"] = datetime.datetime.strptime(args.date, "%Y-%m-%d").date()
-    except:  # noqa: E722
-        kwargs["date"] = datetime.date.today()
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"invalid date {value!r}, expected yyyy-mm-dd") from None
+
+
+def _date_argument(value: str) -> Optional[datetime.date]:
+    try:
+        return _parse_date(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _options() -> argparse.ArgumentParser:
+    options = argparse.ArgumentParser(prog="python -m astral")
+    options.add_argument(
+        "-n",
+        "--name",
+        dest="name",
+        default="Somewhere",
+        help="Location name (free-form text)",
+    )
+    options.add_argument(
+        "-r",
+        "--region",
+        dest="region",
+        default="On Earth",
+        help="Region (free-form text)",
+    )
+    options.add_argument(
+        "-d",
+        "--date",
+        dest="date",
+        type=_date_argument,
+        help="Date to compute times for (yyyy-mm-dd)",
+    )
+    options.add_argument(
+        "-e",
+        "--end",
+        dest="end",
+        type=_date_argument,
+        help="Compute times for every date from --date up to this date (yyyy-mm-dd)",
+    )
+    options.add_argument("-t", "--tzname", help="Timezone name")
+    options.add_argument(
+        "-m",
+        "--moon",
+        action="store_true",
+        help="Include moon rise, set and phase",
+    )
+    options.add_argument(
+        "-b",
+        "--batch",
+        metavar="FILE",
+        help="Read observers from FILE ('-' for stdin) instead of the command line",
+    )
+    options.add_argument(
+        "-f",
+        "--format",
+        dest="format",
+        choices=["csv", "jsonl"],
+        help="Format of the batch input. Default is to infer it from the input",
+    )
+    options.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to use in batch mode",
+    )
+    options.add_argument(
+        "latitude", nargs="?", type=float, help="Location latitude (float)"
+    )
+    options.add_argument(
+        "longitude", nargs="?", type=float, help="Location longitude (float)"
+    )
+    options.add_argument(
+        "elevation",
+        nargs="?",
+        type=float,
+        default=0.0,
+        help="Elevation in metres (float)",
+    )
+    return options
+
+
+def _date_range(
+    start: Optional[datetime.date], end: Optional[datetime.date]
+) -> Iterator[Optional[datetime.date]]:
+    if start is None:
+        # Resolved to today's date in the observer's timezone by `compute`
+        yield None
+        return
+
+    if end is None or end < start:
+        end = start
+
+    oneday = datetime.timedelta(days=1)
+    while start <= end:
+        yield start
+        start += oneday
+
+
+def compute(task: Union[Task, Dict[str, Any]]) -> Dict[str, Any]:
+    """Calculate the times for a single observer and date, formatted as strings.
+
+    A dictionary in place of a task is the result for a row which could not be
+    read and is returned unchanged."""
+    if isinstance(task, dict):
+        return task
+
+    latitude, longitude, elevation, name, region, tzname, date, with_moon = task
+
+    loc = LocationInfo(name, region, tzname or "UTC", latitude, longitude)
+    obs = Observer(latitude, longitude, elevation)
+
+    format_str = "%Y-%m-%dT%H:%M:%S"
+    tzinfo: datetime.tzinfo
+    if tzname is None:
+        tzinfo = datetime.timezone.utc
+        format_str += "Z"
+    else:
+        try:
+            tzinfo = zoneinfo.ZoneInfo(tzname)  # type: ignore
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            return {
+                "date": date.isoformat() if date else None,
+                "timezone": tzname,
+                "location": f"{loc.name}, {loc.region}",
+                "error": f"unknown timezone {tzname!r}",
+            }
+        format_str += "%z"
+
+    if date is None:
+        date = today(tzinfo)
+
+    result: Dict[str, Any] = {"date": date.isoformat()}
+    try:
+        s = sun.sun(obs, date, tzinfo=tzinfo)
+        for key, value in s.items():
+            result[key] = value.strftime(format_str)
+    except ValueError as exc:
+        result["error"] = str(exc)
+
+    if with_moon:
+        for key, func in (("moonrise", moon.moonrise), ("moonset", moon.moonset)):
+            try:
+                value = func(obs, date, tzinfo)
+                result[key] = value.strftime(format_str) if value else None
+            except ValueError:
+                result[key] = None
+        result["moon_phase"] = moon.phase(date)
+
+    result["timezone"] = tzname or "UTC"
+    result["location"] = f"{loc.name}, {loc.region}"
+    return result
+
+
+def _detect_format(stream: TextIO) -> Tuple[str, Iterable[str]]:
+    """Detect whether a stream is CSV or JSON Lines from its first line, and
+    return the format and the stream's lines."""
+    line = stream.readline()
+    while line and line.strip() == "":
+        line = stream.readline()
+    fmt = "jsonl" if line.lstrip().startswith("{") else "csv"
+    return fmt, _chain([line], stream)
+
+
+def _read_rows(
+    lines: Iterable[str], fmt: str
+) -> Iterator[Union[Dict[str, Any], ValueError]]:
+    """Read observer rows from CSV or JSON Lines, with a ValueError in place of
+    a line which is not a JSON object."""
+    if fmt == "jsonl":
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield ValueError(f"invalid JSON: {exc}")
+                continue
+            if isinstance(row, dict):
+                yield row
+            else:
+                yield ValueError("expected a JSON object")
+    else:
+        for row in csv.DictReader(lines):
+            yield row
+
+
+def _chain(first: List[str], rest: Iterable[str]) -> Iterator[str]:
+    yield from first
+    yield from rest
+
+
+def _tasks(
+    rows: Iterable[Union[Dict[str, Any], ValueError]], args: argparse.Namespace
+) -> Iterator[Union[Task, Dict[str, Any]]]:
+    """Expand each row into one task per date in its date range, or an error
+    result for a row which cannot be read"""
+    default_start = args.date
+    default_end = args.end
+
+    for row in rows:
+        try:
+            if isinstance(row, ValueError):
+                raise row
+            tzname = row.get("tzname") or row.get("timezone") or args.tzname
+            start = _parse_date(row.get("date")) or default_start
+            end = _parse_date(row.get("end")) or default_end
+            observer = (
+                float(row["latitude"]),
+                float(row["longitude"]),
+                float(row.get("elevation") or args.elevation or 0.0),
+                str(row.get("name") or args.name),
+                str(row.get("region") or args.region),
+                tzname,
+            )
+        except KeyError as exc:
+            yield {"error": f"missing field {exc}"}
+            continue
+        except (TypeError, ValueError) as exc:
+            yield {"error": str(exc)}
+            continue
+
+        for date in _date_range(start, end):
+            yield observer + (date, args.moon)
+
+
+def _run_batch(args: argparse.Namespace, output: TextIO) -> None:
+    if args.batch == "-":
+        stream = sys.stdin
+    else:
+        stream = open(args.batch, newline="", encoding="utf-8")
+
+    fmt = args.format
+    if fmt is None and args.batch.endswith((".jsonl", ".ndjson")):
+        fmt = "jsonl"
+    elif fmt is None and args.batch.endswith(".csv"):
+        fmt = "csv"
+
+    try:
+        lines: Iterable[str] = stream
+        if fmt is None:
+            fmt, lines = _detect_format(stream)
+        write = _write if fmt == "jsonl" else _csv_writer(args.moon)
+
+        tasks = _tasks(_read_rows(lines, fmt), args)
+        if args.jobs > 1:
+            import multiprocessing
+
+            with multiprocessing.Pool(args.jobs) as pool:
+                write(pool.imap(compute, tasks, chunksize=256), output)
+        else:
+            write(map(compute, tasks), output)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _write(results: Iterable[Dict[str, Any]], output: TextIO) -> None:
+    for result in results:
+        output.write(json.dumps(result))
+        output.write("\n")
+
+
+def _csv_writer(
+    with_moon: bool,
+) -> Callable[[Iterable[Dict[str, Any]], TextIO], None]:
+    """A function which writes results as CSV with a header row"""
+    columns = _SUN_COLUMNS + (_MOON_COLUMNS if with_moon else []) + _INFO_COLUMNS
+
+    def write(results: Iterable[Dict[str, Any]], output: TextIO) -> None:
+        writer = csv.DictWriter(output, columns, lineterminator="\n")
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+
+    return write
+
 
-sun_as_str = {}
-format_str = "%Y-%m-%dT%H:%M:%S"
-if args.tzname is None:
-    kwargs["tzinfo"] = datetime.timezone.utc
-    format_str += "Z"
-else:
-    kwargs["tzinfo"] = zoneinfo.ZoneInfo(loc.timezone)
-    format_str += "%z"
+def main(argv: Optional[List[str]] = None, output: TextIO = sys.stdout) -> int:
+    options = _options()
+    args = options.parse_args(argv)
 
+    if args.batch is not None:
+        _run_batch(args, output)
+        return 0
 
-s = sun.sun(**kwargs)
+    if args.latitude is None or args.longitude is None:
+        options.error("latitude and longitude are required unless --batch is used")
 
-for key, value in s.items():
-    sun_as_str[key] = s[key].strftime(format_str)
+    row = {"latitude": args.latitude, "longitude": args.longitude}
+    _write(map(compute, _tasks([row], args)), output)
+    return 0
 
-sun_as_str["timezone"] = kwargs["tzinfo"].tzname
-sun_as_str["location"] = f"{loc.name}, {loc.region}"
 
-print(json.dumps(sun_as_str))
+if __name__ == "__main__":
+    sys.exit(main())
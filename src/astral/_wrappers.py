@@ -0,0 +1,90 @@
+"""The chain of wrappers installed around functions of the sun and moon modules
+by :mod:`astral.cache` and :mod:`astral.instrumentation`.
+
+Each adds a layer, which wraps a set of functions. Whenever a layer is added or
+removed the wrappers for each function are built again from the original
+function, with the layers in the order they were added, so the layers can be
+removed in any order. Functions with no layers are restored to the original.
+"""
+
+import threading
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+# A function which wraps the function with the name ``module.function``
+Wrap = Callable[[str, Callable[..., Any]], Callable[..., Any]]
+# module name, function names
+Functions = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+_lock = threading.Lock()
+# name, functions, wrap
+_layers: List[Tuple[str, Functions, Wrap]] = []
+# The original and the installed function for each wrapped module and name
+_installed: Dict[Tuple[str, str], Tuple[Callable[..., Any], Callable[..., Any]]] = {}
+
+
+def add_layer(name: str, functions: Functions, wrap: Wrap) -> None:
+    """Wrap the `functions` with `wrap`, outside any existing layers.
+
+    Raises:
+        RuntimeError: if the layer has already been added, or a wrapped function
+                      has been replaced by something else
+    """
+    with _lock:
+        if any(layer[0] == name for layer in _layers):
+            raise RuntimeError(f"{name} is already enabled")
+        _check()
+        _layers.append((name, functions, wrap))
+        _rebuild()
+
+
+def remove_layer(name: str) -> None:
+    """Remove a layer, if it has been added.
+
+    Raises:
+        RuntimeError: if a wrapped function has been replaced by something else
+    """
+    with _lock:
+        if not any(layer[0] == name for layer in _layers):
+            return
+        _check()
+        _layers[:] = [layer for layer in _layers if layer[0] != name]
+        _rebuild()
+
+
+def has_layer(name: str) -> bool:
+    """Whether a layer has been added"""
+    return any(layer[0] == name for layer in _layers)
+
+
+def _check() -> None:
+    for (module_name, name), (_, installed) in _installed.items():
+        if getattr(import_module(f"astral.{module_name}"), name) is not installed:
+            raise RuntimeError(
+                f"astral.{module_name}.{name} has been replaced since it was wrapped"
+            )
+
+
+def _rebuild() -> None:
+    wraps: Dict[Tuple[str, str], List[Wrap]] = {key: [] for key in _installed}
+    for _, functions, wrap in _layers:
+        for module_name, names in functions:
+            for name in names:
+                wraps.setdefault((module_name, name), []).append(wrap)
+
+    for (module_name, name), layers in wraps.items():
+        module = import_module(f"astral.{module_name}")
+        if (module_name, name) in _installed:
+            original = _installed[(module_name, name)][0]
+        else:
+            original = getattr(module, name)
+
+        func = original
+        for wrap in layers:
+            func = wrap(f"{module_name}.{name}", func)
+        setattr(module, name, func)
+
+        if layers:
+            _installed[(module_name, name)] = (original, func)
+        else:
+            del _installed[(module_name, name)]
@@ -0,0 +1,287 @@
+"""Find when the sun or moon rises or sets at a bearing.
+
+For instance, to find the dates on which the sun sets along a street running at a
+bearing of 299 degrees ::
+
+    from astral import alignment
+
+    for match in alignment.sun_alignments(observer, 299.0, start, end):
+        print(match.time, match.azimuth)
+
+The sun's azimuth as it passes through an elevation only depends on its
+declination, so it is calculated directly for each day from the interpolated
+ephemeris without calling :func:`astral.sun.sunset` and
+:func:`astral.sun.azimuth`. The moon's elevation is sampled every hour and the
+times it passes through the elevation are refined with a root finder.
+
+The sun or moon only passes through the elevation once a day, so it is rarely
+exactly at the bearing when it does. For each match the instant close to the
+crossing at which its azimuth equals the bearing is also found, by bisection, and
+returned as :attr:`Alignment.aligned` with the elevation at that instant.
+"""
+
+import datetime
+from dataclasses import dataclass
+from math import acos, asin, atan2, cos, degrees, floor, radians, sin, sqrt, tan
+from typing import Callable, List, Optional, Tuple, Union
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+from astral import Observer, SunDirection, moon, refraction_at_zenith
+from astral.intervals import (
+    _JD_EPOCH,
+    TimeRange,
+    _crossings,
+    _jd2000,
+    _moon_ephemeris,
+    _range,
+)
+from astral.moon import _above_horizon, _azimuth
+from astral.sun import _crossing_jd, _InterpolatedEphemeris, _noon_jd, _transit_terms
+
+__all__ = ["Alignment", "sun_alignments", "moon_alignments"]
+
+
+@dataclass(frozen=True)
+class Alignment:
+    """The sun or moon passing through an elevation close to a bearing
+
+    Attributes:
+        time:       The time the sun or moon passes through the elevation
+        azimuth:    Its azimuth at that time in degrees clockwise from North
+        difference: The difference in degrees between the azimuth and the
+                    bearing, positive when the azimuth is clockwise of it
+        aligned:    The time closest to `time` at which its azimuth equals the
+                    bearing, or None if that is more than two hours away
+        aligned_elevation: Its elevation at the time `aligned`, or None
+    """
+
+    time: datetime.datetime
+    azimuth: float
+    difference: float
+    aligned: Optional[datetime.datetime] = None
+    aligned_elevation: Optional[float] = None
+
+
+# Seconds between the times checked for the azimuth reaching the bearing, the
+# furthest from the crossing to look and the accuracy of the time found
+_ALIGNED_STEP = 600.0
+_ALIGNED_LIMIT = 7200.0
+_ALIGNED_TOLERANCE = 0.01
+
+
+def _difference(azimuth: float, bearing: float) -> float:
+    return (azimuth - bearing + 180.0) % 360.0 - 180.0
+
+
+def _aligned(func: Callable[[float], float], timestamp: float) -> Optional[float]:
+    """Find the time closest to `timestamp` at which `func`, the difference in
+    degrees between an azimuth and the bearing, is 0.
+
+    Steps away from `timestamp` on both sides until the difference changes sign
+    and then bisects the step."""
+    f = func(timestamp)
+    if f == 0.0:
+        return timestamp
+
+    sides = [(timestamp, f, -_ALIGNED_STEP), (timestamp, f, _ALIGNED_STEP)]
+    offset = 0.0
+    while offset < _ALIGNED_LIMIT:
+        offset += _ALIGNED_STEP
+        for idx, (t0, f0, step) in enumerate(sides):
+            t1 = t0 + step
+            f1 = func(t1)
+            # A change through 180 degrees is the opposite bearing
+            if (f0 > 0) != (f1 > 0) and abs(f0 - f1) < 180.0:
+                while abs(t1 - t0) > _ALIGNED_TOLERANCE:
+                    t = (t0 + t1) / 2.0
+                    f = func(t)
+                    if (f > 0) == (f0 > 0):
+                        t0, f0 = t, f
+                    else:
+                        t1 = t
+                return (t0 + t1) / 2.0
+            sides[idx] = (t1, f1, step)
+    return None
+
+
+def _tzinfo(tzinfo: Union[str, datetime.tzinfo]) -> datetime.tzinfo:
+    if isinstance(tzinfo, str):
+        return zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+    return tzinfo
+
+
+def sun_alignments(
+    observer: Observer,
+    bearing: float,
+    start: TimeRange,
+    end: TimeRange,
+    direction: SunDirection = SunDirection.SETTING,
+    elevation: float = 0.0,
+    tolerance: float = 0.5,
+    with_refraction: bool = True,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> List[Alignment]:
+    """Find the times the sun rises or sets through an elevation within a
+    tolerance of a bearing.
+
+    Args:
+        observer:        An observer viewing the sun at a specific, latitude,
+                         longitude and elevation
+        bearing:         Bearing in degrees clockwise from North
+        start:           Start of the range as a datetime, or a date to start at
+                         the beginning of the day in the timezone `tzinfo`
+        end:             End of the range as a datetime, or a date to end at the
+                         end of the day in the timezone `tzinfo`
+        direction:       Whether to match the rising or the setting sun
+        elevation:       Elevation of the centre of the sun in degrees
+        tolerance:       Maximum difference in degrees between the sun's azimuth
+                         and the bearing
+        with_refraction: If True adjust the elevation for atmospheric refraction
+        tzinfo:          Timezone of `start` and `end` when they are dates and of
+                         the times returned
+
+    Returns:
+        A list of the alignments in time order, with one for each day on which
+        the sun is within the tolerance.
+    """
+
+    def position(timestamp: float) -> Tuple[float, float]:
+        """The sun's azimuth and elevation, as :func:`astral.sun.azimuth` and
+        :func:`astral.sun.elevation` calculate them without rounding the time to
+        the second"""
+        jd = timestamp / 86400.0 + _JD_EPOCH
+        declination, eqtime = ephemeris(jd)
+        minutes = (jd - 0.5 - floor(jd - 0.5)) * 1440.0
+        hourangle = radians((minutes + eqtime + 4.0 * longitude) / 4.0 - 180.0)
+        dec = radians(declination)
+        azimuth = degrees(atan2(sin(hourangle), cos(hourangle) * sl - tan(dec) * cl))
+        zenith = 90.0 - degrees(
+            asin(min(sl * sin(dec) + cl * cos(dec) * cos(hourangle), 1.0))
+        )
+        if with_refraction:
+            zenith -= refraction_at_zenith(zenith)
+        return azimuth + 180.0, 90.0 - zenith
+
+    def func(timestamp: float) -> float:
+        return _difference(position(timestamp)[0], bearing)
+
+    tzinfo = _tzinfo(tzinfo)
+    start_ts, end_ts = _range(start, end, tzinfo)
+    sl, cl, cz = _transit_terms(observer, 90.0 - elevation, with_refraction)
+    # cz is the sine of the elevation the sun passes through
+    cos_elevation = sqrt(max(1.0 - cz * cz, 0.0))
+    longitude = observer.longitude
+
+    first_day = floor((start_ts / 86400.0) + _JD_EPOCH - 0.5) - 1
+    last_day = floor((end_ts / 86400.0) + _JD_EPOCH - 0.5) + 1
+    ephemeris = _InterpolatedEphemeris(first_day - 1.5, last_day + 2.5)
+
+    alignments = []
+    for day in range(first_day, last_day + 1):
+        jd0 = day + 0.5
+        noon = _noon_jd(jd0, longitude, ephemeris)
+        jd, _ = _crossing_jd(jd0, noon, (sl, cl, cz), longitude, direction, ephemeris)
+        if jd is None:
+            continue
+
+        timestamp = (jd - _JD_EPOCH) * 86400.0
+        if not start_ts <= timestamp < end_ts:
+            continue
+
+        declination = radians(ephemeris(jd)[0])
+        cos_azimuth = (sin(declination) - sl * cz) / (cl * cos_elevation)
+        azimuth = degrees(acos(min(max(cos_azimuth, -1.0), 1.0)))
+        if direction == SunDirection.SETTING:
+            azimuth = 360.0 - azimuth
+
+        difference = _difference(azimuth, bearing)
+        if abs(difference) <= tolerance:
+            aligned = _aligned(func, timestamp)
+            aligned_at = aligned_elevation = None
+            if aligned is not None:
+                aligned_at = datetime.datetime.fromtimestamp(aligned, tzinfo)
+                aligned_elevation = position(aligned)[1]
+            alignments.append(
+                Alignment(
+                    datetime.datetime.fromtimestamp(timestamp, tzinfo),
+                    azimuth,
+                    difference,
+                    aligned_at,
+                    aligned_elevation,
+                )
+            )
+    return alignments
+
+
+def moon_alignments(
+    observer: Observer,
+    bearing: float,
+    start: TimeRange,
+    end: TimeRange,
+    direction: SunDirection = SunDirection.SETTING,
+    elevation: Optional[float] = None,
+    tolerance: float = 1.0,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> List[Alignment]:
+    """Find the times the moon rises or sets through an elevation within a
+    tolerance of a bearing.
+
+    Args:
+        observer:  An observer viewing the moon at a specific, latitude and
+                   longitude
+        bearing:   Bearing in degrees clockwise from North
+        start:     Start of the range as a datetime, or a date to start at the
+                   beginning of the day in the timezone `tzinfo`
+        end:       End of the range as a datetime, or a date to end at the end of
+                   the day in the timezone `tzinfo`
+        direction: Whether to match the rising or the setting moon
+        elevation: Elevation of the centre of the moon in degrees, corrected for
+                   parallax. The default is the top of the moon on the horizon,
+                   as for :func:`astral.moon.moonrise` and
+                   :func:`astral.moon.moonset`.
+        tolerance: Maximum difference in degrees between the moon's azimuth and
+                   the bearing
+        tzinfo:    Timezone of `start` and `end` when they are dates and of the
+                   times returned
+
+    Returns:
+        A list of the alignments in time order.
+    """
+    tzinfo = _tzinfo(tzinfo)
+    start_ts, end_ts = _range(start, end, tzinfo)
+    ephemeris = _moon_ephemeris(start_ts, end_ts)
+    rising = direction == SunDirection.RISING
+
+    def func(timestamp: float) -> float:
+        return _above_horizon(observer, _jd2000(timestamp), ephemeris, elevation)
+
+    def azimuth_difference(timestamp: float) -> float:
+        return _difference(_azimuth(observer, _jd2000(timestamp), ephemeris), bearing)
+
+    alignments = []
+    for timestamp, rose in _crossings(func, start_ts, end_ts):
+        if rose != rising:
+            continue
+
+        azimuth = _azimuth(observer, _jd2000(timestamp), ephemeris)
+        difference = _difference(azimuth, bearing)
+        if abs(difference) <= tolerance:
+            aligned = _aligned(azimuth_difference, timestamp)
+            aligned_at = aligned_elevation = None
+            if aligned is not None:
+                aligned_at = datetime.datetime.fromtimestamp(aligned, tzinfo)
+                aligned_elevation = moon.elevation(observer, aligned_at)
+            alignments.append(
+                Alignment(
+                    datetime.datetime.fromtimestamp(timestamp, tzinfo),
+                    azimuth,
+                    difference,
+                    aligned_at,
+                    aligned_elevation,
+                )
+            )
+    return alignments
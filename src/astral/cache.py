@@ -0,0 +1,365 @@
+"""Opt-in persistent cache of the sun and moon event calculations.
+
+When enabled, the results of the event functions in :mod:`astral.sun` and
+:mod:`astral.moon` are stored in a SQLite database, so a process which is
+restarted, or another process using the same file, reuses them instead of
+calculating them again e.g. ::
+
+    from astral import cache
+
+    cache.enable("astral-cache.sqlite")
+    astral.sun.sunrise(observer, date)  # Calculated and stored
+    astral.sun.sunrise(observer, date)  # Read from the database
+
+Results are keyed by the function, the observer's latitude, longitude and
+elevation, the date and the other arguments, the models set by
+:func:`astral.sun.set_solar_model` and :func:`astral.moon.set_series_cutoff`, the
+range of the ephemeris installed by :func:`astral.ephemeris.install` and the
+version of astral, so upgrading astral does not return results calculated by
+an older version.
+``ValueError`` exceptions, such as for a sun which never sets, are stored as well.
+Calls which use today's date, because no date is given, are not cached.
+
+As with :mod:`astral.instrumentation`, the functions are wrapped by replacing them
+in their modules when the cache is enabled and restored when it is disabled, so
+functions imported by name before :func:`enable` is called are not cached. The
+two can be enabled and disabled in any order.
+
+The database is opened in write-ahead logging mode so that several processes
+can read it while another writes. Once it holds more than `max_entries` results
+the oldest are removed.
+"""
+
+import datetime
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+import astral
+from astral import Observer
+from astral._wrappers import add_layer, remove_layer
+from astral.ephemeris import installed
+from astral.moon import series_cutoff
+from astral.sun import solar_model
+
+__all__ = ["enable", "disable", "enabled", "clear", "stats"]
+
+# module name, function names
+_CACHED: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "sun",
+        (
+            "noon",
+            "midnight",
+            "dawn",
+            "sunrise",
+            "sunset",
+            "dusk",
+            "time_at_elevation",
+            "daylight",
+            "night",
+            "twilight",
+            "golden_hour",
+            "blue_hour",
+            "rahukaalam",
+            "sun",
+            "sun_range",
+        ),
+    ),
+    ("moon", ("moonrise", "moonset", "moon_range")),
+)
+
+# The functions which return times in the timezone of an aware datetime passed as
+# the date, rather than `tzinfo`
+_DATE_TZINFO = frozenset(
+    (
+        "sun.dawn",
+        "sun.sunrise",
+        "sun.sunset",
+        "sun.dusk",
+        "sun.daylight",
+        "sun.night",
+        "sun.rahukaalam",
+        "sun.sun",
+    )
+)
+
+# The most results stored between checks of the size of the database
+_CHECK_INTERVAL = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_created ON results (created);
+"""
+
+
+class _Uncacheable(Exception):
+    """Raised for arguments which cannot be used in a key"""
+
+
+def _tzinfo(value: Union[str, datetime.tzinfo]) -> datetime.tzinfo:
+    if isinstance(value, str):
+        return zoneinfo.ZoneInfo(value)  # type: ignore
+    return value
+
+
+def _ephemeris_key() -> Optional[Tuple[float, float]]:
+    """The range of the installed ephemeris, whose positions are interpolated"""
+    ephemeris = installed()
+    if ephemeris is None:
+        return None
+    return ephemeris.start, ephemeris.end
+
+
+def _key_value(value: Any) -> Any:
+    """Convert an argument to a value which can be stored as JSON in a key"""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, Observer):
+        return [
+            round(value.latitude, 6),
+            round(value.longitude, 6),
+            repr(value.elevation),
+        ]
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, zoneinfo.ZoneInfo):
+        return f"zone:{value.key}"
+    if isinstance(value, datetime.timezone):
+        return f"offset:{value.utcoffset(None).total_seconds()}"
+    raise _Uncacheable(value)
+
+
+def _encode(value: Any) -> Any:
+    """Convert a result to a value which can be stored as JSON"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime.datetime):
+        delta = value - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        return {"t": delta // datetime.timedelta(microseconds=1)}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {"dict": {key: _encode(item) for key, item in value.items()}}
+    raise _Uncacheable(value)
+
+
+def _decode(value: Any, tzinfo: datetime.tzinfo) -> Any:
+    """Convert a value stored by :func:`_encode` back to a result, with times in
+    the timezone `tzinfo`"""
+    if isinstance(value, list):
+        return [_decode(item, tzinfo) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "t" in value:
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        return (epoch + datetime.timedelta(microseconds=value["t"])).astimezone(
+            tzinfo
+        )
+    if "d" in value:
+        return datetime.date.fromisoformat(value["d"])
+    if "tuple" in value:
+        return tuple(_decode(item, tzinfo) for item in value["tuple"])
+    return {key: _decode(item, tzinfo) for key, item in value["dict"].items()}
+
+
+class _Cache:
+    def __init__(self, path: Union[str, "os.PathLike[str]"], max_entries: int):
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._stored = 0
+        self._interval = max(min(_CHECK_INTERVAL, max_entries // 10), 1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """The connection for the current thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        row = (
+            self._connection()
+            .execute("SELECT value FROM results WHERE key = ?", (key,))
+            .fetchone()
+        )
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+            (key, value, time.time()),
+        )
+        with self._lock:
+            self._stored += 1
+            check = self._stored % self._interval == 0
+        if check:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the oldest results once there are more than `max_entries`,
+        leaving 90% of that"""
+        connection = self._connection()
+        (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count > self.max_entries:
+            keep = int(self.max_entries * 0.9)
+            connection.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY created LIMIT ?)",
+                (count - keep,),
+            )
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM results")
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+_lock = threading.Lock()
+_cache: Optional[_Cache] = None
+
+
+def _wrap(name: str, func: Callable[..., Any], cache: _Cache) -> Callable[..., Any]:
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if "date" in arguments and arguments["date"] is None:
+                raise _Uncacheable(None)
+            key = json.dumps(
+                [
+                    astral.__version__,
+                    name,
+                    series_cutoff(),
+                    solar_model().value,
+                    _ephemeris_key(),
+                    {arg: _key_value(value) for arg, value in arguments.items()},
+                ]
+            )
+            tzinfo = _tzinfo(arguments.get("tzinfo", datetime.timezone.utc))
+            date = arguments.get("date")
+            if name in _DATE_TZINFO and isinstance(date, datetime.datetime):
+                tzinfo = date.tzinfo or tzinfo
+        except (_Uncacheable, TypeError):
+            return func(*args, **kwargs)
+
+        stored = cache.get(key)
+        if stored is not None:
+            value = json.loads(stored)
+            if "error" in value:
+                raise ValueError(value["error"])
+            return _decode(value["result"], tzinfo)
+
+        try:
+            result = func(*args, **kwargs)
+        except ValueError as exc:
+            cache.put(key, json.dumps({"error": str(exc)}))
+            raise
+
+        try:
+            cache.put(key, json.dumps({"result": _encode(result)}))
+        except _Uncacheable:
+            pass
+        return result
+
+    return wrapper
+
+
+def enable(path: Union[str, "os.PathLike[str]"], max_entries: int = 1_000_000) -> None:
+    """Start caching results in a database.
+
+    Args:
+        path:        The database file, which is created if it does not exist
+        max_entries: The number of results to keep
+    """
+    global _cache
+
+    with _lock:
+        if _cache is not None:
+            raise RuntimeError("The cache is already enabled")
+
+        cache = _Cache(path, max_entries)
+        try:
+            add_layer("cache", _CACHED, lambda name, func: _wrap(name, func, cache))
+        except BaseException:
+            cache.close()
+            raise
+        _cache = cache
+
+
+def disable() -> None:
+    """Stop caching results and restore the original functions"""
+    global _cache
+
+    with _lock:
+        remove_layer("cache")
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def enabled() -> bool:
+    """Whether results are being cached"""
+    return _cache is not None
+
+
+def clear() -> None:
+    """Remove all the results from the database"""
+    if _cache is not None:
+        _cache.clear()
+
+
+def stats() -> Dict[str, int]:
+    """The number of ``hits`` and ``misses`` since the cache was enabled and the
+    number of ``entries`` in the database"""
+    if _cache is None:
+        return {"hits": 0, "misses": 0, "entries": 0}
+    return {"hits": _cache.hits, "misses": _cache.misses, "entries": _cache.count()}
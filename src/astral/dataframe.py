@@ -0,0 +1,133 @@
+"""A pandas accessor which adds the sun and moon calculations to data frames.
+
+Importing this module registers an ``astral`` accessor on
+:class:`pandas.DataFrame`. Each method takes the names of the columns to use and
+returns new columns, with the same index as the data frame, calculated for all
+of the rows at once using :mod:`astral.vectorized` e.g. ::
+
+    import astral.dataframe
+
+    positions = df.astral.sun_position(lat="lat", lon="lon", time="ts")
+    df = df.join(positions)
+
+Times with a timezone are converted to UTC and times without one are taken to be
+in UTC. Event times are returned in UTC.
+
+This module requires numpy and pandas, which can be installed with
+``pip install astral[pandas]``.
+"""
+
+from typing import Union
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "astral.dataframe requires numpy and pandas. "
+        "Install them with 'pip install astral[pandas]'"
+    ) from exc
+
+from astral import Depression, vectorized
+
+__all__ = ["AstralAccessor"]
+
+
+def _utc_values(column: "pd.Series") -> np.ndarray:
+    """The values of a column of times as naive UTC ``datetime64`` values"""
+    times = pd.to_datetime(column)
+    if times.dt.tz is not None:
+        times = times.dt.tz_convert("UTC").dt.tz_localize(None)
+    return times.to_numpy(dtype="datetime64[ns]")
+
+
+def _utc_series(values: np.ndarray, index: "pd.Index") -> "pd.Series":
+    return pd.Series(values, index=index).dt.tz_localize("UTC")
+
+
+@pd.api.extensions.register_dataframe_accessor("astral")
+class AstralAccessor:
+    """Sun and moon calculations for the rows of a data frame, available as
+    ``df.astral``"""
+
+    def __init__(self, frame: "pd.DataFrame"):
+        self._frame = frame
+
+    def _floats(self, name: str) -> np.ndarray:
+        return self._frame[name].to_numpy(dtype=float)
+
+    def sun_position(
+        self,
+        lat: str = "latitude",
+        lon: str = "longitude",
+        time: str = "time",
+        with_refraction: bool = True,
+    ) -> "pd.DataFrame":
+        """Calculate the position of the sun for each row.
+
+        Args:
+            lat:             Name of the latitude column
+            lon:             Name of the longitude column
+            time:            Name of the time column
+            with_refraction: Whether to adjust for atmospheric refraction
+
+        Returns:
+            A data frame with ``zenith``, ``azimuth`` and ``elevation`` columns.
+        """
+        zenith, azimuth = vectorized.zenith_and_azimuth(
+            self._floats(lat),
+            self._floats(lon),
+            _utc_values(self._frame[time]),
+            with_refraction,
+        )
+        return pd.DataFrame(
+            {"zenith": zenith, "azimuth": azimuth, "elevation": 90.0 - zenith},
+            index=self._frame.index,
+        )
+
+    def sun_events(
+        self,
+        lat: str = "latitude",
+        lon: str = "longitude",
+        date: str = "date",
+        depression: Union[float, Depression] = Depression.CIVIL,
+    ) -> "pd.DataFrame":
+        """Calculate dawn, sunrise, noon, sunset and dusk for each row.
+
+        Events are calculated for the UTC date, see
+        :func:`astral.vectorized.sun_events`.
+
+        Args:
+            lat:        Name of the latitude column
+            lon:        Name of the longitude column
+            date:       Name of the date column
+            depression: Depression to use to calculate dawn and dusk
+
+        Returns:
+            A data frame with ``dawn``, ``sunrise``, ``noon``, ``sunset`` and
+            ``dusk`` columns of UTC times, which are ``NaT`` for events that do not
+            occur.
+        """
+        dates = _utc_values(self._frame[date]).astype("datetime64[D]")
+        events = vectorized.sun_events(
+            self._floats(lat), self._floats(lon), dates, depression
+        )
+        index = self._frame.index
+        return pd.DataFrame(
+            {name: _utc_series(values, index) for name, values in events.items()},
+            index=index,
+        )
+
+    def moon_phase(self, date: str = "date") -> "pd.Series":
+        """Calculate the phase of the moon for each row.
+
+        Args:
+            date: Name of the date column
+
+        Returns:
+            A series of moon phases, see :func:`astral.moon.phase`.
+        """
+        dates = _utc_values(self._frame[date]).astype("datetime64[D]")
+        return pd.Series(
+            vectorized.moon_phase(dates), index=self._frame.index, name="moon_phase"
+        )
@@ -0,0 +1,416 @@
+"""Precalculated sun and moon positions shared between processes.
+
+Calculating the moon's position sums over a hundred terms and is most of the
+time taken by :func:`~astral.moon.moonrise` and :func:`~astral.moon.moonset`.
+When a pool of worker processes calculates events for many observers over the
+same dates, each worker would calculate the same positions. Instead the parent
+process can calculate them once for a range of dates and the workers attach the
+result without copying it e.g. ::
+
+    from multiprocessing import Pool
+
+    from astral import ephemeris
+
+    def init(name):
+        ephemeris.install(ephemeris.attach_ephemeris(name))
+
+    shared = ephemeris.share_ephemeris(start, end)
+    try:
+        with Pool(initializer=init, initargs=(shared.name,)) as pool:
+            results = pool.map(calculate, observers)
+    finally:
+        shared.close()
+        shared.unlink()
+
+:func:`write_ephemeris` writes the same data to a file which
+:func:`open_ephemeris` memory maps, so it can be reused by unrelated processes
+or between runs.
+
+While an ephemeris is installed the sun's declination and equation of time used
+for dawn, sunrise, sunset, dusk and :func:`~astral.sun.time_at_elevation`, and the
+moon's position returned by :func:`~astral.moon.moon_position`, are interpolated
+from it for times within its range. Times outside the range are calculated as
+usual. The interpolated values differ from the calculated ones by much less than
+the accuracy of the formulae, and event times by less than a second.
+
+The data is a header followed by arrays of doubles: the sun's declination and
+equation of time every 6 hours and the moon's right ascension, declination and
+distance every 3 hours, from the day before the first date to the day after the
+last.
+
+The positions are calculated with the solar model and moon series cutoff
+selected by :func:`~astral.sun.set_solar_model` and
+:func:`~astral.moon.set_series_cutoff` when the ephemeris is built, which are
+stored with it. An installed ephemeris is not used while a different model or
+cutoff is selected, or for a different cutoff passed to
+:func:`~astral.moon.moon_position`.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import sys
+from array import array
+from math import ceil, pi
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Union
+
+from astral import AstralBodyPosition, moon, sun
+from astral.julian import julianday, julianday_to_juliancentury
+from astral.moon import _moon_position, interpolate, moon_mean_longitude
+from astral.sun import SolarModel, _solar_terms, solar_model
+
+__all__ = [
+    "Ephemeris",
+    "write_ephemeris",
+    "open_ephemeris",
+    "share_ephemeris",
+    "attach_ephemeris",
+    "install",
+    "uninstall",
+    "installed",
+]
+
+_MAGIC = b"ASTRALEP"
+_VERSION = 2
+# magic, version, little endian, sun count, moon count, start julian day,
+# sun step, moon step, solar model, moon series cutoff
+_HEADER = struct.Struct("<8sHHIIddd8sd")
+_SUN_SECTIONS = ("sun_declination", "sun_eq_of_time")
+_MOON_SECTIONS = ("moon_right_ascension", "moon_declination", "moon_distance")
+
+# Days between the tabulated positions
+_SUN_STEP = 0.25
+_MOON_STEP = 0.125
+
+# Julian day of Jan 1.5, 2000
+_JD2000 = 2451545.0
+
+
+def _layout(sun_count: int, moon_count: int) -> Tuple[Dict[str, int], int]:
+    """The offset of each section and the total size of the data"""
+    offsets = {}
+    offset = _HEADER.size + -_HEADER.size % 8
+    for name in _SUN_SECTIONS:
+        offsets[name] = offset
+        offset += sun_count * 8
+    for name in _MOON_SECTIONS:
+        offsets[name] = offset
+        offset += moon_count * 8
+    return offsets, offset
+
+
+def _build(start: datetime.date, end: datetime.date) -> bytes:
+    """Calculate the positions for a range of dates"""
+    if end < start:
+        raise ValueError("The end date is before the start date")
+
+    # A day either side allows for timezones and the searches around a date
+    start_jd = julianday(start) - 1.0
+    end_jd = julianday(end) + 2.0
+    sun_count = int(ceil((end_jd - start_jd) / _SUN_STEP)) + 1
+    moon_count = int(ceil((end_jd - start_jd) / _MOON_STEP)) + 1
+
+    columns = {name: array("d") for name in _SUN_SECTIONS + _MOON_SECTIONS}
+    for idx in range(sun_count):
+        jc = julianday_to_juliancentury(start_jd + idx * _SUN_STEP)
+        declination, eqtime = _solar_terms(jc)
+        columns["sun_declination"].append(declination)
+        columns["sun_eq_of_time"].append(eqtime)
+
+    cutoff = moon.series_cutoff()
+    right_ascension = columns["moon_right_ascension"]
+    for idx in range(moon_count):
+        position = _moon_position(start_jd - _JD2000 + idx * _MOON_STEP, cutoff)
+        value = position.right_ascension
+        # Store a continuous right ascension so it can be interpolated
+        while right_ascension and value < right_ascension[-1]:
+            value += 2 * pi
+        right_ascension.append(value)
+        columns["moon_declination"].append(position.declination)
+        columns["moon_distance"].append(position.distance)
+
+    offsets, size = _layout(sun_count, moon_count)
+    data = bytearray(size)
+    _HEADER.pack_into(
+        data,
+        0,
+        _MAGIC,
+        _VERSION,
+        sys.byteorder == "little",
+        sun_count,
+        moon_count,
+        start_jd,
+        _SUN_STEP,
+        _MOON_STEP,
+        solar_model().value.encode(),
+        cutoff,
+    )
+    for name, column in columns.items():
+        column_bytes = column.tobytes()
+        data[offsets[name] : offsets[name] + len(column_bytes)] = column_bytes
+    return bytes(data)
+
+
+class Ephemeris:
+    """Sun and moon positions read from a file written by :func:`write_ephemeris`
+    or shared memory created by :func:`share_ephemeris`.
+
+    Use :func:`open_ephemeris`, :func:`share_ephemeris` or
+    :func:`attach_ephemeris` to create one. It can be used as a context manager
+    to close it when finished with. ``solar_model`` and ``series_cutoff`` are
+    the solar model and moon series cutoff the positions were calculated with.
+    """
+
+    solar_model: SolarModel
+    series_cutoff: float
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self._views: List[memoryview] = []
+        self._sections: Dict[str, Union[memoryview, "array[float]"]] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+        view = self._view(self._view(memoryview(buffer)).toreadonly())
+        try:
+            (
+                magic,
+                version,
+                little_endian,
+                self._sun_count,
+                self._moon_count,
+                self.start,
+                self._sun_step,
+                self._moon_step,
+                model,
+                self.series_cutoff,
+            ) = _HEADER.unpack_from(view, 0)
+        except struct.error:
+            magic = b""
+
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError("Not an astral ephemeris")
+        try:
+            self.solar_model = SolarModel(model.rstrip(b"\0").decode("ascii"))
+        except (UnicodeDecodeError, ValueError):
+            self.close()
+            raise ValueError("Unknown solar model") from None
+
+        offsets, size = _layout(self._sun_count, self._moon_count)
+        if len(view) < size:
+            self.close()
+            raise ValueError("The ephemeris is truncated")
+
+        native = bool(little_endian) == (sys.byteorder == "little")
+        for name, offset in offsets.items():
+            count = self._sun_count if name in _SUN_SECTIONS else self._moon_count
+            section = self._view(view[offset : offset + count * 8])
+            if native:
+                self._sections[name] = self._view(section.cast("d"))
+            else:
+                swapped = array("d", section.tobytes())
+                swapped.byteswap()
+                self._sections[name] = swapped
+
+        self._sun_declination = self._sections["sun_declination"]
+        self._sun_eq_of_time = self._sections["sun_eq_of_time"]
+        self._moon_right_ascension = self._sections["moon_right_ascension"]
+        self._moon_declination = self._sections["moon_declination"]
+        self._moon_distance = self._sections["moon_distance"]
+
+    def _view(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+
+    @property
+    def name(self) -> Optional[str]:
+        """The name of the shared memory holding the ephemeris, which is passed
+        to :func:`attach_ephemeris`, or None if it is not in shared memory"""
+        return None if self._shm is None else self._shm.name
+
+    @property
+    def end(self) -> float:
+        """The julian day of the last position"""
+        return self.start + (self._moon_count - 1) * self._moon_step
+
+    def sun(self, jd: float) -> Optional[Tuple[float, float]]:
+        """The sun's declination in degrees and the equation of time in minutes
+        at a julian day, or None if the day is outside the ephemeris"""
+        position = (jd - self.start) / self._sun_step
+        idx = int(position + 0.5)
+        if not 1 <= idx < self._sun_count - 1:
+            return None
+        p = (position - idx + 1) / 2.0
+        dec = self._sun_declination
+        eqt = self._sun_eq_of_time
+        return (
+            interpolate(dec[idx - 1], dec[idx], dec[idx + 1], p),
+            interpolate(eqt[idx - 1], eqt[idx], eqt[idx + 1], p),
+        )
+
+    def moon(self, jd2000: float) -> Optional[AstralBodyPosition]:
+        """The moon's position at a number of days since Jan 1.5, 2000 as
+        :func:`~astral.moon.moon_position` calculates it, or None if the day is
+        outside the ephemeris"""
+        position = (jd2000 + _JD2000 - self.start) / self._moon_step
+        idx = int(position + 0.5)
+        if not 1 <= idx < self._moon_count - 1:
+            return None
+        p = (position - idx + 1) / 2.0
+        ra = self._moon_right_ascension
+        dec = self._moon_declination
+        dist = self._moon_distance
+        right_ascension = interpolate(ra[idx - 1], ra[idx], ra[idx + 1], p)
+        # moon_position returns a right ascension within a quarter of a turn of
+        # the moon's mean longitude
+        mean_longitude = moon_mean_longitude(jd2000) * 2 * pi
+        turns = round((right_ascension - mean_longitude) / (2 * pi))
+        return AstralBodyPosition(
+            right_ascension - turns * 2 * pi,
+            interpolate(dec[idx - 1], dec[idx], dec[idx + 1], p),
+            interpolate(dist[idx - 1], dist[idx], dist[idx + 1], p),
+        )
+
+    def close(self) -> None:
+        """Release the file or shared memory, uninstalling the ephemeris if it is
+        installed"""
+        if installed() is self:
+            uninstall()
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._sections = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the shared memory. This should be called once, by the process
+        which created it with :func:`share_ephemeris`, when all the processes
+        have finished with it."""
+        if self._shm is None:
+            raise ValueError("The ephemeris is not in shared memory")
+        self._shm.unlink()
+
+    def __enter__(self) -> "Ephemeris":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_ephemeris(
+    path: Union[str, "os.PathLike[str]"], start: datetime.date, end: datetime.date
+) -> None:
+    """Calculate the sun and moon positions for a range of dates and write them to
+    a file which can be opened with :func:`open_ephemeris`.
+
+    Args:
+        path:  The file to write to
+        start: The first date
+        end:   The last date
+    """
+    data = _build(start, end)
+    with open(path, "wb") as fp:
+        fp.write(data)
+
+
+def open_ephemeris(path: Union[str, "os.PathLike[str]"]) -> Ephemeris:
+    """Open an ephemeris written by :func:`write_ephemeris`.
+
+    The file is memory mapped read only, so the processes which open it share
+    the same pages.
+
+    Raises:
+        ValueError: if the file is not an ephemeris
+    """
+    with open(path, "rb") as fp:
+        mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        ephemeris = Ephemeris(mapped)
+    except ValueError:
+        mapped.close()
+        raise ValueError(f"{path} is not an astral ephemeris") from None
+    ephemeris._mmap = mapped
+    return ephemeris
+
+
+def share_ephemeris(
+    start: datetime.date, end: datetime.date, name: Optional[str] = None
+) -> Ephemeris:
+    """Calculate the sun and moon positions for a range of dates and store them
+    in shared memory which other processes can attach with
+    :func:`attach_ephemeris`.
+
+    The shared memory remains until :meth:`Ephemeris.unlink` is called.
+
+    Args:
+        start: The first date
+        end:   The last date
+        name:  The name of the shared memory. Default is a unique name.
+
+    Returns:
+        The ephemeris, whose :attr:`~Ephemeris.name` is passed to the other
+        processes.
+    """
+    data = _build(start, end)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    shm.buf[: len(data)] = data
+    ephemeris = Ephemeris(shm.buf)
+    ephemeris._shm = shm
+    return ephemeris
+
+
+def attach_ephemeris(name: str) -> Ephemeris:
+    """Attach an ephemeris created in shared memory by :func:`share_ephemeris`.
+
+    The memory is only read, and closing the ephemeris leaves it for the other
+    processes. Before Python 3.13 an attached segment is registered with the
+    process's resource tracker, which the worker processes of a
+    :mod:`multiprocessing` pool share with their parent, so unrelated processes
+    should use a file written by :func:`write_ephemeris` instead.
+
+    Raises:
+        ValueError: if the shared memory is not an ephemeris
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    try:
+        ephemeris = Ephemeris(shm.buf)
+    except ValueError:
+        shm.close()
+        raise ValueError(f"{name} is not an astral ephemeris") from None
+    ephemeris._shm = shm
+    return ephemeris
+
+
+_installed: Optional[Ephemeris] = None
+
+
+def install(ephemeris: Ephemeris) -> None:
+    """Use an ephemeris for the sun and moon positions in this process"""
+    global _installed
+
+    _installed = ephemeris
+    sun._shared_ephemeris = ephemeris
+    moon._shared_ephemeris = ephemeris
+
+
+def uninstall() -> None:
+    """Calculate the sun and moon positions again"""
+    global _installed
+
+    _installed = None
+    sun._shared_ephemeris = None
+    moon._shared_ephemeris = None
+
+
+def installed() -> Optional[Ephemeris]:
+    """The installed ephemeris, or None"""
+    return _installed
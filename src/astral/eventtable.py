@@ -0,0 +1,317 @@
+"""Precalculated tables of the sun's daily events for a fixed set of sites.
+
+When the same events are needed repeatedly for the same sites, a table of the
+times for a whole year can be calculated once with :func:`build_table` and then
+opened with :func:`open_table` e.g. ::
+
+    from astral.eventtable import build_table, open_table
+
+    build_table(sites, 2025, "events-2025.bin")
+
+    with open_table("events-2025.bin") as table:
+        table.time(site_index, day_of_year, "sunrise")
+
+The file is memory mapped so opening it takes a constant time, and each lookup
+reads a single value from it.
+
+Sites are either :class:`~astral.Observer` objects, whose days are UTC days, or
+:class:`~astral.LocationInfo` objects whose days are local to their time zone.
+Times are stored to the second in UTC.
+
+The table's metadata records the version of astral, the depression and the solar
+model used to build it so that tables built with different settings can be detected with
+:meth:`EventTable.is_current`.
+"""
+
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from math import floor
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import astral
+from astral import Depression, LocationInfo, Observer
+
+__all__ = ["EVENTS", "EventTable", "build_table", "open_table"]
+
+EVENTS = ("dawn", "sunrise", "noon", "sunset", "dusk")
+
+# File layout
+#
+# * A header
+# * The event times as 32 bit signed seconds from the start of the year in UTC,
+#   ordered by site, then day of the year, then event
+# * The metadata as a JSON object
+
+_MAGIC = b"ASTRALEV"
+_VERSION = 1
+# magic, version, little endian, year, days, events, sites, data offset,
+# metadata offset, metadata length
+_HEADER = struct.Struct("<8sHHHHHIQQQ")
+# Stored for events which do not occur on a day
+_MISSING = -(2**31)
+
+
+def _days_in_year(year: int) -> int:
+    return (datetime.date(year + 1, 1, 1) - datetime.date(year, 1, 1)).days
+
+
+def build_table(
+    sites: Iterable[Union[Observer, LocationInfo]],
+    year: int,
+    path: Union[str, "os.PathLike[str]"],
+    depression: Union[float, Depression] = Depression.CIVIL,
+) -> int:
+    """Calculate the daily events for each site for a year and write them to a
+    file which can be opened with :func:`open_table`.
+
+    Args:
+        sites:      The sites to calculate for. The index of each site in this
+                    sequence is used to look up its events.
+        year:       The year to calculate for
+        path:       The file to write to
+        depression: Depression to use to calculate dawn and dusk.
+
+    Returns:
+        The number of sites written.
+    """
+    import astral.sun
+
+    if isinstance(depression, Depression):
+        depression = depression.value
+    depression = float(depression)
+
+    start = datetime.date(year, 1, 1)
+    end = datetime.date(year, 12, 31)
+    days = _days_in_year(year)
+    epoch = datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc)
+    data_offset = _HEADER.size + (-_HEADER.size % 8)
+
+    count = 0
+    with open(path, "wb") as fp:
+        fp.write(b"\0" * data_offset)
+        for site in sites:
+            if isinstance(site, LocationInfo):
+                observer = site.observer
+                tzinfo: datetime.tzinfo = site.tzinfo
+            else:
+                observer = site
+                tzinfo = datetime.timezone.utc
+
+            result = astral.sun.sun_range(observer, start, end, depression, tzinfo)
+            row = array("i", [_MISSING] * (days * len(EVENTS)))
+            for event_index, event in enumerate(EVENTS):
+                for day, value in enumerate(result[event]):
+                    if value is not None:
+                        seconds = floor((value - epoch).total_seconds())
+                        row[day * len(EVENTS) + event_index] = seconds
+            if sys.byteorder != "little":
+                row.byteswap()
+            row.tofile(fp)
+            count += 1
+
+        metadata = json.dumps(
+            {
+                "astral_version": astral.__version__,
+                "year": year,
+                "depression": depression,
+                "solar_model": astral.sun.solar_model().value,
+                "events": list(EVENTS),
+                "sites": count,
+                "created": datetime.datetime.now(
+                    datetime.timezone.utc
+                ).isoformat(),
+            }
+        ).encode("utf-8")
+        metadata_offset = fp.tell()
+        fp.write(metadata)
+
+        fp.seek(0)
+        fp.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                True,
+                year,
+                days,
+                len(EVENTS),
+                count,
+                data_offset,
+                metadata_offset,
+                len(metadata),
+            )
+        )
+    return count
+
+
+class EventTable:
+    """A table of daily events memory mapped from a file written by
+    :func:`build_table`."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        with open(path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._views: List[memoryview] = []
+        view = self._view(memoryview(self._mmap))
+        try:
+            (
+                magic,
+                version,
+                little_endian,
+                self._year,
+                self._days,
+                self._event_count,
+                self._site_count,
+                data_offset,
+                metadata_offset,
+                metadata_length,
+            ) = _HEADER.unpack_from(view, 0)
+        except struct.error:
+            magic = b""
+
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an astral event table")
+
+        metadata = view[metadata_offset : metadata_offset + metadata_length]
+        self._metadata: Dict[str, Any] = json.loads(bytes(metadata))
+        self._events = {
+            name: idx for idx, name in enumerate(self._metadata["events"])
+        }
+        self._epoch = datetime.datetime(
+            self._year, 1, 1, tzinfo=datetime.timezone.utc
+        )
+
+        data = self._view(view[data_offset:metadata_offset])
+        self._data: Union[memoryview, "array[int]"]
+        if bool(little_endian) == (sys.byteorder == "little"):
+            self._data = self._view(data.cast("i"))
+        else:
+            self._data = array("i", data.tobytes())
+            self._data.byteswap()
+
+    def _view(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        """Release the memory mapped file"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "EventTable":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._site_count
+
+    @property
+    def year(self) -> int:
+        """The year the table was calculated for"""
+        return self._year
+
+    @property
+    def depression(self) -> float:
+        """The depression used to calculate dawn and dusk"""
+        return self._metadata["depression"]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Information about how the table was built, including the
+        ``astral_version``, ``year``, ``depression``, ``solar_model`` and
+        ``events``"""
+        return dict(self._metadata)
+
+    def is_current(self, depression: Union[float, Depression, None] = None) -> bool:
+        """Whether the table was built by this version of astral with the
+        selected solar model and, if given, with the same depression."""
+        if self._metadata["astral_version"] != astral.__version__:
+            return False
+        if self._metadata.get("solar_model", "noaa") != astral.sun.solar_model().value:
+            return False
+        if isinstance(depression, Depression):
+            depression = depression.value
+        return depression is None or float(depression) == self.depression
+
+    def _index(self, site: int, day: int) -> int:
+        if not 0 <= site < self._site_count:
+            raise IndexError(f"Site index {site} out of range")
+        if not 1 <= day <= self._days:
+            raise IndexError(f"Day of the year {day} out of range")
+        return (site * self._days + day - 1) * self._event_count
+
+    def _time(self, value: int, tzinfo: datetime.tzinfo) -> Optional[datetime.datetime]:
+        if value == _MISSING:
+            return None
+        return (self._epoch + datetime.timedelta(seconds=value)).astimezone(tzinfo)
+
+    def time(
+        self,
+        site: int,
+        day: int,
+        event: str,
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+    ) -> Optional[datetime.datetime]:
+        """Look up the time of an event.
+
+        Args:
+            site:   Index of the site in the sequence passed to :func:`build_table`
+            day:    Day of the year, starting at 1 for the 1st January
+            event:  One of ``dawn``, ``sunrise``, ``noon``, ``sunset`` or ``dusk``
+            tzinfo: Timezone to return the time in. Default is UTC.
+
+        Returns:
+            The time of the event or ``None`` if it does not occur on the day.
+        """
+        try:
+            offset = self._events[event]
+        except KeyError:
+            raise ValueError(f"Unknown event {event!r}") from None
+        return self._time(self._data[self._index(site, day) + offset], tzinfo)
+
+    def day(
+        self,
+        site: int,
+        day: Union[int, datetime.date],
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+    ) -> Dict[str, Optional[datetime.datetime]]:
+        """Look up all the events for a site on a day.
+
+        Args:
+            site:   Index of the site in the sequence passed to :func:`build_table`
+            day:    Day of the year, starting at 1 for the 1st January, or a date
+                    in the table's year
+            tzinfo: Timezone to return the times in. Default is UTC.
+
+        Returns:
+            A dictionary with the events as keys and their times as values.
+        """
+        if isinstance(day, datetime.date):
+            if day.year != self._year:
+                raise ValueError(f"{day} is not in {self._year}")
+            day = day.timetuple().tm_yday
+
+        index = self._index(site, day)
+        return {
+            event: self._time(self._data[index + offset], tzinfo)
+            for event, offset in self._events.items()
+        }
+
+
+def open_table(path: Union[str, "os.PathLike[str]"]) -> EventTable:
+    """Open an event table written by :func:`build_table`.
+
+    Raises:
+        ValueError: if the file is not an event table
+    """
+    return EventTable(path)
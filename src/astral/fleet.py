@@ -0,0 +1,253 @@
+"""Classify large numbers of observers as in daylight, twilight or night.
+
+A :class:`FleetClassifier` holds the latitude and longitude of each device in a
+fleet and the times of its dawn, sunrise, sunset and dusk for the current day, so
+the state of every device at a time is found with a few array comparisons e.g. ::
+
+    from astral.fleet import FleetClassifier, LightState
+
+    fleet = FleetClassifier(latitudes, longitudes)
+    states = fleet.classify()
+    in_daylight = states == LightState.DAY
+
+Each device's day runs from one local mean solar midnight, which depends only on
+its longitude, to the next. The times of its events are calculated when the
+classifier is first used at a time in the day, so when the fleet is classified
+every minute only the devices which have passed their solar midnight since the
+last call are recalculated.
+
+The arrays held are the sine and cosine of the latitudes, the longitudes, the
+day of each device and the four event times, so memory use is a few floats per
+device.
+
+This module requires numpy, which can be installed with ``pip install
+astral[pandas]``.
+"""
+
+import datetime
+from enum import IntEnum
+from typing import Callable, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "astral.fleet requires numpy. Install it with 'pip install astral[pandas]'"
+    ) from exc
+
+from astral import Depression
+from astral.vectorized import (
+    SUN_APPARENT_RADIUS,
+    ArrayLike,
+    _juliancentury,
+    eq_of_time,
+    refraction_at_zenith,
+    sun_declination,
+)
+
+__all__ = ["LightState", "FleetClassifier"]
+
+# Julian day of the Unix epoch
+_JD_EPOCH = 2440587.5
+
+
+class LightState(IntEnum):
+    """Whether the sun is up, in twilight or down for an observer"""
+
+    NIGHT = 0
+    TWILIGHT = 1
+    DAY = 2
+
+
+TimeLike = Union[None, float, datetime.datetime, "np.datetime64"]
+
+
+def _timestamp(when: TimeLike) -> float:
+    """Convert a time to a POSIX timestamp. Naive datetimes are in UTC."""
+    if when is None:
+        return datetime.datetime.now(datetime.timezone.utc).timestamp()
+    if isinstance(when, datetime.datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        return when.timestamp()
+    if isinstance(when, np.datetime64):
+        return float(when.astype("datetime64[us]").astype(np.int64)) / 1e6
+    return float(when)
+
+
+def _ephemeris(
+    first_day: int, last_day: int
+) -> Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """Calculate the sun's declination and the equation of time every hour
+    around a range of days since the Unix epoch, returning a function which
+    interpolates them for julian days.
+
+    Both change slowly so this is much faster than calculating them for each
+    device when there are more devices than hours.
+    """
+    jd = np.arange(first_day - 1.0, last_day + 2.0 + 1 / 48, 1 / 24) + _JD_EPOCH
+    jc = _juliancentury(jd)
+    declination = np.radians(sun_declination(jc))
+    eqtime = eq_of_time(jc)
+
+    def interpolate(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.interp(values, jd, declination), np.interp(values, jd, eqtime)
+
+    return interpolate
+
+
+class FleetClassifier:
+    """The daylight state of a fleet of devices.
+
+    Args:
+        latitudes:  Latitudes of the devices in degrees
+        longitudes: Longitudes of the devices in degrees
+        depression: Depression of the sun below the horizon at which twilight
+                    ends
+    """
+
+    def __init__(
+        self,
+        latitudes: ArrayLike,
+        longitudes: ArrayLike,
+        depression: Union[float, Depression] = Depression.CIVIL,
+    ):
+        if isinstance(depression, Depression):
+            depression = depression.value
+
+        latitude, longitude = np.broadcast_arrays(
+            np.asarray(latitudes, dtype=float), np.asarray(longitudes, dtype=float)
+        )
+        latitude = np.radians(np.clip(latitude.ravel(), -89.8, 89.8))
+        self._sl = np.sin(latitude)
+        self._cl = np.cos(latitude)
+        self._longitude = np.array(longitude.ravel(), dtype=float)
+
+        horizon = 90.0 + SUN_APPARENT_RADIUS
+        twilight = 90.0 + float(depression)
+        self._cz_horizon = float(
+            np.cos(np.radians(horizon + refraction_at_zenith(horizon)))
+        )
+        self._cz_twilight = float(
+            np.cos(np.radians(twilight + refraction_at_zenith(twilight)))
+        )
+
+        count = len(self._longitude)
+        # Days since the Unix epoch of the solar day the events were calculated
+        # for. The minimum value means not calculated yet.
+        self._day = np.full(count, np.iinfo(np.int32).min, dtype=np.int32)
+        self._dawn = np.zeros(count)
+        self._sunrise = np.zeros(count)
+        self._sunset = np.zeros(count)
+        self._dusk = np.zeros(count)
+        self.recalculated = 0
+
+    def __len__(self) -> int:
+        return len(self._longitude)
+
+    def _transit(
+        self,
+        idx: np.ndarray,
+        days: np.ndarray,
+        cz: float,
+        rising: bool,
+        ephemeris: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    ) -> np.ndarray:
+        """Calculate the timestamps at which the sun transits a zenith on the
+        solar days of the devices at `idx`. Devices for which the sun is always
+        above the zenith get infinite times before rising and after setting, and
+        the reverse for always below, so comparisons give the right state."""
+        sl = self._sl[idx]
+        cl = self._cl[idx]
+        longitude = self._longitude[idx]
+        jd0 = days + _JD_EPOCH
+        sign = -1.0 if rising else 1.0
+
+        jd = jd0 + 0.5 - longitude / 360.0
+        for _ in range(2):
+            declination, eqtime = ephemeris(jd)
+            h = (cz - sl * np.sin(declination)) / (cl * np.cos(declination))
+            hourangle = np.degrees(np.arccos(np.clip(h, -1.0, 1.0)))
+            minutes = 720.0 - 4.0 * (longitude - sign * hourangle) - eqtime
+            jd = jd0 + minutes / 1440.0
+
+        timestamps = (jd - _JD_EPOCH) * 86400.0
+        always_above = sign * np.inf
+        timestamps = np.where(h < -1.0, always_above, timestamps)
+        return np.where(h > 1.0, -always_above, timestamps)
+
+    def _update(self, timestamp: float) -> None:
+        """Calculate the events of the devices whose solar day has changed"""
+        days = np.floor(timestamp / 86400.0 + self._longitude / 360.0)
+        days = days.astype(np.int32)
+        idx = np.flatnonzero(days != self._day)
+        if len(idx) == 0:
+            return
+
+        days = days[idx]
+        ephemeris = _ephemeris(int(days.min()), int(days.max()))
+        twilight = self._cz_twilight
+        horizon = self._cz_horizon
+        self._dawn[idx] = self._transit(idx, days, twilight, True, ephemeris)
+        self._sunrise[idx] = self._transit(idx, days, horizon, True, ephemeris)
+        self._sunset[idx] = self._transit(idx, days, horizon, False, ephemeris)
+        self._dusk[idx] = self._transit(idx, days, twilight, False, ephemeris)
+        self._day[idx] = days
+        self.recalculated += len(idx)
+
+    def classify(self, when: TimeLike = None) -> np.ndarray:
+        """Find the state of every device at a time.
+
+        Args:
+            when: The time as a datetime (naive datetimes are in UTC), a numpy
+                  ``datetime64`` in UTC or a POSIX timestamp. Default is the
+                  current time.
+
+        Returns:
+            An array of :class:`LightState` values as ``int8``.
+        """
+        timestamp = _timestamp(when)
+        self._update(timestamp)
+        twilight = (self._dawn <= timestamp) & (timestamp < self._dusk)
+        day = (self._sunrise <= timestamp) & (timestamp < self._sunset)
+        return twilight.astype(np.int8) + day.astype(np.int8)
+
+    def boundaries(
+        self, when: TimeLike = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The times of dawn, sunrise, sunset and dusk on each device's solar day
+        at a time.
+
+        Returns:
+            Arrays of POSIX timestamps of dawn, sunrise, sunset and dusk. The
+            times are ``-inf`` and ``inf`` when the sun is always above, and
+            ``inf`` and ``-inf`` when it is always below, the elevation of the
+            event.
+        """
+        self._update(_timestamp(when))
+        return self._dawn, self._sunrise, self._sunset, self._dusk
+
+    def update_positions(
+        self,
+        indices: ArrayLike,
+        latitudes: ArrayLike,
+        longitudes: ArrayLike,
+        when: TimeLike = None,
+    ) -> None:
+        """Move some of the devices, recalculating their events.
+
+        Args:
+            indices:    Indices of the devices which have moved
+            latitudes:  Their new latitudes
+            longitudes: Their new longitudes
+            when:       The time to calculate the events for. Default is the
+                        current time.
+        """
+        idx = np.asarray(indices, dtype=np.intp)
+        latitude = np.asarray(latitudes, dtype=float)
+        latitude = np.radians(np.clip(latitude, -89.8, 89.8))
+        self._sl[idx] = np.sin(latitude)
+        self._cl[idx] = np.cos(latitude)
+        self._longitude[idx] = longitudes
+        self._day[idx] = np.iinfo(np.int32).min
+        self._update(_timestamp(when))
@@ -12,13 +12,45 @@ generator ::
     from astral.geocoder import all_locations
     for location in all_locations:
         print(location)
+
+Large databases can be written to a compact binary file with
+:func:`~astral.geocoder.write_database` and opened again, without parsing, using
+:func:`~astral.geocoder.open_database` ::
+
+    from astral.geocoder import open_database, write_database
+    write_database(db, "locations.db")
+    with open_database("locations.db") as db:
+        l = lookup("London", db)
 """
 
-from typing import Dict, Generator, List, Optional, Tuple, Union
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import (
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from astral import LocationInfo, dms_to_float
 
-__all__ = ["lookup", "database", "add_locations", "all_locations"]
+__all__ = [
+    "lookup",
+    "database",
+    "add_locations",
+    "all_locations",
+    "write_database",
+    "open_database",
+    "BinaryLocationDatabase",
+]
 
 
 # region Location Info
@@ -526,7 +558,7 @@ def add_locations(
         _add_locations_from_list(locations, db)
 
 
-def group(region: str, db: LocationDatabase) -> GroupInfo:
+def group(region: str, db: Mapping[GroupName, GroupInfo]) -> GroupInfo:
     """Access to each timezone group. For example London is in timezone
     group Europe.
 
@@ -538,6 +570,9 @@ def group(region: str, db: LocationDatabase) -> GroupInfo:
     Raises:
         KeyError: if the location is not found
     """
+    if isinstance(db, BinaryLocationDatabase):
+        return db.group(region)
+
     key = _sanitize_key(region)
     for name, value in db.items():
         if name == key:
@@ -591,7 +626,9 @@ def lookup_in_group(
     raise KeyError(f"Unrecognised location name - {key}")
 
 
-def lookup(name: str, db: LocationDatabase) -> Union[GroupInfo, LocationInfo]:
+def lookup(
+    name: str, db: Mapping[GroupName, GroupInfo]
+) -> Union[GroupInfo, LocationInfo]:
     """Look up a name in a database.
 
     If a group with the name specified is a group name then that will
@@ -605,6 +642,8 @@ def lookup(name: str, db: LocationDatabase) -> Union[GroupInfo, LocationInfo]:
     Raises:
         KeyError: if the name is not found
     """
+    if isinstance(db, BinaryLocationDatabase):
+        return db.lookup(name)
 
     key = _sanitize_key(name)
     for group_key, group in db.items():
@@ -619,11 +658,314 @@ def lookup(name: str, db: LocationDatabase) -> Union[GroupInfo, LocationInfo]:
     raise KeyError(f"Unrecognised name - {name}")
 
 
-def all_locations(db: LocationDatabase) -> Generator[LocationInfo, None, None]:
+def all_locations(
+    db: Mapping[GroupName, GroupInfo]
+) -> Generator[LocationInfo, None, None]:
     """A generator that returns all the :class:`~astral.LocationInfo`\\s
     contained in the database
     """
+    if isinstance(db, BinaryLocationDatabase):
+        yield from db.locations()
+        return
+
     for group_info in db.values():
         for location_list in group_info.values():
             for location in location_list:
                 yield location
+
+
+# region Binary database
+# The binary format stores each column of the database as a contiguous array so
+# that it can be memory mapped and used without parsing.
+#
+# * A header followed by a table of (offset, length) pairs, one per section
+# * An interned string table holding all names, regions, timezones and keys
+# * The location columns (latitude, longitude, name, region, timezone)
+# * The groups and the location keys within each group, in database order
+# * Indexes of the groups and keys sorted by name for binary searching
+
+_BINARY_MAGIC = b"ASTRALDB"
+_BINARY_VERSION = 1
+# magic, version, little endian, strings, locations, groups, entries
+_BINARY_HEADER = struct.Struct("<8sHHIIII")
+_BINARY_SECTIONS = (
+    ("string_offsets", "I"),
+    ("string_data", "B"),
+    ("latitude", "d"),
+    ("longitude", "d"),
+    ("name", "I"),
+    ("region", "I"),
+    ("timezone", "I"),
+    ("group_key", "I"),
+    ("group_first", "I"),
+    ("group_order", "I"),
+    ("entry_key", "I"),
+    ("entry_first", "I"),
+    ("entry_order", "I"),
+)
+_BINARY_SECTION_TABLE = struct.Struct("<" + "QQ" * len(_BINARY_SECTIONS))
+
+
+def write_database(
+    db: Mapping[GroupName, GroupInfo], path: Union[str, "os.PathLike[str]"]
+) -> None:
+    """Write a location database to a file in a compact binary format which can
+    be opened with :func:`open_database`.
+
+    Args:
+        db:   The location database to write
+        path: The file to write to
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    columns = {name: array(typecode) for name, typecode in _BINARY_SECTIONS}
+    for group_key, group_info in db.items():
+        columns["group_key"].append(intern(group_key))
+        columns["group_first"].append(len(columns["entry_key"]))
+        for location_key, location_list in group_info.items():
+            columns["entry_key"].append(intern(location_key))
+            columns["entry_first"].append(len(columns["latitude"]))
+            for location in location_list:
+                columns["latitude"].append(location.latitude)
+                columns["longitude"].append(location.longitude)
+                columns["name"].append(intern(location.name))
+                columns["region"].append(intern(location.region))
+                columns["timezone"].append(intern(location.timezone))
+
+    group_count = len(columns["group_key"])
+    entry_count = len(columns["entry_key"])
+    columns["group_first"].append(entry_count)
+    columns["entry_first"].append(len(columns["latitude"]))
+
+    string_list = list(strings)
+    columns["string_offsets"].append(0)
+    for value in string_list:
+        columns["string_data"].frombytes(value.encode("utf-8"))
+        columns["string_offsets"].append(len(columns["string_data"]))
+
+    group_key = columns["group_key"]
+    columns["group_order"].extend(
+        sorted(range(group_count), key=lambda idx: string_list[group_key[idx]])
+    )
+    entry_key = columns["entry_key"]
+    columns["entry_order"].extend(
+        sorted(range(entry_count), key=lambda idx: (string_list[entry_key[idx]], idx))
+    )
+
+    header = _BINARY_HEADER.pack(
+        _BINARY_MAGIC,
+        _BINARY_VERSION,
+        sys.byteorder == "little",
+        len(string_list),
+        len(columns["latitude"]),
+        group_count,
+        entry_count,
+    )
+
+    offset = _BINARY_HEADER.size + _BINARY_SECTION_TABLE.size
+    table: List[int] = []
+    for name, _ in _BINARY_SECTIONS:
+        offset += -offset % 8
+        length = len(columns[name]) * columns[name].itemsize
+        table.extend((offset, length))
+        offset += length
+
+    with open(path, "wb") as fp:
+        fp.write(header)
+        fp.write(_BINARY_SECTION_TABLE.pack(*table))
+        for index, (name, _) in enumerate(_BINARY_SECTIONS):
+            fp.write(b"\0" * (table[index * 2] - fp.tell()))
+            columns[name].tofile(fp)
+
+
+class BinaryLocationDatabase(Mapping[GroupName, GroupInfo]):
+    """A read only location database memory mapped from a file written by
+    :func:`write_database`.
+
+    The database can be passed to :func:`lookup`, :func:`group` and
+    :func:`all_locations` in the same way as a database returned by
+    :func:`database`. Lookups use the indexes stored in the file so only the
+    locations returned are read.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        with open(path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._views: List[memoryview] = []
+        self._sections: Dict[str, Union[memoryview, "array[int]"]] = {}
+        view = self._view(memoryview(self._mmap))
+        try:
+            (
+                magic,
+                version,
+                little_endian,
+                self._string_count,
+                self._location_count,
+                self._group_count,
+                self._entry_count,
+            ) = _BINARY_HEADER.unpack_from(view, 0)
+        except struct.error:
+            magic = b""
+
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an astral location database")
+
+        native = bool(little_endian) == (sys.byteorder == "little")
+        table = _BINARY_SECTION_TABLE.unpack_from(view, _BINARY_HEADER.size)
+        for index, (name, typecode) in enumerate(_BINARY_SECTIONS):
+            offset, length = table[index * 2], table[index * 2 + 1]
+            section = self._view(view[offset : offset + length])
+            if typecode == "B":
+                self._sections[name] = section
+            elif native:
+                self._sections[name] = self._view(section.cast(typecode))
+            else:
+                swapped = array(typecode, section.tobytes())
+                swapped.byteswap()
+                self._sections[name] = swapped
+
+    def _view(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        """Release the memory mapped file"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._sections = {}
+        self._mmap.close()
+
+    def __enter__(self) -> "BinaryLocationDatabase":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._group_count
+
+    def __iter__(self) -> Iterator[GroupName]:
+        group_key = self._sections["group_key"]
+        for index in range(self._group_count):
+            yield self._string(group_key[index])
+
+    def __getitem__(self, key: GroupName) -> GroupInfo:
+        index = self._find_group(key)
+        if index is None:
+            raise KeyError(key)
+        return self._group_info(index)
+
+    def _string(self, index: int) -> str:
+        offsets = self._sections["string_offsets"]
+        data = self._sections["string_data"]
+        return str(data[offsets[index] : offsets[index + 1]], "utf-8")
+
+    def _location(self, index: int) -> LocationInfo:
+        sections = self._sections
+        return LocationInfo(
+            name=self._string(sections["name"][index]),
+            region=self._string(sections["region"][index]),
+            timezone=self._string(sections["timezone"][index]),
+            latitude=sections["latitude"][index],
+            longitude=sections["longitude"][index],
+        )
+
+    def _entry_locations(self, entry: int) -> List[LocationInfo]:
+        entry_first = self._sections["entry_first"]
+        return [
+            self._location(index)
+            for index in range(entry_first[entry], entry_first[entry + 1])
+        ]
+
+    def _group_info(self, index: int) -> GroupInfo:
+        group_first = self._sections["group_first"]
+        entry_key = self._sections["entry_key"]
+        return {
+            self._string(entry_key[entry]): self._entry_locations(entry)
+            for entry in range(group_first[index], group_first[index + 1])
+        }
+
+    def _find_group(self, key: str) -> Optional[int]:
+        group_key = self._sections["group_key"]
+        order = self._sections["group_order"]
+        idx = bisect_left(order, key, key=lambda i: self._string(group_key[i]))
+        if idx < len(order) and self._string(group_key[order[idx]]) == key:
+            return order[idx]
+        return None
+
+    def _find_entries(self, key: str) -> Iterator[int]:
+        """The entries with the location key `key` in database order"""
+        entry_key = self._sections["entry_key"]
+        order = self._sections["entry_order"]
+        idx = bisect_left(order, key, key=lambda i: self._string(entry_key[i]))
+        while idx < len(order) and self._string(entry_key[order[idx]]) == key:
+            yield order[idx]
+            idx += 1
+
+    def group(self, region: str) -> GroupInfo:
+        """See :func:`astral.geocoder.group`"""
+        index = self._find_group(_sanitize_key(region))
+        if index is None:
+            raise KeyError(f"Unrecognised Group - {region}")
+        return self._group_info(index)
+
+    def lookup(self, name: str) -> Union[GroupInfo, LocationInfo]:
+        """See :func:`astral.geocoder.lookup`"""
+        key = _sanitize_key(name)
+        group_index = self._find_group(key)
+
+        try:
+            lookup_name, lookup_region = key.split(",", 1)
+        except ValueError:
+            lookup_name = key
+            lookup_region = ""
+
+        lookup_name = lookup_name.strip("\"'")
+        lookup_region = lookup_region.strip("\"'")
+
+        group_first = self._sections["group_first"]
+        for entry in self._find_entries(lookup_name):
+            entry_group = bisect_right(group_first, entry) - 1
+            if group_index is not None and group_index <= entry_group:
+                break
+
+            for location in self._entry_locations(entry):
+                if lookup_region == "":
+                    return location
+                if _sanitize_key(location.region) == lookup_region:
+                    return location
+
+        if group_index is not None:
+            return self._group_info(group_index)
+
+        raise KeyError(f"Unrecognised name - {name}")
+
+    def locations(self) -> Generator[LocationInfo, None, None]:
+        """A generator that returns all the locations in database order"""
+        for index in range(self._location_count):
+            yield self._location(index)
+
+
+def open_database(path: Union[str, "os.PathLike[str]"]) -> BinaryLocationDatabase:
+    """Open a location database written by :func:`write_database`.
+
+    The file is memory mapped so opening it takes a constant time however many
+    locations it contains. The database can be used as a context manager to
+    close the file when finished with.
+
+    Raises:
+        ValueError: if the file is not a location database
+    """
+    return BinaryLocationDatabase(path)
+
+
+# endregion
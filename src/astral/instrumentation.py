@@ -0,0 +1,236 @@
+"""Opt-in instrumentation of the sun and moon calculations.
+
+When enabled, calls to the main functions in :mod:`astral.sun` and
+:mod:`astral.moon` are counted and timed e.g. ::
+
+    from astral import instrumentation
+
+    instrumentation.enable()
+    ...
+    stats = instrumentation.snapshot()
+    stats["sun.dawn"]  # {"calls": 10, "time": 0.0004, "retries": 2, "exceptions": 0}
+
+The functions are wrapped by replacing them in their modules when
+instrumentation is enabled and restored when it is disabled, so there is no cost
+when instrumentation is not in use. Because of this, functions imported by name
+(``from astral.sun import dawn``) before :func:`enable` is called are not
+recorded; access them through their module (``astral.sun.dawn``) instead. It can
+be enabled and disabled independently of :mod:`astral.cache`, which wraps the
+same functions.
+
+The statistics recorded for each function are
+
+* ``calls`` - The number of calls
+* ``time`` - The total wall clock time in seconds, including nested calls
+* ``retries`` - The number of repeated calculations for an adjacent day when
+  an event found for a date falls on a different local date, including those made
+  by functions called from this one
+* ``exceptions`` - The number of calls which raised an exception
+
+Time spent converting UTC times to the requested timezone is recorded under
+``sun._localize``.
+
+A callback can be registered to receive a :class:`CallRecord` for every call,
+for instance to export the values to a metrics system.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from astral._wrappers import add_layer, has_layer, remove_layer
+
+__all__ = [
+    "CallRecord",
+    "enable",
+    "disable",
+    "enabled",
+    "snapshot",
+    "reset",
+    "add_callback",
+    "remove_callback",
+]
+
+# module name, function names
+_INSTRUMENTED: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "sun",
+        (
+            "_localize",
+            "_transit",
+            "_transit_on_date",
+            "time_of_transit",
+            "noon",
+            "midnight",
+            "zenith_and_azimuth",
+            "dawn",
+            "dawn_event",
+            "sunrise",
+            "sunrise_event",
+            "sunset",
+            "sunset_event",
+            "dusk",
+            "dusk_event",
+            "time_at_elevation",
+            "time_at_elevation_event",
+            "horizon_crossing",
+            "horizon_crossing_event",
+            "daylight",
+            "night",
+            "twilight",
+            "golden_hour",
+            "blue_hour",
+            "rahukaalam",
+            "sun",
+        ),
+    ),
+    (
+        "moon",
+        (
+            "moon_position",
+            "riseset",
+            "_moon_event",
+            "moonrise",
+            "moonrise_event",
+            "moonset",
+            "moonset_event",
+            "phase",
+        ),
+    ),
+)
+
+# The function whose repeated calls are retries for the function in the key
+_ATTEMPTS = {
+    "sun._transit_on_date": "sun._transit",
+    "moon._moon_event": "moon.riseset",
+}
+
+
+@dataclass
+class CallRecord:
+    """Information about a single call to an instrumented function"""
+
+    name: str
+    elapsed: float
+    retries: int
+    exception: Optional[BaseException] = None
+
+
+@dataclass
+class _Frame:
+    name: str
+    attempts: int = 0
+    retries: int = 0
+
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats: Dict[str, List[float]] = {}
+_callbacks: List[Callable[[CallRecord], None]] = []
+
+
+def _record(record: CallRecord) -> None:
+    with _lock:
+        stats = _stats.setdefault(record.name, [0, 0.0, 0, 0])
+        stats[0] += 1
+        stats[1] += record.elapsed
+        stats[2] += record.retries
+        if record.exception is not None:
+            stats[3] += 1
+        callbacks = list(_callbacks)
+
+    for callback in callbacks:
+        callback(record)
+
+
+def _wrap(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        stack: List[_Frame] = getattr(_local, "stack", None) or []
+        _local.stack = stack
+        if stack and _ATTEMPTS.get(stack[-1].name) == name:
+            stack[-1].attempts += 1
+
+        frame = _Frame(name)
+        stack.append(frame)
+        exception: Optional[BaseException] = None
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as exc:
+            exception = exc
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            retries = frame.retries + max(frame.attempts - 1, 0)
+            if stack:
+                stack[-1].retries += retries
+            _record(CallRecord(name, elapsed, retries, exception))
+
+    return wrapper
+
+
+def enable(callback: Optional[Callable[[CallRecord], None]] = None) -> None:
+    """Start recording calls.
+
+    Args:
+        callback: An optional function to call with a :class:`CallRecord` after
+                  each call to an instrumented function.
+    """
+    if callback is not None:
+        add_callback(callback)
+
+    if not has_layer("instrumentation"):
+        add_layer("instrumentation", _INSTRUMENTED, _wrap)
+
+
+def disable() -> None:
+    """Stop recording calls and restore the original functions.
+
+    The statistics recorded so far and any callbacks are kept.
+    """
+    remove_layer("instrumentation")
+
+
+def enabled() -> bool:
+    """Whether calls are being recorded"""
+    return has_layer("instrumentation")
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """Return the statistics for each function that has been called, keyed by
+    ``module.function`` e.g. ``sun.dawn``"""
+    with _lock:
+        return {
+            name: {
+                "calls": stats[0],
+                "time": stats[1],
+                "retries": stats[2],
+                "exceptions": stats[3],
+            }
+            for name, stats in _stats.items()
+        }
+
+
+def reset() -> None:
+    """Clear the recorded statistics"""
+    with _lock:
+        _stats.clear()
+
+
+def add_callback(callback: Callable[[CallRecord], None]) -> None:
+    """Register a function to call with a :class:`CallRecord` after each call to
+    an instrumented function"""
+    with _lock:
+        if callback not in _callbacks:
+            _callbacks.append(callback)
+
+
+def remove_callback(callback: Callable[[CallRecord], None]) -> None:
+    """Unregister a callback added by :func:`add_callback` or :func:`enable`"""
+    with _lock:
+        if callback in _callbacks:
+            _callbacks.remove(callback)
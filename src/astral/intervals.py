@@ -0,0 +1,599 @@
+"""Sets of time intervals for when the sun is above or between elevations.
+
+The functions in this module find every interval in a range of dates during
+which the sun satisfies a condition e.g. ::
+
+    from astral import intervals
+
+    above = intervals.sun_above(observer, 10.0, start, end)
+    above.duration()  # Total time the sun is above 10 degrees
+
+    civil = intervals.twilight(observer, start, end)
+    for dawn, sunrise in civil.intervals(tzinfo):
+        ...
+
+:func:`dark_sky` finds the windows when the sky is dark, with the sun below an
+elevation and the moon below the horizon or only slightly illuminated.
+
+The results are :class:`IntervalSet` objects which hold sorted, non-overlapping
+intervals as arrays of POSIX timestamps, so long ranges do not create a datetime
+for each day. Sets can be combined with ``|`` (union), ``&`` (intersection) and
+``-`` (difference), and datetimes are only created when the intervals are
+iterated over.
+
+Each solar day is treated separately, with the sun rising through the elevation
+before noon and setting through it after. Polar days, when the sun does not set
+through the elevation, join the intervals of the days either side of them into a
+single interval. Times agree with :func:`astral.sun.time_at_elevation` to well
+under a second.
+"""
+
+import datetime
+from array import array
+from bisect import bisect_right
+from math import floor
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+from astral import Depression, Observer, SunDirection
+from astral.moon import _above_horizon, _MoonEphemeris, illumination
+from astral.sun import (
+    SUN_APPARENT_RADIUS,
+    _crossing_jd,
+    _InterpolatedEphemeris,
+    _noon_jd,
+    _transit_terms,
+)
+
+__all__ = [
+    "IntervalSet",
+    "sun_above",
+    "sun_between",
+    "daylight",
+    "twilight",
+    "moon_above",
+    "dark_sky",
+    "dark_sky_sites",
+]
+
+# Julian day of the Unix epoch
+_JD_EPOCH = 2440587.5
+# Julian day of Jan 1.5, 2000
+_JD_2000 = 2451545.0
+# Interval between samples of the moon's elevation and the tolerance to which
+# the times it rises and sets are found, in seconds
+_MOON_STEP = 3600.0
+_MOON_TOLERANCE = 1.0
+
+TimeRange = Union[datetime.date, datetime.datetime]
+
+
+def _timestamp(value: datetime.datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def _datetime(timestamp: float, tzinfo: datetime.tzinfo) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, tzinfo)
+
+
+class IntervalSet:
+    """An immutable set of sorted, non-overlapping time intervals.
+
+    Intervals are half open i.e. they include their start but not their end.
+
+    Args:
+        intervals: Pairs of start and end datetimes, in any order and which may
+                   overlap. Naive datetimes are taken to be in UTC.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(
+        self, intervals: Iterable[Tuple[datetime.datetime, datetime.datetime]] = ()
+    ):
+        starts, ends = self._merge(
+            (_timestamp(start), _timestamp(end)) for start, end in intervals
+        )
+        self._starts = starts
+        self._ends = ends
+
+    @staticmethod
+    def _merge(
+        pairs: Iterable[Tuple[float, float]]
+    ) -> Tuple["array[float]", "array[float]"]:
+        starts = array("d")
+        ends = array("d")
+        for start, end in sorted(pairs):
+            if end <= start:
+                continue
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+
+    @classmethod
+    def from_timestamps(cls, pairs: Iterable[Tuple[float, float]]) -> "IntervalSet":
+        """Create a set from pairs of start and end POSIX timestamps"""
+        result = cls.__new__(cls)
+        result._starts, result._ends = cls._merge(pairs)
+        return result
+
+    @classmethod
+    def _from_arrays(
+        cls, starts: "array[float]", ends: "array[float]"
+    ) -> "IntervalSet":
+        result = cls.__new__(cls)
+        result._starts = starts
+        result._ends = ends
+        return result
+
+    def timestamps(self) -> List[Tuple[float, float]]:
+        """The intervals as pairs of start and end POSIX timestamps"""
+        return list(zip(self._starts, self._ends))
+
+    def intervals(
+        self, tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc
+    ) -> Iterator[Tuple[datetime.datetime, datetime.datetime]]:
+        """Iterate over the intervals as pairs of start and end datetimes in the
+        timezone `tzinfo`"""
+        if isinstance(tzinfo, str):
+            tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+        for start, end in zip(self._starts, self._ends):
+            yield _datetime(start, tzinfo), _datetime(end, tzinfo)  # type: ignore
+
+    def __iter__(self) -> Iterator[Tuple[datetime.datetime, datetime.datetime]]:
+        return self.intervals()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return len(self._starts) > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        intervals = ", ".join(
+            f"({start.isoformat()}, {end.isoformat()})" for start, end in self
+        )
+        return f"IntervalSet([{intervals}])"
+
+    def __contains__(self, dateandtime: datetime.datetime) -> bool:
+        timestamp = _timestamp(dateandtime)
+        idx = bisect_right(self._starts, timestamp) - 1
+        return idx >= 0 and timestamp < self._ends[idx]
+
+    def duration(self) -> datetime.timedelta:
+        """The total length of the intervals"""
+        return datetime.timedelta(
+            seconds=sum(end - start for start, end in zip(self._starts, self._ends))
+        )
+
+    def _combine(
+        self, other: "IntervalSet", keep: Callable[[bool, bool], bool]
+    ) -> "IntervalSet":
+        """Combine two sets by walking the boundaries of both in order and
+        keeping the sections between them for which `keep` is true."""
+        boundaries = sorted(
+            set(self._starts) | set(self._ends) | set(other._starts) | set(other._ends)
+        )
+        starts = array("d")
+        ends = array("d")
+        a = b = 0
+        for start, end in zip(boundaries, boundaries[1:]):
+            while a < len(self._ends) and self._ends[a] <= start:
+                a += 1
+            while b < len(other._ends) and other._ends[b] <= start:
+                b += 1
+            in_self = a < len(self._starts) and self._starts[a] <= start
+            in_other = b < len(other._starts) and other._starts[b] <= start
+            if keep(in_self, in_other):
+                if ends and ends[-1] == start:
+                    ends[-1] = end
+                else:
+                    starts.append(start)
+                    ends.append(end)
+        return self._from_arrays(starts, ends)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """The times which are in either set"""
+        return self._combine(other, lambda a, b: a or b)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """The times which are in both sets"""
+        return self._combine(other, lambda a, b: a and b)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """The times which are in this set but not in `other`"""
+        return self._combine(other, lambda a, b: a and not b)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.difference(other)
+
+    def clip(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> "IntervalSet":
+        """The parts of the intervals between `start` and `end`"""
+        return self & IntervalSet([(start, end)])
+
+
+def _range(
+    start: TimeRange,
+    end: TimeRange,
+    tzinfo: Union[str, datetime.tzinfo],
+) -> Tuple[float, float]:
+    """Convert the start and end of a range to timestamps. Dates are the start
+    of the day in `tzinfo` and the end date is included in the range."""
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    def convert(value: TimeRange, days: int) -> float:
+        if isinstance(value, datetime.datetime):
+            return _timestamp(value)
+        value = value + datetime.timedelta(days=days)
+        return datetime.datetime(
+            value.year, value.month, value.day, tzinfo=tzinfo  # type: ignore
+        ).timestamp()
+
+    return convert(start, 0), convert(end, 1)
+
+
+def _above(
+    observer: Observer,
+    elevation: float,
+    start: float,
+    end: float,
+    with_refraction: bool,
+) -> IntervalSet:
+    """Find the intervals between two timestamps when the sun is above an
+    elevation."""
+    sl, cl, cz = _transit_terms(observer, 90.0 - elevation, with_refraction)
+    longitude = observer.longitude
+
+    # The UTC days which have a noon close enough to affect the range
+    first_day = floor((start / 86400.0) + _JD_EPOCH - 0.5) - 1
+    last_day = floor((end / 86400.0) + _JD_EPOCH - 0.5) + 2
+    ephemeris = _InterpolatedEphemeris(first_day - 1.5, last_day + 2.5)
+
+    terms = (sl, cl, cz)
+    days = [day + 0.5 for day in range(first_day, last_day + 1)]
+    noons = [_noon_jd(jd0, longitude, ephemeris) for jd0 in days]
+    pairs = []
+    for idx in range(1, len(days) - 1):
+        jd0 = days[idx]
+        day_start = (noons[idx - 1] + noons[idx]) / 2.0
+        day_end = (noons[idx] + noons[idx + 1]) / 2.0
+
+        rise, rise_status = _crossing_jd(
+            jd0, noons[idx], terms, longitude, SunDirection.RISING, ephemeris
+        )
+        setting, set_status = _crossing_jd(
+            jd0, noons[idx], terms, longitude, SunDirection.SETTING, ephemeris
+        )
+        if rise is None:
+            # Always below at the time of rising means the sun does not
+            # reach the elevation before noon
+            rise = day_start if rise_status < 0 else noons[idx]
+        if setting is None:
+            setting = day_end if set_status < 0 else noons[idx]
+        pairs.append(
+            (
+                max((rise - _JD_EPOCH) * 86400.0, start),
+                min((setting - _JD_EPOCH) * 86400.0, end),
+            )
+        )
+
+    return IntervalSet.from_timestamps(pairs)
+
+
+def sun_above(
+    observer: Observer,
+    elevation: float,
+    start: TimeRange,
+    end: TimeRange,
+    with_refraction: bool = True,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals when the sun is above an elevation.
+
+    Args:
+        observer:        An observer viewing the sun at a specific, latitude,
+                         longitude and elevation
+        elevation:       Elevation of the sun in degrees above the horizon
+        start:           Start of the range as a datetime, or a date to start at
+                         the beginning of the day in the timezone `tzinfo`
+        end:             End of the range as a datetime, or a date to end at the
+                         end of the day in the timezone `tzinfo`
+        with_refraction: If True adjust the elevation for atmospheric refraction
+        tzinfo:          Timezone of `start` and `end` when they are dates
+
+    Returns:
+        The intervals within the range when the sun is above the elevation.
+    """
+    start_ts, end_ts = _range(start, end, tzinfo)
+    return _above(observer, elevation, start_ts, end_ts, with_refraction)
+
+
+def sun_between(
+    observer: Observer,
+    lower: float,
+    upper: float,
+    start: TimeRange,
+    end: TimeRange,
+    with_refraction: bool = True,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals when the sun is above the elevation `lower` and below
+    the elevation `upper`.
+
+    Takes the same arguments as :func:`sun_above`.
+    """
+    start_ts, end_ts = _range(start, end, tzinfo)
+    return _above(observer, lower, start_ts, end_ts, with_refraction) - _above(
+        observer, upper, start_ts, end_ts, with_refraction
+    )
+
+
+def daylight(
+    observer: Observer,
+    start: TimeRange,
+    end: TimeRange,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals between sunrise and sunset.
+
+    Takes the same arguments as :func:`sun_above`.
+    """
+    return sun_above(observer, -SUN_APPARENT_RADIUS, start, end, tzinfo=tzinfo)
+
+
+def twilight(
+    observer: Observer,
+    start: TimeRange,
+    end: TimeRange,
+    depression: Union[float, Depression] = Depression.CIVIL,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals of twilight, between dawn and sunrise and between
+    sunset and dusk.
+
+    Args:
+        depression: Depression of the sun at dawn and dusk. Default is for Civil
+                    twilight i.e. 6.0
+
+    Takes the same other arguments as :func:`sun_above`.
+    """
+    if isinstance(depression, Depression):
+        depression = depression.value
+
+    return sun_between(
+        observer,
+        -float(depression),
+        -SUN_APPARENT_RADIUS,
+        start,
+        end,
+        tzinfo=tzinfo,
+    )
+
+
+def _jd2000(timestamp: float) -> float:
+    return timestamp / 86400.0 + _JD_EPOCH - _JD_2000
+
+
+def _moon_ephemeris(start: float, end: float) -> _MoonEphemeris:
+    return _MoonEphemeris(_jd2000(start) - 1.0, _jd2000(end) + 1.0)
+
+
+def _crossing(
+    func: Callable[[float], float], t0: float, f0: float, t1: float, f1: float
+) -> float:
+    """Find the time between `t0` and `t1` at which `func`, which has values of
+    opposite signs at those times, is 0 using the Illinois variant of the
+    regula falsi method."""
+    side = 0
+    while t1 - t0 > _MOON_TOLERANCE:
+        t = t1 - f1 * (t1 - t0) / (f1 - f0)
+        f = func(t)
+        if (f > 0) == (f1 > 0):
+            t1, f1 = t, f
+            if side == 1:
+                f0 /= 2.0
+            side = 1
+        else:
+            t0, f0 = t, f
+            if side == -1:
+                f1 /= 2.0
+            side = -1
+        if f == 0.0:
+            return t
+    return (t0 + t1) / 2.0
+
+
+def _crossings(
+    func: Callable[[float], float], start: float, end: float
+) -> Iterator[Tuple[float, bool]]:
+    """Find the times between `start` and `end` at which `func` changes sign.
+
+    The function is sampled every hour to bracket each change, which is then
+    found with a root finder.
+
+    Yields:
+        The time of each change and whether the function became positive.
+    """
+    t0 = start
+    f0 = func(t0)
+    while t0 < end:
+        t1 = min(t0 + _MOON_STEP, end)
+        f1 = func(t1)
+        if (f0 > 0) != (f1 > 0):
+            yield _crossing(func, t0, f0, t1, f1), f1 > 0
+        t0, f0 = t1, f1
+
+
+def _moon_up(
+    observer: Observer,
+    windows: Iterable[Tuple[float, float]],
+    ephemeris: _MoonEphemeris,
+) -> List[Tuple[float, float]]:
+    """Find the intervals within the windows when the moon is above the
+    horizon."""
+
+    def func(timestamp: float) -> float:
+        return _above_horizon(observer, _jd2000(timestamp), ephemeris)
+
+    pairs = []
+    for start, end in windows:
+        rise = start if func(start) > 0 else None
+        for time, rising in _crossings(func, start, end):
+            if rising:
+                rise = time
+            elif rise is not None:
+                pairs.append((rise, time))
+                rise = None
+        if rise is not None:
+            pairs.append((rise, end))
+    return pairs
+
+
+def moon_above(
+    observer: Observer,
+    start: TimeRange,
+    end: TimeRange,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals when the top of the moon is above the horizon, as for
+    :func:`astral.moon.moonrise` and :func:`astral.moon.moonset`.
+
+    Takes the same arguments as :func:`sun_above`.
+    """
+    start_ts, end_ts = _range(start, end, tzinfo)
+    ephemeris = _moon_ephemeris(start_ts, end_ts)
+    return IntervalSet.from_timestamps(
+        _moon_up(observer, [(start_ts, end_ts)], ephemeris)
+    )
+
+
+def _dark_sky(
+    observer: Observer,
+    start: float,
+    end: float,
+    sun_elevation: float,
+    max_illumination: Optional[float],
+    ephemeris: _MoonEphemeris,
+) -> IntervalSet:
+    whole = IntervalSet.from_timestamps([(start, end)])
+    night = whole - _above(observer, sun_elevation, start, end, True)
+
+    # Nights when the moon is dim enough do not need to be searched. The
+    # illumination is checked at the middle of each night, or of each day of
+    # a polar night.
+    windows = []
+    for night_start, night_end in night.timestamps():
+        while night_start < night_end:
+            window_end = min(night_start + 86400.0, night_end)
+            if max_illumination is not None:
+                middle = (night_start + window_end) / 2.0
+                fraction = illumination(_datetime(middle, datetime.timezone.utc))
+                if fraction <= max_illumination:
+                    night_start = window_end
+                    continue
+            windows.append((night_start, window_end))
+            night_start = window_end
+
+    return night - IntervalSet.from_timestamps(_moon_up(observer, windows, ephemeris))
+
+
+def dark_sky(
+    observer: Observer,
+    start: TimeRange,
+    end: TimeRange,
+    sun_elevation: float = -18.0,
+    max_illumination: Optional[float] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> IntervalSet:
+    """Find the intervals when the sky is dark.
+
+    The sun must be below `sun_elevation` and the moon must be below the horizon
+    or, if `max_illumination` is given, have no more than that fraction of its
+    disc illuminated.
+
+    The intervals when the sun is low enough are found first and the moon is
+    only searched for within them, so moonrises and moonsets during the day are
+    never calculated.
+
+    Args:
+        observer:         An observer viewing the sky at a specific latitude
+                          and longitude
+        start:            Start of the range as a datetime, or a date to start at
+                          the beginning of the day in the timezone `tzinfo`
+        end:              End of the range as a datetime, or a date to end at the
+                          end of the day in the timezone `tzinfo`
+        sun_elevation:    Elevation in degrees that the sun must be below. The
+                          default is the end of astronomical twilight.
+        max_illumination: The fraction, between 0 and 1, of the moon's disc which
+                          may be illuminated while the moon is above the horizon,
+                          as :func:`astral.moon.illumination`
+        tzinfo:           Timezone of `start` and `end` when they are dates
+
+    Returns:
+        The intervals within the range when the sky is dark.
+    """
+    start_ts, end_ts = _range(start, end, tzinfo)
+    ephemeris = _moon_ephemeris(start_ts, end_ts)
+    return _dark_sky(
+        observer, start_ts, end_ts, sun_elevation, max_illumination, ephemeris
+    )
+
+
+def dark_sky_sites(
+    observers: Sequence[Observer],
+    start: TimeRange,
+    end: TimeRange,
+    sun_elevation: float = -18.0,
+    max_illumination: Optional[float] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> List[IntervalSet]:
+    """Find the intervals when the sky is dark for several sites.
+
+    The moon's position is calculated once and shared between the sites. Takes
+    the same arguments as :func:`dark_sky`, except for a sequence of observers.
+
+    Returns:
+        A list of the intervals for each observer.
+    """
+    start_ts, end_ts = _range(start, end, tzinfo)
+    ephemeris = _moon_ephemeris(start_ts, end_ts)
+    return [
+        _dark_sky(
+            observer, start_ts, end_ts, sun_elevation, max_illumination, ephemeris
+        )
+        for observer in observers
+    ]
@@ -1,15 +1,26 @@
 import dataclasses
 import datetime
+import threading
 
 try:
     import zoneinfo
 except ImportError:
     from backports import zoneinfo  # type: ignore
 
-from typing import Any, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import astral.moon
-import astral.sun
+import astral
 from astral import (
     Depression,
     Elevation,
@@ -20,9 +31,33 @@ from astral import (
     today,
 )
 
+if TYPE_CHECKING:
+    import astral.moon
+    import astral.sun
+
+
+# The number of results of the daily calculations kept by each Location
+CACHE_SIZE = 128
+
+
+def _models() -> Tuple[Any, ...]:
+    """The process wide settings which change the results of the calculations"""
+    shared = astral.sun._shared_ephemeris
+    return (
+        astral.sun.solar_model(),
+        astral.moon.series_cutoff(),
+        None if shared is None else (shared.start, shared.end),
+    )
+
 
 class Location:
-    """Provides access to information for single location."""
+    """Provides access to information for single location.
+
+    The observer and time zone derived from the location's information are
+    cached, as are the most recent results of the daily calculations so that
+    calling several methods, or the same method repeatedly, for one date is
+    cheap. Setting any of the location's properties clears the cache.
+    """
 
     def __init__(self, info: Optional[LocationInfo] = None):
         """Initializes the Location with a LocationInfo object.
@@ -45,6 +80,11 @@ class Location:
 
         self._location_info: LocationInfo
         self._solar_depression: float = Depression.CIVIL.value
+        self._tzinfo: Optional[datetime.tzinfo] = None
+        self._observers: Dict[Elevation, Observer] = {}
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Guards the order of _results, which is changed by every lookup
+        self._lock = threading.Lock()
 
         if not info:
             self._location_info = LocationInfo(
@@ -69,6 +109,49 @@ class Location:
             f"lon={self.longitude:0.02f}"
         )
 
+    def clear_cache(self) -> None:
+        """Discard the cached observers, time zone and calculation results."""
+        self._tzinfo = None
+        self._observers.clear()
+        with self._lock:
+            self._results.clear()
+
+    def _observer(self, elevation: Elevation = 0.0) -> Observer:
+        try:
+            return self._observers[elevation]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable elevations e.g. a HorizonProfile are not cached
+            return Observer(self.latitude, self.longitude, elevation)
+
+        observer = Observer(self.latitude, self.longitude, elevation)
+        if len(self._observers) >= 8:
+            self._observers.clear()
+        self._observers[elevation] = observer
+        return observer
+
+    def _cached(self, key: Tuple[Any, ...], func: Callable[[], Any]) -> Any:
+        """Return the result of a previous call to `func` with the same key and
+        models, or call it and cache the result."""
+        key += _models()
+        try:
+            with self._lock:
+                result = self._results[key]
+                self._results.move_to_end(key)
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            return func()
+
+        result = func()
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
     @property
     def info(self) -> LocationInfo:
         return LocationInfo(
@@ -81,6 +164,7 @@ class Location:
 
     @property
     def observer(self) -> Observer:
+        """An observer at the location, at an elevation of 0 metres"""
         return Observer(self.latitude, self.longitude, 0.0)
 
     @property
@@ -119,6 +203,7 @@ class Location:
         self._location_info = dataclasses.replace(
             self._location_info, latitude=dms_to_float(latitude, 90.0)
         )
+        self.clear_cache()
 
     @property
     def longitude(self) -> float:
@@ -140,6 +225,7 @@ class Location:
         self._location_info = dataclasses.replace(
             self._location_info, longitude=dms_to_float(longitude, 180.0)
         )
+        self.clear_cache()
 
     @property
     def timezone(self) -> str:
@@ -160,13 +246,18 @@ class Location:
             raise ValueError("Timezone '%s' not recognized" % name)
 
         self._location_info = dataclasses.replace(self._location_info, timezone=name)
+        self.clear_cache()
 
     @property
     def tzinfo(self) -> zoneinfo.ZoneInfo:  # type: ignore
         """Time zone information."""
 
+        if self._tzinfo is not None:
+            return self._tzinfo  # type: ignore
+
         try:
             tz = zoneinfo.ZoneInfo(self._location_info.timezone)  # type: ignore
+            self._tzinfo = tz
             return tz  # type: ignore
         except zoneinfo.ZoneInfoNotFoundError as exc:  # type: ignore
             raise ValueError(
@@ -251,12 +342,16 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.sun(observer, date, self.solar_depression, self.tzinfo)
-        else:
-            return astral.sun.sun(observer, date, self.solar_depression)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        # Copied so that changes to the returned dictionary don't affect the cache
+        return dict(
+            self._cached(
+                ("sun", date, local, observer_elevation, self.solar_depression),
+                lambda: astral.sun.sun(observer, date, self.solar_depression, tzinfo),
+            )
+        )
 
     def dawn(
         self,
@@ -287,12 +382,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.dawn(observer, date, self.solar_depression, self.tzinfo)
-        else:
-            return astral.sun.dawn(observer, date, self.solar_depression)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("dawn", date, local, observer_elevation, self.solar_depression),
+            lambda: astral.sun.dawn(observer, date, self.solar_depression, tzinfo),
+        )
 
     def sunrise(
         self,
@@ -324,12 +420,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.sunrise(observer, date, self.tzinfo)
-        else:
-            return astral.sun.sunrise(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("sunrise", date, local, observer_elevation),
+            lambda: astral.sun.sunrise(observer, date, tzinfo),
+        )
 
     def noon(
         self, date: Optional[datetime.date] = None, local: bool = True
@@ -353,11 +450,12 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude)
-        if local:
-            return astral.sun.noon(observer, date, self.tzinfo)
-        else:
-            return astral.sun.noon(observer, date)
+        observer = self._observer()
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("noon", date, local),
+            lambda: astral.sun.noon(observer, date, tzinfo),
+        )
 
     def sunset(
         self,
@@ -387,12 +485,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.sunset(observer, date, self.tzinfo)
-        else:
-            return astral.sun.sunset(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("sunset", date, local, observer_elevation),
+            lambda: astral.sun.sunset(observer, date, tzinfo),
+        )
 
     def dusk(
         self,
@@ -424,12 +523,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.dusk(observer, date, self.solar_depression, self.tzinfo)
-        else:
-            return astral.sun.dusk(observer, date, self.solar_depression)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("dusk", date, local, observer_elevation, self.solar_depression),
+            lambda: astral.sun.dusk(observer, date, self.solar_depression, tzinfo),
+        )
 
     def midnight(
         self, date: Optional[datetime.date] = None, local: bool = True
@@ -453,12 +553,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude)
+        observer = self._observer()
 
-        if local:
-            return astral.sun.midnight(observer, date, self.tzinfo)
-        else:
-            return astral.sun.midnight(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("midnight", date, local),
+            lambda: astral.sun.midnight(observer, date, tzinfo),
+        )
 
     def daylight(
         self,
@@ -487,12 +588,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.daylight(observer, date, self.tzinfo)
-        else:
-            return astral.sun.daylight(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("daylight", date, local, observer_elevation),
+            lambda: astral.sun.daylight(observer, date, tzinfo),
+        )
 
     def night(
         self,
@@ -522,12 +624,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.night(observer, date, self.tzinfo)
-        else:
-            return astral.sun.night(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("night", date, local, observer_elevation),
+            lambda: astral.sun.night(observer, date, tzinfo),
+        )
 
     def twilight(
         self,
@@ -563,12 +666,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.twilight(observer, date, direction, self.tzinfo)
-        else:
-            return astral.sun.twilight(observer, date, direction)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("twilight", date, local, observer_elevation, direction),
+            lambda: astral.sun.twilight(observer, date, direction, tzinfo),
+        )
 
     def moonrise(
         self,
@@ -593,12 +697,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, 0)
+        observer = self._observer()
 
-        if local:
-            return astral.moon.moonrise(observer, date, self.tzinfo)
-        else:
-            return astral.moon.moonrise(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("moonrise", date, local),
+            lambda: astral.moon.moonrise(observer, date, tzinfo),
+        )
 
     def moonset(
         self,
@@ -623,12 +728,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, 0)
+        observer = self._observer()
 
-        if local:
-            return astral.moon.moonset(observer, date, self.tzinfo)
-        else:
-            return astral.moon.moonset(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("moonset", date, local),
+            lambda: astral.moon.moonset(observer, date, tzinfo),
+        )
 
     def time_at_elevation(
         self,
@@ -671,14 +777,15 @@ class Location:
             elevation = 180.0 - elevation
             direction = SunDirection.SETTING
 
-        observer = Observer(self.latitude, self.longitude, 0.0)
+        observer = self._observer()
 
-        if local:
-            return astral.sun.time_at_elevation(
-                observer, elevation, date, direction, self.tzinfo
-            )
-        else:
-            return astral.sun.time_at_elevation(observer, elevation, date, direction)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("time_at_elevation", date, local, elevation, direction),
+            lambda: astral.sun.time_at_elevation(
+                observer, elevation, date, direction, tzinfo
+            ),
+        )
 
     def rahukaalam(
         self,
@@ -706,12 +813,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.rahukaalam(observer, date, tzinfo=self.tzinfo)
-        else:
-            return astral.sun.rahukaalam(observer, date)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("rahukaalam", date, local, observer_elevation),
+            lambda: astral.sun.rahukaalam(observer, date, tzinfo=tzinfo),
+        )
 
     def golden_hour(
         self,
@@ -749,12 +857,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.golden_hour(observer, date, direction, self.tzinfo)
-        else:
-            return astral.sun.golden_hour(observer, date, direction)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("golden_hour", date, local, observer_elevation, direction),
+            lambda: astral.sun.golden_hour(observer, date, direction, tzinfo),
+        )
 
     def blue_hour(
         self,
@@ -792,12 +901,13 @@ class Location:
         if date is None:
             date = self.today(local)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
-        if local:
-            return astral.sun.blue_hour(observer, date, direction, self.tzinfo)
-        else:
-            return astral.sun.blue_hour(observer, date, direction)
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return self._cached(
+            ("blue_hour", date, local, observer_elevation, direction),
+            lambda: astral.sun.blue_hour(observer, date, direction, tzinfo),
+        )
 
     def solar_azimuth(
         self,
@@ -815,7 +925,7 @@ class Location:
         elif not dateandtime.tzinfo:
             dateandtime = dateandtime.replace(tzinfo=self.tzinfo)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
         dateandtime = dateandtime.astimezone(datetime.timezone.utc)  # type: ignore
         return astral.sun.azimuth(observer, dateandtime)
@@ -837,7 +947,7 @@ class Location:
         elif not dateandtime.tzinfo:
             dateandtime = dateandtime.replace(tzinfo=self.tzinfo)
 
-        observer = Observer(self.latitude, self.longitude, observer_elevation)
+        observer = self._observer(observer_elevation)
 
         dateandtime = dateandtime.astimezone(datetime.timezone.utc)  # type: ignore
         return astral.sun.elevation(observer, dateandtime)
@@ -876,3 +986,69 @@ class Location:
             date = self.today(local)
 
         return astral.moon.phase(date)
+
+    def sun_range(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        local: bool = True,
+        observer_elevation: Elevation = 0.0,
+    ) -> Dict[str, List[Any]]:
+        """Calculates dawn, sunrise, noon, sunset and dusk for every date from
+        `start` to `end` inclusive.
+
+        :param start: The first date for which to calculate the times.
+
+        :param end: The last date for which to calculate the times.
+
+        :param local: True  = Time to be returned in location's time zone;
+                      False = Time to be returned in UTC.
+                      If not specified then the time will be returned in local time
+
+        :param observer_elevation: Elevation of the observer in metres above
+                                   the location.
+
+        :returns: Dictionary with keys ``date``, ``dawn``, ``sunrise``, ``noon``,
+            ``sunset`` and ``dusk`` whose values are lists with an entry for each
+            date. Events which do not occur on a date are ``None``.
+        """
+
+        if local and self.timezone is None:
+            raise ValueError("Local time requested but Location has no timezone set.")
+
+        observer = self._observer(observer_elevation)
+
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return astral.sun.sun_range(
+            observer, start, end, self.solar_depression, tzinfo
+        )
+
+    def moon_range(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        local: bool = True,
+    ) -> Dict[str, List[Any]]:
+        """Calculates the moon rise and set times and the moon phase for every
+        date from `start` to `end` inclusive.
+
+        :param start: The first date for which to calculate the times.
+
+        :param end: The last date for which to calculate the times.
+
+        :param local: True  = Time to be returned in location's time zone;
+                      False = Time to be returned in UTC.
+                      If not specified then the time will be returned in local time
+
+        :returns: Dictionary with keys ``date``, ``moonrise``, ``moonset`` and
+            ``phase`` whose values are lists with an entry for each date.
+            Moon rise and set times which do not occur on a date are ``None``.
+        """
+
+        if local and self.timezone is None:
+            raise ValueError("Local time requested but Location has no timezone set.")
+
+        observer = self._observer()
+
+        tzinfo = self.tzinfo if local else datetime.timezone.utc
+        return astral.moon.moon_range(observer, start, end, tzinfo)
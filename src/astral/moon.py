@@ -9,20 +9,40 @@ http://articles.adsabs.harvard.edu/pdf/1979ApJS...41..391V
 
 import datetime
 from dataclasses import dataclass, field, replace
-from math import asin, atan2, cos, degrees, fabs, pi, radians, sin, sqrt
-from typing import Callable, List, Optional, Union
+from math import asin, atan2, ceil, cos, degrees, fabs, pi, radians, sin, sqrt
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
     import zoneinfo
 except ImportError:
     from backports import zoneinfo  # type: ignore
 
-from astral import AstralBodyPosition, Observer, now, today
+from astral import (
+    AstralBodyPosition,
+    EventResult,
+    EventStatus,
+    Observer,
+    now,
+    today,
+)
 from astral.julian import julianday, julianday_2000
-from astral.sidereal import lmst
-from astral.table4 import Table4Row, table4_u, table4_v, table4_w
-
-__all__ = ["moonrise", "moonset", "phase"]
+from astral.sidereal import _gmst, lmst
+
+if TYPE_CHECKING:
+    from astral.ephemeris import Ephemeris
+    from astral.table4 import Table4Row
+
+__all__ = [
+    "moonrise",
+    "moonset",
+    "moonrise_event",
+    "moonset_event",
+    "moon_range",
+    "phase",
+    "illumination",
+    "set_series_cutoff",
+    "series_cutoff",
+]
 
 # Using 1896 arc seconds as moon's apparent diameter
 MOON_APPARENT_RADIUS = 1896.0 / (60.0 * 60.0)
@@ -31,6 +51,7 @@ Degrees = float
 Radians = float
 Revolutions = float
 ArgumentFunc = Optional[Callable[[float], float]]
+TransitTime = Optional[datetime.datetime]
 
 
 @dataclass
@@ -118,8 +139,102 @@ def venus_mean_longitude(jd2000: float) -> Revolutions:
     return _venus_mean_longitude
 
 
-def moon_position(jd2000: float) -> AstralBodyPosition:
+# A precalculated ephemeris installed by astral.ephemeris.install
+_shared_ephemeris: Optional["Ephemeris"] = None
+
+# The smallest coefficient of the series used to calculate the moon's position
+_series_cutoff = 0.0
+# The series with the smaller terms removed for each cutoff used
+_series: Dict[float, Tuple[List["Table4Row"], ...]] = {}
+
+
+def set_series_cutoff(cutoff: float = 0.0) -> None:
+    """Leave the terms with coefficients smaller than `cutoff` out of the series
+    used to calculate the moon's position, trading accuracy for speed.
+
+    The series have 172 terms, many of them with coefficients of around 1e-5.
+    The largest differences from the full series found by
+    ``src/bench/bench_moon_series.py`` between 1900 and 2100, with rise and set
+    times at latitudes of 0°, 40° and 60° (which are given to the minute), are
+
+    =======  =====  =========  =========  ===========  ==========
+    Cutoff   Terms  Time       RA         Declination  Rise / set
+    =======  =====  =========  =========  ===========  ==========
+    0        172    1          0          0            0
+    0.00005  111    0.69       2.1'       1.6'         1 minute
+    0.0001   80     0.40       2.7'       3.8'         1 minute
+    0.0005   48     0.30       10.5'      8.4'         3 minutes
+    0.001    30     0.19       24.4'      17.0'        5 minutes
+    0.003    20     0.11       37.3'      31.2'        9 minutes
+    =======  =====  =========  =========  ===========  ==========
+
+    where the time is relative to the full series. The moon's apparent radius is
+    about 16'. Close to the start or end of a day a truncated series can also
+    move a rise or set onto the neighbouring day.
+
+    The cutoff applies to every calculation of the moon's position in the
+    process, including by :func:`moonrise`, :func:`moonset`, :func:`azimuth`
+    and :func:`elevation`, unless a cutoff is passed to :func:`moon_position`.
+    Results cached by :class:`~astral.location.Location` and stored by
+    :mod:`astral.cache` are kept separately for each cutoff.
+
+    Args:
+        cutoff: The smallest coefficient to keep. 0 uses the full series.
+    """
+    global _series_cutoff
+
+    if cutoff < 0:
+        raise ValueError("The cutoff must not be negative")
+    _series_cutoff = float(cutoff)
+
+
+def series_cutoff() -> float:
+    """The cutoff set by :func:`set_series_cutoff`"""
+    return _series_cutoff
+
+
+def _truncated_series(cutoff: float) -> Tuple[List["Table4Row"], ...]:
+    """The v, u and w series without the terms smaller than `cutoff`"""
+    try:
+        return _series[cutoff]
+    except KeyError:
+        pass
+
+    # The tables are only constructed when the first position is calculated
+    from astral.table4 import table4_u, table4_v, table4_w
+
+    series = tuple(
+        [row for row in table if fabs(row.coefficient) >= cutoff]
+        for table in (table4_v, table4_u, table4_w)
+    )
+    _series[cutoff] = series
+    return series
+
+
+def moon_position(jd2000: float, cutoff: Optional[float] = None) -> AstralBodyPosition:
+    """Calculate right ascension, declination and geocentric distance for the
+    moon, or interpolate them from the installed shared ephemeris if it covers
+    the day and was calculated with the same cutoff.
+
+    Args:
+        jd2000: The number of days since Jan 1.5, 2000
+        cutoff: The smallest coefficient of the series to use. Default is the
+                cutoff set by :func:`set_series_cutoff`.
+    """
+    if cutoff is None:
+        cutoff = _series_cutoff
+    if _shared_ephemeris is not None and _shared_ephemeris.series_cutoff == cutoff:
+        position = _shared_ephemeris.moon(jd2000)
+        if position is not None:
+            return position
+    return _moon_position(jd2000, cutoff)
+
+
+def _moon_position(jd2000: float, cutoff: Optional[float] = None) -> AstralBodyPosition:
     """Calculate right ascension, declination and geocentric distance for the moon"""
+    table4_v, table4_u, table4_w = _truncated_series(
+        _series_cutoff if cutoff is None else cutoff
+    )
 
     argument_values: List[Union[float, None]] = [
         moon_mean_longitude(jd2000),  # 1 = Lm
@@ -138,7 +253,7 @@ def moon_position(jd2000: float) -> AstralBodyPosition:
 
     T = jd2000 / 36525 + 1
 
-    def _calc_value(table: List[Table4Row]) -> float:
+    def _calc_value(table: List["Table4Row"]) -> float:
         result = 0.0
         for row in table:
             revolutions: float = 0.0
@@ -241,7 +356,8 @@ def moon_transit_event(
     if e > 1 or e < 0:
         e = (-b - discriminant) / (2 * a)
 
-    time = hour + e + 1 / 120
+    # Rounded to the nearest minute, but not past the end of the day
+    time = min(hour + e + 1 / 120, 24 - 1 / 120)
 
     h = int(time)
     m = int((time - h) * 60)
@@ -397,6 +513,102 @@ def riseset(
     return rise_time, set_time
 
 
+def _riseset(
+    on: datetime.date,
+    observer: Observer,
+    cache: Optional[Dict[datetime.date, Tuple[TransitTime, TransitTime]]],
+) -> Tuple[TransitTime, TransitTime]:
+    if cache is None:
+        return riseset(on, observer)
+
+    try:
+        return cache[on]
+    except KeyError:
+        info = riseset(on, observer)
+        cache[on] = info
+        return info
+
+
+def _moon_event(
+    observer: Observer,
+    date: datetime.date,
+    tzinfo: datetime.tzinfo,
+    index: int,
+    cache: Optional[Dict[datetime.date, Tuple[TransitTime, TransitTime]]] = None,
+) -> Tuple[TransitTime, Tuple[TransitTime, TransitTime]]:
+    """Find the moon rise (index 0) or set (index 1) time on the local date.
+
+    Returns the time, which is None if the event does not fall on the local
+    date, and the rise and set times found for the UTC date. The rise and set
+    times for each UTC date are stored in `cache`, if given, and reused.
+    """
+    info = _riseset(date, observer, cache)
+    if info[index] is None:
+        return None, info
+
+    event = info[index].astimezone(tzinfo)  # type: ignore
+    ed = event.date()
+    if ed != date:
+        if ed > date:
+            delta = datetime.timedelta(days=-1)
+        else:
+            delta = datetime.timedelta(days=1)
+        other = _riseset(date + delta, observer, cache)[index]
+        if other is None:
+            return event, info
+        event = other.astimezone(tzinfo)
+        if event.date() != date:
+            return None, info
+    return event, info
+
+
+def _moon_result(
+    observer: Observer,
+    date: Optional[datetime.date],
+    tzinfo: Union[str, datetime.tzinfo],
+    index: int,
+) -> EventResult:
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    if date is None:
+        date = today(tzinfo)  # type: ignore
+    elif isinstance(date, datetime.datetime):
+        date = date.date()
+
+    event, info = _moon_event(observer, date, tzinfo, index)  # type: ignore
+    if event is not None and event.date() == date:
+        return EventResult(EventStatus.OCCURS, event)
+    elif info[0] is not None or info[1] is not None:
+        return EventResult(EventStatus.NOT_ON_DATE)
+
+    # Neither a rise nor a set so the moon stays on the same side of the horizon
+    midday = datetime.datetime(
+        date.year, date.month, date.day, 12, tzinfo=datetime.timezone.utc
+    )
+    if elevation(observer, midday) > 0.0:
+        return EventResult(EventStatus.ALWAYS_ABOVE)
+    return EventResult(EventStatus.ALWAYS_BELOW)
+
+
+def moonrise_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate the moon rise time without raising an exception if the moon
+    does not rise.
+
+    Takes the same arguments as :func:`moonrise`.
+
+    Returns:
+        The time at which moonrise occurs, ``NOT_ON_DATE`` if the moon does
+        not rise on the date or ``ALWAYS_ABOVE`` or ``ALWAYS_BELOW`` if the moon
+        neither rises nor sets.
+    """
+    return _moon_result(observer, date, tzinfo, 0)
+
+
 def moonrise(
     observer: Observer,
     date: Optional[datetime.date] = None,
@@ -421,25 +633,28 @@ def moonrise(
     elif isinstance(date, datetime.datetime):
         date = date.date()
 
-    info = riseset(date, observer)
-    if info[0]:
-        rise = info[0].astimezone(tzinfo)  # type: ignore
-        rd = rise.date()
-        if rd != date:
-            if rd > date:
-                delta = datetime.timedelta(days=-1)
-            else:
-                delta = datetime.timedelta(days=1)
-            new_date = date + delta
-            info = riseset(new_date, observer)
-            if info[0]:
-                rise = info[0].astimezone(tzinfo)  # type: ignore
-                rd = rise.date()
-                if rd != date:
-                    rise = None
-        return rise
-    else:
+    rise, info = _moon_event(observer, date, tzinfo, 0)  # type: ignore
+    if info[0] is None:
         raise ValueError("Moon never rises on this date, at this location")
+    return rise
+
+
+def moonset_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate the moon set time without raising an exception if the moon
+    does not set.
+
+    Takes the same arguments as :func:`moonset`.
+
+    Returns:
+        The time at which moonset occurs, ``NOT_ON_DATE`` if the moon does
+        not set on the date or ``ALWAYS_ABOVE`` or ``ALWAYS_BELOW`` if the moon
+        neither rises nor sets.
+    """
+    return _moon_result(observer, date, tzinfo, 1)
 
 
 def moonset(
@@ -466,25 +681,10 @@ def moonset(
     elif isinstance(date, datetime.datetime):
         date = date.date()
 
-    info = riseset(date, observer)
-    if info[1]:
-        set = info[1].astimezone(tzinfo)  # type: ignore
-        sd = set.date()
-        if sd != date:
-            if sd > date:
-                delta = datetime.timedelta(days=-1)
-            else:
-                delta = datetime.timedelta(days=1)
-            new_date = date + delta
-            info = riseset(new_date, observer)
-            if info[1]:
-                set = info[1].astimezone(tzinfo)  # type: ignore
-                sd = set.date()
-                if sd != date:
-                    set = None
-        return set
-    else:
+    set, info = _moon_event(observer, date, tzinfo, 1)  # type: ignore
+    if info[1] is None:
         raise ValueError("Moon never sets on this date, at this location")
+    return set
 
 
 def azimuth(
@@ -548,8 +748,8 @@ def zenith(
     return 90 - elevation(observer, at)
 
 
-def _phase_asfloat(date: datetime.date) -> float:
-    jd = julianday(date)
+def _elongation(jd: float) -> Degrees:
+    """Calculate the moon's elongation from the sun in degrees"""
     dt = pow((jd - 2382148), 2) / (41048480 * 86400)
     t = (jd + dt - 2451545.0) / 36525
     t2 = pow(t, 2)
@@ -568,8 +768,11 @@ def _phase_asfloat(date: datetime.date) -> float:
     elong -= 2.10 * sin(m)
     elong += 1.27 * sin(2 * d - m1)
     elong += 0.66 * sin(2 * d)
-    elong = elong % 360.0
-    elong = int(elong)
+    return elong % 360.0
+
+
+def _phase_asfloat(date: datetime.date) -> float:
+    elong = int(_elongation(julianday(date)))
     moon = ((elong + 6.43) / 360) * 28
     return moon
 
@@ -599,3 +802,140 @@ def phase(date: Optional[datetime.date] = None) -> float:
     if moon >= 28.0:
         moon -= 28.0
     return moon
+
+
+def illumination(
+    at: Optional[Union[datetime.date, datetime.datetime]] = None
+) -> float:
+    """Calculates the fraction of the moon's disc which is illuminated.
+
+    Args:
+        at: The date or time to calculate for. Dates are always in the UTC
+            timezone. If not specified then the current time is used.
+
+    Returns:
+        A number between 0 (new moon) and 1 (full moon).
+    """
+    if at is None:
+        at = now()
+
+    return (1.0 - cos(radians(_elongation(julianday(at))))) / 2.0
+
+
+class _MoonEphemeris:
+    """The moon's position calculated at intervals of `step` days between two
+    days since Jan 1.5, 2000 and interpolated between them, as :func:`riseset`
+    interpolates the positions for a day."""
+
+    def __init__(self, start: float, end: float, step: float = 0.5):
+        self.start = start
+        self.step = step
+        count = max(int(ceil((end - start) / step)) + 1, 3)
+        positions = [moon_position(start + idx * step) for idx in range(count)]
+
+        self.right_ascension = [positions[0].right_ascension]
+        for position in positions[1:]:
+            right_ascension = position.right_ascension
+            while right_ascension < self.right_ascension[-1]:
+                right_ascension += 2 * pi
+            self.right_ascension.append(right_ascension)
+        self.declination = [position.declination for position in positions]
+        self.distance = [position.distance for position in positions]
+
+    def __call__(self, jd2000: float) -> Tuple[Radians, Radians, float]:
+        position = (jd2000 - self.start) / self.step
+        idx = min(max(int(position + 0.5), 1), len(self.declination) - 2)
+        p = (position - idx + 1) / 2.0
+        ra = self.right_ascension
+        dec = self.declination
+        dist = self.distance
+        return (
+            interpolate(ra[idx - 1], ra[idx], ra[idx + 1], p),
+            interpolate(dec[idx - 1], dec[idx], dec[idx + 1], p),
+            interpolate(dist[idx - 1], dist[idx], dist[idx + 1], p),
+        )
+
+
+def _above_horizon(
+    observer: Observer,
+    jd2000: float,
+    ephemeris: _MoonEphemeris,
+    elevation: Optional[float] = None,
+) -> float:
+    """A value which is positive when the moon is above an elevation and
+    negative when it is below.
+
+    When `elevation` is None the elevation is that of the top of the moon on
+    the horizon, as for :func:`riseset`. Otherwise it is the elevation in
+    degrees of the centre of the moon, corrected for parallax."""
+    right_ascension, declination, distance = ephemeris(jd2000)
+    hourangle = radians(_gmst(jd2000) + observer.longitude) - right_ascension
+    sl = sin(radians(observer.latitude))
+    cl = cos(radians(observer.latitude))
+    if elevation is None:
+        z = cos(radians(90 + MOON_APPARENT_RADIUS - (41.685 / distance)))
+    else:
+        z = cos(radians(90 - elevation - (41.685 / distance)))
+    return sl * sin(declination) + cl * cos(declination) * cos(hourangle) - z
+
+
+def _azimuth(observer: Observer, jd2000: float, ephemeris: _MoonEphemeris) -> Degrees:
+    """Calculate the moon's azimuth as :func:`azimuth` using the interpolated
+    position"""
+    right_ascension, declination, _ = ephemeris(jd2000)
+    hourangle = radians(_gmst(jd2000) + observer.longitude) - right_ascension
+    sl = sin(radians(observer.latitude))
+    cl = cos(radians(observer.latitude))
+    x = -cos(hourangle) * cos(declination) * sl + sin(declination) * cl
+    y = -sin(hourangle) * cos(declination)
+    return degrees(atan2(y, x)) % 360
+
+
+def moon_range(
+    observer: Observer,
+    start: datetime.date,
+    end: datetime.date,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> Dict[str, List[Any]]:
+    """Calculate the moon rise and set times and the phase for every date in a
+    range.
+
+    The rise and set times for each UTC date are found once and shared between
+    the moonrise and moonset of neighbouring local dates, so this is much faster
+    than calling :func:`moonrise` and :func:`moonset` for each date.
+
+    Args:
+        observer: Observer to calculate for
+        start:    First date to calculate for
+        end:      Last date to calculate for (inclusive)
+        tzinfo:   Timezone to return times in. Default is UTC.
+
+    Returns:
+        Dictionary with keys ``date``, ``moonrise``, ``moonset`` and ``phase``
+        whose values are lists with an entry for each date. Rise and set times
+        are ``None`` on dates where :func:`moonrise` or :func:`moonset` would
+        return ``None`` or raise an exception.
+    """
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    oneday = datetime.timedelta(days=1)
+    dates = []
+    date = start
+    while date <= end:
+        dates.append(date)
+        date += oneday
+
+    cache: Dict[datetime.date, Tuple[TransitTime, TransitTime]] = {}
+    return {
+        "date": dates,
+        "moonrise": [
+            _moon_event(observer, d, tzinfo, 0, cache)[0]  # type: ignore
+            for d in dates
+        ],
+        "moonset": [
+            _moon_event(observer, d, tzinfo, 1, cache)[0]  # type: ignore
+            for d in dates
+        ],
+        "phase": [phase(d) for d in dates],
+    }
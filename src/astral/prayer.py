@@ -0,0 +1,324 @@
+"""Islamic prayer times for ranges of dates and many sites.
+
+Calculates the times of Fajr, Sunrise, Dhuhr, Asr, Maghrib and Isha for every
+date in a range e.g. ::
+
+    from astral import prayer
+
+    times = prayer.prayer_times(
+        observer, start, end, convention="ISNA", tzinfo="America/New_York"
+    )
+    times["fajr"][0]
+
+Fajr and Isha are calculated from the depression of the sun given by a
+:class:`Convention`, Dhuhr is solar noon, Asr is when the length of an object's
+shadow is the length of its shadow at noon plus the object's height (or twice
+its height for :attr:`AsrMethod.HANAFI`) and Maghrib is sunset.
+
+The sun's declination and the equation of time are interpolated from values
+calculated once for the whole range, and shared between sites by
+:func:`prayer_times_sites`, so each time only takes a few arithmetic operations.
+
+At high latitudes the sun may not reach the depressions used for Fajr and Isha.
+A :class:`HighLatitudeRule` limits these to a portion of the night, which is
+the time between sunset and sunrise.
+"""
+
+import datetime
+from dataclasses import dataclass
+from enum import Enum
+from math import atan, cos, radians, sin, tan
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+from astral import LocationInfo, Observer, SunDirection
+from astral.julian import julianday
+from astral.sun import (
+    SUN_APPARENT_RADIUS,
+    _crossing_jd,
+    _InterpolatedEphemeris,
+    _noon_jd,
+    _transit_terms,
+)
+
+__all__ = [
+    "Convention",
+    "CONVENTIONS",
+    "AsrMethod",
+    "HighLatitudeRule",
+    "PRAYERS",
+    "prayer_times",
+    "prayer_times_sites",
+]
+
+PRAYERS = ("fajr", "sunrise", "dhuhr", "asr", "maghrib", "isha")
+
+# Julian day of the Unix epoch
+_JD_EPOCH = 2440587.5
+
+
+@dataclass(frozen=True)
+class Convention:
+    """The angles and intervals used to calculate the prayer times
+
+    Attributes:
+        fajr:         Depression of the sun in degrees at Fajr
+        isha:         Depression of the sun in degrees at Isha, or None if
+                      `isha_minutes` is used
+        isha_minutes: Minutes after Maghrib of Isha, if `isha` is None
+        maghrib:      Depression of the sun in degrees at Maghrib, or None for
+                      sunset
+    """
+
+    fajr: float
+    isha: Optional[float] = None
+    isha_minutes: Optional[float] = None
+    maghrib: Optional[float] = None
+
+
+CONVENTIONS: Dict[str, Convention] = {
+    "MWL": Convention(fajr=18.0, isha=17.0),
+    "ISNA": Convention(fajr=15.0, isha=15.0),
+    "Egypt": Convention(fajr=19.5, isha=17.5),
+    "Makkah": Convention(fajr=18.5, isha_minutes=90.0),
+    "Karachi": Convention(fajr=18.0, isha=18.0),
+    "Tehran": Convention(fajr=17.7, isha=14.0, maghrib=4.5),
+    "Jafari": Convention(fajr=16.0, isha=14.0, maghrib=4.0),
+}
+
+
+class AsrMethod(Enum):
+    """The length of an object's shadow at Asr, in addition to the length at
+    noon, as a multiple of the object's height"""
+
+    STANDARD = 1
+    HANAFI = 2
+
+
+class HighLatitudeRule(Enum):
+    """How Fajr and Isha are limited when the sun does not reach, or takes a long
+    time to reach, their depressions.
+
+    Fajr is no earlier than sunrise and Isha no later than sunset by a portion of
+    the night which is
+
+    * NONE - Not limited; the times are ``None`` if the depression is not reached
+    * MIDDLE_OF_NIGHT - Half of the night
+    * ONE_SEVENTH - A seventh of the night
+    * ANGLE_BASED - The depression divided by 60 e.g. 18 / 60 of the night
+    """
+
+    NONE = 0
+    MIDDLE_OF_NIGHT = 1
+    ONE_SEVENTH = 2
+    ANGLE_BASED = 3
+
+
+def _portion(rule: HighLatitudeRule, depression: float) -> Optional[float]:
+    if rule == HighLatitudeRule.MIDDLE_OF_NIGHT:
+        return 0.5
+    elif rule == HighLatitudeRule.ONE_SEVENTH:
+        return 1.0 / 7.0
+    elif rule == HighLatitudeRule.ANGLE_BASED:
+        return depression / 60.0
+    return None
+
+
+def _site_times(
+    observer: Observer,
+    days: List[float],
+    ephemeris: _InterpolatedEphemeris,
+    convention: Convention,
+    asr: AsrMethod,
+    high_latitude: HighLatitudeRule,
+) -> Dict[str, List[Optional[float]]]:
+    """Calculate the julian days of the prayers for each UTC day starting at the
+    julian days in `days`"""
+    longitude = observer.longitude
+    latitude = radians(observer.latitude)
+    sl = sin(latitude)
+    cl = cos(latitude)
+
+    horizon = _transit_terms(observer, 90.0 + SUN_APPARENT_RADIUS)
+    fajr_terms = _transit_terms(observer, 90.0 + convention.fajr)
+    isha_terms = None
+    if convention.isha is not None:
+        isha_terms = _transit_terms(observer, 90.0 + convention.isha)
+    maghrib_terms = None
+    if convention.maghrib is not None:
+        maghrib_terms = _transit_terms(observer, 90.0 + convention.maghrib)
+
+    fajr_portion = _portion(high_latitude, convention.fajr)
+    isha_portion = None
+    if convention.isha is not None:
+        isha_portion = _portion(high_latitude, convention.isha)
+
+    def crossing(
+        terms: Tuple[float, float, float], jd0: float, noon: float, direction
+    ) -> Optional[float]:
+        return _crossing_jd(jd0, noon, terms, longitude, direction, ephemeris)[0]
+
+    times: Dict[str, List[Optional[float]]] = {name: [] for name in PRAYERS}
+    for jd0 in days:
+        noon = _noon_jd(jd0, longitude, ephemeris)
+        sunrise = crossing(horizon, jd0, noon, SunDirection.RISING)
+        sunset = crossing(horizon, jd0, noon, SunDirection.SETTING)
+        fajr = crossing(fajr_terms, jd0, noon, SunDirection.RISING)
+
+        # The elevation at which the shadow is `asr` heights longer than at noon
+        declination = radians(ephemeris(noon)[0])
+        elevation = atan(1.0 / (asr.value + tan(abs(latitude - declination))))
+        asr_time = crossing((sl, cl, sin(elevation)), jd0, noon, SunDirection.SETTING)
+
+        if maghrib_terms is None:
+            maghrib = sunset
+        else:
+            maghrib = crossing(maghrib_terms, jd0, noon, SunDirection.SETTING)
+
+        if isha_terms is not None:
+            isha = crossing(isha_terms, jd0, noon, SunDirection.SETTING)
+        elif maghrib is not None and convention.isha_minutes is not None:
+            isha = maghrib + convention.isha_minutes / 1440.0
+        else:
+            isha = None
+
+        if sunrise is not None and sunset is not None:
+            night = 1.0 - (sunset - sunrise)
+            if fajr_portion is not None:
+                limit = sunrise - fajr_portion * night
+                if fajr is None or fajr < limit:
+                    fajr = limit
+            if isha_portion is not None:
+                limit = sunset + isha_portion * night
+                if isha is None or isha > limit:
+                    isha = limit
+
+        times["fajr"].append(fajr)
+        times["sunrise"].append(sunrise)
+        times["dhuhr"].append(noon)
+        times["asr"].append(asr_time)
+        times["maghrib"].append(maghrib)
+        times["isha"].append(isha)
+    return times
+
+
+def _to_datetime(
+    jd: Optional[float], tzinfo: datetime.tzinfo
+) -> Optional[datetime.datetime]:
+    if jd is None:
+        return None
+    return datetime.datetime.fromtimestamp((jd - _JD_EPOCH) * 86400.0, tzinfo)
+
+
+def _convention(convention: Union[str, Convention]) -> Convention:
+    if isinstance(convention, Convention):
+        return convention
+    try:
+        return CONVENTIONS[convention]
+    except KeyError:
+        raise ValueError(f"Unknown prayer time convention {convention!r}") from None
+
+
+def prayer_times_sites(
+    sites: Sequence[Union[Observer, LocationInfo]],
+    start: datetime.date,
+    end: datetime.date,
+    convention: Union[str, Convention] = "MWL",
+    asr: AsrMethod = AsrMethod.STANDARD,
+    high_latitude: HighLatitudeRule = HighLatitudeRule.ANGLE_BASED,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> List[Dict[str, List[Any]]]:
+    """Calculate the prayer times for every date in a range for several sites.
+
+    The sun's position is calculated once and shared between the sites.
+
+    Args:
+        sites:         The sites to calculate for. Times for a
+                       :class:`~astral.LocationInfo` are returned in its timezone
+                       and times for an :class:`~astral.Observer` in `tzinfo`.
+        start:         First date to calculate for
+        end:           Last date to calculate for (inclusive)
+        convention:    The name of one of the :data:`CONVENTIONS` or a
+                       :class:`Convention`
+        asr:           The method used to calculate Asr
+        high_latitude: The rule used to limit Fajr and Isha
+        tzinfo:        Timezone to return times in for observers. Default is UTC.
+
+    Returns:
+        A list with a dictionary for each site as returned by
+        :func:`prayer_times`.
+
+    Raises:
+        ValueError: if `end` is before `start`
+    """
+    if end < start:
+        raise ValueError("The end date is before the start date")
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    convention = _convention(convention)
+
+    oneday = datetime.timedelta(days=1)
+    dates = []
+    date = start
+    while date <= end:
+        dates.append(date)
+        date += oneday
+
+    days = [julianday(date) for date in dates]
+    ephemeris = _InterpolatedEphemeris(days[0] - 2.0, days[-1] + 3.0)
+
+    results = []
+    for site in sites:
+        if isinstance(site, LocationInfo):
+            observer = site.observer
+            site_tzinfo: datetime.tzinfo = site.tzinfo
+        else:
+            observer = site
+            site_tzinfo = tzinfo  # type: ignore
+
+        times = _site_times(observer, days, ephemeris, convention, asr, high_latitude)
+        result: Dict[str, List[Any]] = {"date": list(dates)}
+        for name in PRAYERS:
+            result[name] = [_to_datetime(jd, site_tzinfo) for jd in times[name]]
+        results.append(result)
+    return results
+
+
+def prayer_times(
+    observer: Observer,
+    start: datetime.date,
+    end: datetime.date,
+    convention: Union[str, Convention] = "MWL",
+    asr: AsrMethod = AsrMethod.STANDARD,
+    high_latitude: HighLatitudeRule = HighLatitudeRule.ANGLE_BASED,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> Dict[str, List[Any]]:
+    """Calculate the prayer times for every date in a range.
+
+    Args:
+        observer:      Observer to calculate the times for
+        start:         First date to calculate for
+        end:           Last date to calculate for (inclusive)
+        convention:    The name of one of the :data:`CONVENTIONS` or a
+                       :class:`Convention`
+        asr:           The method used to calculate Asr
+        high_latitude: The rule used to limit Fajr and Isha
+        tzinfo:        Timezone to return times in. Default is UTC.
+
+    Returns:
+        Dictionary with keys ``date``, ``fajr``, ``sunrise``, ``dhuhr``, ``asr``,
+        ``maghrib`` and ``isha`` whose values are lists with an entry for each
+        date. Times which cannot be calculated, such as sunrise during a polar
+        night, are ``None``.
+
+    Raises:
+        ValueError: if `end` is before `start`
+    """
+    return prayer_times_sites(
+        [observer], start, end, convention, asr, high_latitude, tzinfo
+    )[0]
@@ -0,0 +1,342 @@
+"""Find the next or previous solar event for an observer.
+
+Integrations which poll for the next sunrise or sunset can keep a
+:class:`SolarEventSchedule` for each observer instead of recalculating today's and
+tomorrow's events on every poll e.g. ::
+
+    from astral.schedule import SolarEventSchedule
+
+    schedule = SolarEventSchedule(observer, tzinfo="Europe/London")
+    event = schedule.next_event()
+    print(event.event, event.time)
+
+The schedule calculates the events a few days at a time as they are needed and
+keeps them in a sorted list, so each lookup is a binary search and only days which
+have not been seen before are calculated. Long running integrations can call
+:meth:`SolarEventSchedule.discard` now and then to forget the days which have
+passed.
+
+Events which do not occur on a day, such as sunrise during a polar night, are
+left out of the schedule so the next event is always one which happens.
+"""
+
+import datetime
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from heapq import merge
+from math import floor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+from astral import Depression, Observer, SunDirection
+from astral.sun import (
+    SUN_APPARENT_RADIUS,
+    _crossing_jd,
+    _InterpolatedEphemeris,
+    _noon_jd,
+    _transit_terms,
+)
+
+__all__ = ["EVENTS", "SolarEvent", "SolarEventSchedule"]
+
+EVENTS = ("dawn", "sunrise", "noon", "sunset", "dusk")
+
+# Julian day of the Unix epoch
+_JD_EPOCH = 2440587.5
+# An event belonging to a UTC day happens no more than this many seconds before
+# the start or after the end of the day, ignoring offsets
+_DAY_MARGIN = 0.55 * 86400.0
+
+
+@dataclass(frozen=True)
+class SolarEvent:
+    """A solar event in a :class:`SolarEventSchedule`
+
+    Attributes:
+        time:  The time of the event, including any offset
+        event: The name of the event e.g. ``sunset``
+    """
+
+    time: datetime.datetime
+    event: str
+
+
+class SolarEventSchedule:
+    """A lazily calculated, sorted list of an observer's solar events.
+
+    Args:
+        observer:   An observer viewing the sun at a specific, latitude, longitude
+                    and elevation
+        events:     The events to include, from ``dawn``, ``sunrise``, ``noon``,
+                    ``sunset`` and ``dusk``
+        offsets:    Time to add to each event, keyed by the event's name
+        depression: Depression to use to calculate dawn and dusk
+        tzinfo:     Timezone to return times in, and of naive datetimes passed
+                    in. Default is UTC.
+        chunk_days: The number of days to calculate each time the schedule is
+                    extended
+        max_days:   The number of days to search for an event before deciding
+                    that there is none
+    """
+
+    def __init__(
+        self,
+        observer: Observer,
+        events: Sequence[str] = EVENTS,
+        offsets: Optional[Dict[str, datetime.timedelta]] = None,
+        depression: Union[float, Depression] = Depression.CIVIL,
+        tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+        chunk_days: int = 7,
+        max_days: int = 366,
+    ):
+        if isinstance(tzinfo, str):
+            tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+        if isinstance(depression, Depression):
+            depression = depression.value
+
+        offsets = offsets or {}
+        for name in list(events) + list(offsets):
+            if name not in EVENTS:
+                raise ValueError(f"Unknown event {name!r}")
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be at least 1")
+
+        self.observer = observer
+        self.tzinfo: datetime.tzinfo = tzinfo  # type: ignore
+        self.chunk_days = chunk_days
+        self.max_days = max_days
+        self._events = tuple(events)
+        self._offsets = {
+            name: offsets.get(name, datetime.timedelta(0)).total_seconds()
+            for name in self._events
+        }
+
+        horizon = 90.0 + SUN_APPARENT_RADIUS
+        twilight = 90.0 + float(depression)
+        self._crossings: Dict[str, Tuple[Tuple[float, ...], SunDirection]] = {
+            "dawn": (_transit_terms(observer, twilight), SunDirection.RISING),
+            "sunrise": (_transit_terms(observer, horizon), SunDirection.RISING),
+            "sunset": (_transit_terms(observer, horizon), SunDirection.SETTING),
+            "dusk": (_transit_terms(observer, twilight), SunDirection.SETTING),
+        }
+
+        offset_values = list(self._offsets.values()) or [0.0]
+        self._early = min(min(offset_values), 0.0)
+        self._late = max(max(offset_values), 0.0)
+
+        self._times: List[float] = []
+        self._names: List[str] = []
+        # The UTC day, as a julian day number, each event belongs to
+        self._days: List[int] = []
+        # The range of UTC days, as julian day numbers, which have been calculated
+        self._first_day: Optional[int] = None
+        self._last_day: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def days(self) -> int:
+        """The number of days which have been calculated"""
+        if self._first_day is None or self._last_day is None:
+            return 0
+        return self._last_day - self._first_day + 1
+
+    def _timestamp(self, when: Optional[datetime.datetime]) -> float:
+        if when is None:
+            return datetime.datetime.now(datetime.timezone.utc).timestamp()
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=self.tzinfo)
+        return when.timestamp()
+
+    def _event(self, idx: int) -> SolarEvent:
+        return SolarEvent(
+            datetime.datetime.fromtimestamp(self._times[idx], self.tzinfo),
+            self._names[idx],
+        )
+
+    def _calculate(
+        self, first_day: int, last_day: int
+    ) -> List[Tuple[float, str, int]]:
+        """Calculate the events for a range of UTC days given as julian day
+        numbers"""
+        longitude = self.observer.longitude
+        ephemeris = _InterpolatedEphemeris(first_day - 1.5, last_day + 2.5)
+
+        events = []
+        for day in range(first_day, last_day + 1):
+            jd0 = day + 0.5
+            noon = _noon_jd(jd0, longitude, ephemeris)
+            for name in self._events:
+                if name == "noon":
+                    jd: Optional[float] = noon
+                else:
+                    terms, direction = self._crossings[name]
+                    jd, _ = _crossing_jd(
+                        jd0, noon, terms, longitude, direction, ephemeris
+                    )
+                if jd is not None:
+                    timestamp = (jd - _JD_EPOCH) * 86400.0 + self._offsets[name]
+                    events.append((timestamp, name, day))
+        return events
+
+    def _insert(self, events: List[Tuple[float, str, int]]) -> None:
+        events.sort()
+        if not self._times or events[0][0] >= self._times[-1]:
+            self._times.extend(event[0] for event in events)
+            self._names.extend(event[1] for event in events)
+            self._days.extend(event[2] for event in events)
+            return
+
+        # Only events near the ends of the calculated days can overlap so merge
+        # the two sorted lists rather than sorting them again
+        merged = list(merge(events, zip(self._times, self._names, self._days)))
+        self._times = [event[0] for event in merged]
+        self._names = [event[1] for event in merged]
+        self._days = [event[2] for event in merged]
+
+    def _extend(self, first_day: int, last_day: int) -> None:
+        """Calculate the days in a range which have not been calculated yet"""
+        if self._first_day is None or self._last_day is None:
+            self._insert(self._calculate(first_day, last_day))
+            self._first_day = first_day
+            self._last_day = last_day
+            return
+
+        events = []
+        if first_day < self._first_day:
+            events.extend(self._calculate(first_day, self._first_day - 1))
+            self._first_day = first_day
+        if last_day > self._last_day:
+            events.extend(self._calculate(self._last_day + 1, last_day))
+            self._last_day = last_day
+        if events:
+            self._insert(events)
+
+    def discard(self, before: Optional[datetime.datetime] = None) -> None:
+        """Forget the days which ended before a time.
+
+        The events are calculated again if they are needed later.
+
+        Args:
+            before: The time to keep the events after. Default is the current
+                    time.
+        """
+        self._discard(self._timestamp(before))
+
+    def _discard(self, timestamp: float) -> None:
+        if self._first_day is None or self._last_day is None:
+            return
+        # Keep the days whose events could still be at or after the time
+        first_day = self._day(timestamp - self._late - _DAY_MARGIN)
+        if first_day <= self._first_day:
+            return
+        if first_day > self._last_day:
+            self._times, self._names, self._days = [], [], []
+            self._first_day = self._last_day = None
+            return
+
+        keep = [idx for idx, day in enumerate(self._days) if day >= first_day]
+        self._times = [self._times[idx] for idx in keep]
+        self._names = [self._names[idx] for idx in keep]
+        self._days = [self._days[idx] for idx in keep]
+        self._first_day = first_day
+
+    def _day(self, timestamp: float) -> int:
+        return floor(timestamp / 86400.0 + _JD_EPOCH - 0.5)
+
+    def _safe_start(self) -> float:
+        """Events before this time may belong to days not calculated yet"""
+        assert self._first_day is not None
+        start = (self._first_day + 0.5 - _JD_EPOCH) * 86400.0
+        return start + _DAY_MARGIN + self._late
+
+    def _safe_end(self) -> float:
+        """Events after this time may belong to days not calculated yet"""
+        assert self._last_day is not None
+        end = (self._last_day + 1.5 - _JD_EPOCH) * 86400.0
+        return end - _DAY_MARGIN + self._early
+
+    def _cover(self, timestamp: float) -> None:
+        """Make sure all the events around a time have been calculated"""
+        day = self._day(timestamp)
+        margin = 1 + int((self._late - self._early) // 86400.0)
+        self._extend(day - margin, day + margin)
+        while self._safe_start() > timestamp:
+            assert self._first_day is not None
+            self._extend(self._first_day - self.chunk_days, self._first_day)
+        while self._safe_end() < timestamp:
+            assert self._last_day is not None
+            self._extend(self._last_day, self._last_day + self.chunk_days)
+
+    def next_event(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[SolarEvent]:
+        """Find the first event after a time.
+
+        Args:
+            now: The time to search from. Default is the current time.
+
+        Returns:
+            The first event after `now` or None if there is none in the next
+            `max_days` days.
+        """
+        timestamp = self._timestamp(now)
+        self._cover(timestamp)
+        limit = timestamp + self.max_days * 86400.0
+        while True:
+            idx = bisect_right(self._times, timestamp)
+            if idx < len(self._times) and self._times[idx] <= self._safe_end():
+                return self._event(idx)
+            if self._safe_end() > limit:
+                return None
+            assert self._last_day is not None
+            self._extend(self._last_day, self._last_day + self.chunk_days)
+
+    def previous_event(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Optional[SolarEvent]:
+        """Find the last event at or before a time.
+
+        Args:
+            now: The time to search from. Default is the current time.
+
+        Returns:
+            The last event at or before `now` or None if there is none in the
+            previous `max_days` days.
+        """
+        timestamp = self._timestamp(now)
+        self._cover(timestamp)
+        limit = timestamp - self.max_days * 86400.0
+        while True:
+            idx = bisect_right(self._times, timestamp) - 1
+            if idx >= 0 and self._times[idx] >= self._safe_start():
+                return self._event(idx)
+            if self._safe_start() < limit:
+                return None
+            assert self._first_day is not None
+            self._extend(self._first_day - self.chunk_days, self._first_day)
+
+    def events(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> List[SolarEvent]:
+        """Find the events between two times.
+
+        Args:
+            start: The start of the range, inclusive
+            end:   The end of the range, exclusive
+
+        Returns:
+            The events in time order.
+        """
+        start_ts = self._timestamp(start)
+        end_ts = self._timestamp(end)
+        self._cover(start_ts)
+        self._cover(end_ts)
+        lo = bisect_left(self._times, start_ts)
+        hi = bisect_left(self._times, end_ts)
+        return [self._event(idx) for idx in range(lo, hi)]
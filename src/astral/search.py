@@ -0,0 +1,238 @@
+"""Search index for the locations in a geocoder database.
+
+:func:`astral.geocoder.lookup` only finds exact location names. A
+:class:`LocationIndex` supports the kind of queries needed for
+autocompletion e.g. ::
+
+    from astral.geocoder import database
+    from astral.search import LocationIndex
+
+    index = LocationIndex(database())
+    index.prefix("lon")    # London, Lome, ...
+    index.fuzzy("londn")   # London
+    index.search("zuric")  # prefix matches followed by fuzzy matches
+
+Names are compared after removing accents, case and punctuation so ``"zurich"``
+finds ``"Zürich"``.
+"""
+
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Mapping, Set
+
+from astral import LocationInfo
+from astral.geocoder import GroupInfo, GroupName, all_locations
+
+__all__ = ["LocationIndex", "normalize"]
+
+# Length of the n-grams used to find candidates for fuzzy matching
+NGRAM = 3
+
+
+def normalize(text: str) -> str:
+    """Normalize a name for searching.
+
+    Accents are removed, the text is case folded and any runs of characters which
+    are not letters or digits are replaced by a single space.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    words = "".join(c if c.isalnum() else " " for c in stripped.casefold()).split()
+    return " ".join(words)
+
+
+def _ngrams(text: str) -> Set[str]:
+    padded = " " * (NGRAM - 1) + text + " " * (NGRAM - 1)
+    return {padded[idx : idx + NGRAM] for idx in range(len(padded) - NGRAM + 1)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Calculate the Levenshtein distance between two strings.
+
+    The calculation stops as soon as the distance is known to exceed `limit`, in
+    which case ``limit + 1`` is returned.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            value = min(
+                previous[j - 1] + (ca != cb),
+                previous[j] + 1,
+                current[j - 1] + 1,
+            )
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return limit + 1
+        previous = current
+
+    return min(previous[-1], limit + 1)
+
+
+class LocationIndex:
+    """An index of the locations in a database supporting prefix and fuzzy
+    name searches.
+
+    The index is built once from the database, which can be any database accepted
+    by :func:`astral.geocoder.all_locations`, and is not updated if locations are
+    added to the database afterwards.
+
+    Args:
+        db: The location database to index
+    """
+
+    def __init__(self, db: Mapping[GroupName, GroupInfo]):
+        self._locations: List[LocationInfo] = list(all_locations(db))
+
+        names: Dict[str, List[int]] = {}
+        for location_id, location in enumerate(self._locations):
+            names.setdefault(normalize(location.name), []).append(location_id)
+
+        # Unique normalized names in sorted order for prefix searches
+        self._names: List[str] = sorted(names)
+        self._name_locations: List[List[int]] = [names[n] for n in self._names]
+
+        # Every word after the first e.g. "york" for "new york", so that
+        # prefix searches also match the start of later words.
+        words = []
+        for name_id, name in enumerate(self._names):
+            start = name.find(" ")
+            while start != -1:
+                words.append((name[start + 1 :], name_id))
+                start = name.find(" ", start + 1)
+        words.sort()
+        self._words: List[str] = [word for word, _ in words]
+        self._word_names = array("I", [name_id for _, name_id in words])
+
+        postings: Dict[str, List[int]] = {}
+        by_length: Dict[int, List[int]] = {}
+        for name_id, name in enumerate(self._names):
+            for gram in _ngrams(name):
+                postings.setdefault(gram, []).append(name_id)
+            by_length.setdefault(len(name), []).append(name_id)
+        self._postings = {gram: array("I", ids) for gram, ids in postings.items()}
+        self._by_length = {size: array("I", ids) for size, ids in by_length.items()}
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def _expand(self, name_ids: Iterator[int], limit: int) -> List[LocationInfo]:
+        """Convert name ids to locations removing any duplicates"""
+        seen: Set[int] = set()
+        results: List[LocationInfo] = []
+        for name_id in name_ids:
+            for location_id in self._name_locations[name_id]:
+                if location_id not in seen:
+                    seen.add(location_id)
+                    results.append(self._locations[location_id])
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def _prefix_names(self, key: str) -> Iterator[int]:
+        """Name ids matching the prefix, best match first"""
+        idx = bisect_left(self._names, key)
+        if idx < len(self._names) and self._names[idx] == key:
+            yield idx
+            idx += 1
+
+        while idx < len(self._names) and self._names[idx].startswith(key):
+            yield idx
+            idx += 1
+
+        idx = bisect_left(self._words, key)
+        while idx < len(self._words) and self._words[idx].startswith(key):
+            yield self._word_names[idx]
+            idx += 1
+
+    def prefix(self, query: str, limit: int = 10) -> List[LocationInfo]:
+        """Find the locations whose name, or a word in their name, starts with
+        `query`.
+
+        Exact matches are returned first, followed by names starting with the
+        query then names with a later word starting with the query, each in
+        alphabetical order.
+
+        Args:
+            query: The start of the name to search for
+            limit: The maximum number of locations to return
+        """
+        key = normalize(query)
+        if not key:
+            return []
+        return self._expand(self._prefix_names(key), limit)
+
+    def _fuzzy_names(self, key: str, max_distance: int) -> List[int]:
+        """Name ids within `max_distance` edits of `key`, nearest first"""
+        grams = _ngrams(key)
+        # A name within k edits shares at least this many n-grams with the key
+        threshold = len(grams) - max_distance * NGRAM
+
+        candidates: Iterator[int]
+        if threshold > 0:
+            counts: Dict[int, int] = {}
+            for gram in grams:
+                for name_id in self._postings.get(gram, ()):
+                    counts[name_id] = counts.get(name_id, 0) + 1
+            candidates = (n for n, count in counts.items() if count >= threshold)
+        else:
+            candidates = (
+                name_id
+                for size in range(len(key) - max_distance, len(key) + max_distance + 1)
+                for name_id in self._by_length.get(size, ())
+            )
+
+        matches = []
+        for name_id in candidates:
+            distance = edit_distance(key, self._names[name_id], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, name_id))
+        matches.sort()
+        return [name_id for _, name_id in matches]
+
+    def fuzzy(
+        self, query: str, max_distance: int = 2, limit: int = 10
+    ) -> List[LocationInfo]:
+        """Find the locations whose name is within `max_distance` single
+        character edits (insertions, deletions or substitutions) of `query`.
+
+        Args:
+            query:        The name to search for
+            max_distance: The maximum number of edits allowed
+            limit:        The maximum number of locations to return
+
+        Returns:
+            The matching locations ordered by the number of edits and then by name.
+        """
+        key = normalize(query)
+        if not key:
+            return []
+        return self._expand(iter(self._fuzzy_names(key, max_distance)), limit)
+
+    def search(
+        self, query: str, max_distance: int = 2, limit: int = 10
+    ) -> List[LocationInfo]:
+        """Find locations matching `query` as a prefix, then fill any remaining
+        results with fuzzy matches.
+
+        Args:
+            query:        The text to search for
+            max_distance: The maximum number of edits allowed for fuzzy matches
+            limit:        The maximum number of locations to return
+        """
+        key = normalize(query)
+        if not key:
+            return []
+
+        def _name_ids() -> Iterator[int]:
+            yield from self._prefix_names(key)
+            yield from self._fuzzy_names(key, max_distance)
+
+        return self._expand(_name_ids(), limit)
@@ -8,8 +8,12 @@ Degrees = float
 
 def gmst(at: Union[datetime.datetime, datetime.date]) -> Degrees:
     """Calculate Greenwich Mean Sidereal Time in degrees"""
-    jd2000 = julianday_2000(at)
+    return _gmst(julianday_2000(at))
 
+
+def _gmst(jd2000: float) -> Degrees:
+    """Calculate Greenwich Mean Sidereal Time in degrees for the number of julian
+    days since Jan 1.5, 2000"""
     t0 = jd2000 / 36525
     value = (
         280.46061837
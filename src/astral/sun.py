@@ -1,6 +1,7 @@
 import datetime
-from math import acos, asin, atan2, cos, degrees, fabs, radians, sin, sqrt, tan
-from typing import Dict, Optional, Tuple, Union
+from enum import Enum
+from math import acos, asin, atan2, ceil, cos, degrees, fabs, radians, sin, sqrt, tan
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
     import zoneinfo
@@ -9,6 +10,9 @@ except ImportError:
 
 from astral import (
     Depression,
+    EventResult,
+    EventStatus,
+    HorizonProfile,
     Minutes,
     Observer,
     SunDirection,
@@ -19,6 +23,9 @@ from astral import (
 )
 from astral.julian import julianday, julianday_to_juliancentury
 
+if TYPE_CHECKING:
+    from astral.ephemeris import Ephemeris
+
 __all__ = [
     "sun",
     "dawn",
@@ -37,6 +44,21 @@ __all__ = [
     "azimuth",
     "elevation",
     "time_at_elevation",
+    "horizon_crossing",
+    "dawn_event",
+    "sunrise_event",
+    "sunset_event",
+    "dusk_event",
+    "time_at_elevation_event",
+    "horizon_crossing_event",
+    "sun_range",
+    "IlluminationSnapshot",
+    "illumination",
+    "SolarModel",
+    "set_solar_model",
+    "solar_model",
+    "transit_stats",
+    "reset_transit_stats",
 ]
 
 
@@ -59,6 +81,11 @@ def minutes_to_timedelta(minutes: float) -> datetime.timedelta:
     return datetime.timedelta(days=d, seconds=s, microseconds=us)
 
 
+def _localize(dt: datetime.datetime, tzinfo: datetime.tzinfo) -> datetime.datetime:
+    """Convert a UTC date and time to the timezone `tzinfo`"""
+    return dt.astimezone(tzinfo)
+
+
 def geom_mean_long_sun(juliancentury: float) -> float:
     """Calculate the geometric mean longitude of the sun"""
     l0 = 280.46646 + juliancentury * (36000.76983 + 0.0003032 * juliancentury)
@@ -187,6 +214,80 @@ def eq_of_time(juliancentury: float) -> Minutes:
     return degrees(Etime) * 4.0
 
 
+class SolarModel(Enum):
+    """The formulae used to calculate the sun's declination and the equation of
+    time"""
+
+    NOAA = "noaa"
+    """The NOAA solar calculator formulae"""
+    FAST = "fast"
+    """The U.S. Naval Observatory's approximate solar coordinates"""
+
+
+_solar_model = SolarModel.NOAA
+
+
+def set_solar_model(model: Union[SolarModel, str] = SolarModel.NOAA) -> None:
+    """Select the formulae used by the functions in this module to calculate the
+    sun's declination and the equation of time.
+
+    :attr:`SolarModel.FAST` uses the U.S. Naval Observatory's approximate solar
+    coordinates, a mean anomaly and longitude with a two term equation of
+    centre, which takes about a third of the time of the NOAA formulae, making
+    :func:`sun` about a quarter faster. The largest differences from the NOAA
+    formulae found by ``src/bench/bench_sun_model.py`` between 1900 and 2100,
+    with events every day at latitudes of 0°, 40° and 60°, are
+
+    ==================  ===========
+    Declination         0.3'
+    Equation of time    3.8 seconds
+    Noon                4 seconds
+    Sunrise and sunset  5 seconds
+    Dawn and dusk       8 seconds
+    ==================  ===========
+
+    Events which are close to midnight can also move to the neighbouring day,
+    and where the sun only just reaches the elevation of an event the time can
+    change by more.
+
+    The model applies to every calculation in this module in the process.
+    Results cached by :class:`~astral.location.Location` and stored by
+    :mod:`astral.cache` are kept separately for each model.
+
+    Args:
+        model: The model to use. Default is :attr:`SolarModel.NOAA`.
+    """
+    global _solar_model
+
+    _solar_model = SolarModel(model)
+
+
+def solar_model() -> SolarModel:
+    """The model set by :func:`set_solar_model`"""
+    return _solar_model
+
+
+def _fast_solar_terms(juliancentury: float) -> Tuple[float, Minutes]:
+    """Calculate the sun's declination and the equation of time with the U.S.
+    Naval Observatory's approximate solar coordinates"""
+    n = juliancentury * 36525.0
+    g = radians(357.529 + 0.98560028 * n)
+    q = 280.459 + 0.98564736 * n
+    lambd = radians(q + 1.915 * sin(g) + 0.020 * sin(2.0 * g))
+    e = radians(23.439 - 0.00000036 * n)
+    right_ascension = degrees(atan2(cos(e) * sin(lambd), cos(lambd)))
+    declination = degrees(asin(sin(e) * sin(lambd)))
+    return declination, ((q - right_ascension + 180.0) % 360.0 - 180.0) * 4.0
+
+
+def _solar_terms(juliancentury: float) -> Tuple[float, Minutes]:
+    """Calculate the sun's declination and the equation of time with the selected
+    model"""
+    if _solar_model is SolarModel.FAST:
+        return _fast_solar_terms(juliancentury)
+    return sun_declination(juliancentury), eq_of_time(juliancentury)
+
+
 def hour_angle(
     latitude: float, declination: float, zenith: float, direction: SunDirection
 ) -> float:
@@ -250,29 +351,64 @@ def adjust_to_obscuring_feature(elevation: Tuple[float, float]) -> float:
     )
 
 
-def time_of_transit(
-    observer: Observer,
-    date: datetime.date,
-    zenith: float,
-    direction: SunDirection,
-    with_refraction: bool = True,
-) -> datetime.datetime:
-    """Calculate the time in the UTC timezone when the sun transits the
-    specificed zenith
+# A precalculated ephemeris installed by astral.ephemeris.install
+_shared_ephemeris: Optional["Ephemeris"] = None
 
-    Args:
-        observer: An observer viewing the sun at a specific, latitude, longitude
-            and elevation
-        date: The date to calculate for
-        zenith: The zenith angle for which to calculate the transit time
-        direction: The direction that the sun is traversing
 
-    Raises:
-        ValueError if the zenith is not transitted by the sun
+def _ephemeris(jd: float) -> Tuple[float, Minutes]:
+    """Calculate the sun's declination and the equation of time for a julian day,
+    or interpolate them from the installed shared ephemeris if it covers the
+    day and was calculated with the selected model"""
+    shared = _shared_ephemeris
+    if shared is not None and shared.solar_model is _solar_model:
+        value = shared.sun(jd)
+        if value is not None:
+            return value
+    return _solar_terms(julianday_to_juliancentury(jd))
 
-    Returns:
-        the time when the sun transits the specificed zenith
+
+def _interpolate(f0: float, f1: float, f2: float, p: float) -> float:
+    """3-point interpolation where f0, f1 and f2 are at p = 0, 0.5 and 1"""
+    a = f1 - f0
+    b = f2 - f1 - a
+    return f0 + p * (2 * a + b * (2 * p - 1))
+
+
+class _InterpolatedEphemeris:
+    """The sun's declination and the equation of time calculated at intervals of
+    `step` days between two julian days and interpolated between them.
+
+    Both change slowly so this is much faster than :func:`_ephemeris` when many
+    times are calculated over a range of dates, with differences of well under a
+    second in the times calculated.
     """
+
+    def __init__(self, start: float, end: float, step: float = 1.0):
+        self.start = start
+        self.step = step
+        count = int(ceil((end - start) / step)) + 1
+        values = [_ephemeris(start + idx * step) for idx in range(max(count, 3))]
+        self.declination = [value[0] for value in values]
+        self.eqtime = [value[1] for value in values]
+
+    def __call__(self, jd: float) -> Tuple[float, Minutes]:
+        position = (jd - self.start) / self.step
+        idx = min(max(int(position + 0.5), 1), len(self.declination) - 2)
+        p = (position - idx + 1) / 2.0
+        dec = self.declination
+        eqt = self.eqtime
+        return (
+            _interpolate(dec[idx - 1], dec[idx], dec[idx + 1], p),
+            _interpolate(eqt[idx - 1], eqt[idx], eqt[idx + 1], p),
+        )
+
+
+def _transit_terms(
+    observer: Observer, zenith: float, with_refraction: bool = True
+) -> Tuple[float, float, float]:
+    """Calculate the sine and cosine of the observer's latitude and the cosine of
+    the zenith, adjusted for the observer's elevation and for refraction, used to
+    find the hour angle at which the sun transits the zenith."""
     if observer.latitude > 89.8:
         latitude = 89.8
     elif observer.latitude < -89.8:
@@ -293,36 +429,385 @@ def time_of_transit(
     else:
         adjustment_for_refraction = 0.0
 
-    jd = julianday(date)
-    adjustment = 0.0
-    timeUTC = 0.0
+    latitude_rad = radians(latitude)
+    return (
+        sin(latitude_rad),
+        cos(latitude_rad),
+        cos(radians(zenith + adjustment_for_elevation + adjustment_for_refraction)),
+    )
 
-    for _ in range(2):
-        jc = julianday_to_juliancentury(jd + adjustment)
-        declination = sun_declination(jc)
 
-        hourangle = hour_angle(
-            latitude,
-            declination,
-            zenith + adjustment_for_elevation + adjustment_for_refraction,
-            direction,
-        )
+def _noon_jd(
+    jd0: float, longitude: float, ephemeris: Callable[[float], Tuple[float, Minutes]]
+) -> float:
+    """Calculate the julian day of solar noon on the UTC day starting at the
+    julian day `jd0`"""
+    eqtime = ephemeris(jd0 + 0.5 - longitude / 360.0)[1]
+    return jd0 + (720.0 - 4.0 * longitude - eqtime) / 1440.0
+
+
+# The default largest correction, in seconds, which the iteration in _transit is
+# estimated to have left, and the default most iterations
+TRANSIT_TOLERANCE = 0.1
+TRANSIT_MAX_ITERATIONS = 10
+
+# The fastest the sun's declination (degrees) and the equation of time
+# (minutes) change, per minute
+_DECLINATION_RATE = 0.41 / 1440.0
+_EQTIME_RATE = 0.55 / 1440.0
+
+
+def _converged(
+    correction: Minutes,
+    h: float,
+    declination_rad: float,
+    sl: float,
+    cl: float,
+    tolerance: Minutes,
+) -> bool:
+    """Whether the next correction to the time of a transit is estimated to be
+    less than `tolerance`, given the last `correction`, the cosine of the hour
+    angle `h` and the declination it was calculated with.
+
+    Each correction is smaller than the last by the rate at which the time of the
+    transit changes with the time the sun's position is calculated for, found from
+    the change in the hour angle with the declination.
+    """
+    if h * h < 1.0:
+        dh = h * tan(declination_rad) - sl / (cl * cos(declination_rad))
+        rate = 4.0 * fabs(dh) / sqrt(1.0 - h * h) * _DECLINATION_RATE
+        return correction * (rate + _EQTIME_RATE) < tolerance
+    return correction < tolerance
+
+
+def _crossing_jd(
+    jd0: float,
+    noon: float,
+    terms: Tuple[float, float, float],
+    longitude: float,
+    direction: SunDirection,
+    ephemeris: Callable[[float], Tuple[float, Minutes]],
+    tolerance: float = TRANSIT_TOLERANCE,
+    max_iterations: int = TRANSIT_MAX_ITERATIONS,
+) -> Tuple[Optional[float], int]:
+    """Calculate the julian day at which the sun transits a zenith on the solar
+    day with its noon at `noon`, iterating from noon as :func:`_transit` does.
 
-        delta = -observer.longitude - degrees(hourangle)
+    Args:
+        jd0:       Julian day of the start of the UTC day of the noon
+        noon:      Julian day of solar noon
+        terms:     The terms returned by :func:`_transit_terms` for the zenith
+        longitude: Longitude of the observer
+        direction: Whether to find the time before (rising) or after (setting)
+                   noon
+        ephemeris: Function returning the sun's declination and the equation of
+                   time for a julian day
+        tolerance: The largest correction, in seconds, which is estimated to be
+                   left when the iteration stops
+        max_iterations: The most iterations
+
+    Returns:
+        The julian day or None if the zenith is not transitted, and 0 when it is,
+        -1 when the sun is always above the zenith and 1 when it is always below.
+    """
+    sl, cl, cz = terms
+    sign = -1.0 if direction == SunDirection.RISING else 1.0
+    tolerance_minutes = tolerance / 60.0
+    jd = noon
+    for _ in range(max_iterations):
+        declination, eqtime = ephemeris(jd)
+        declination_rad = radians(declination)
+        h = (cz - sl * sin(declination_rad)) / (cl * cos(declination_rad))
+        if h > 1.0:
+            return None, 1
+        elif h < -1.0:
+            return None, -1
+        hourangle = degrees(acos(h))
+        previous = jd
+        jd = jd0 + (720.0 - 4.0 * (longitude - sign * hourangle) - eqtime) / 1440.0
+        correction = fabs(jd - previous) * 1440.0
+        if _converged(correction, h, declination_rad, sl, cl, tolerance_minutes):
+            break
+    return jd, 0
+
+
+_transit_stats: Dict[str, int] = {
+    "calls": 0,
+    "warm_starts": 0,
+    "iterations": 0,
+    "max_iterations": 0,
+    "unconverged": 0,
+}
+
+
+def transit_stats() -> Dict[str, int]:
+    """Statistics of the iterations used to find the times the sun transits a
+    zenith, for dawn, sunrise, sunset, dusk, :func:`time_at_elevation` and
+    :func:`time_of_transit`.
+
+    Returns:
+        A dictionary of the number of ``calls``, the number of those which were
+        given a starting time (``warm_starts``), the total number of
+        ``iterations``, the largest number of iterations used by a call
+        (``max_iterations``) and the number of calls which stopped at the
+        iteration limit before the tolerance was reached (``unconverged``).
+    """
+    return dict(_transit_stats)
+
+
+def reset_transit_stats() -> None:
+    """Set the statistics returned by :func:`transit_stats` to zero"""
+    for key in _transit_stats:
+        _transit_stats[key] = 0
+
+
+def _transit(
+    observer: Observer,
+    date: datetime.date,
+    zenith: float,
+    direction: SunDirection,
+    with_refraction: bool = True,
+    ephemeris: Callable[[float], Tuple[float, Minutes]] = _ephemeris,
+    tolerance: float = TRANSIT_TOLERANCE,
+    max_iterations: int = TRANSIT_MAX_ITERATIONS,
+    guess: Optional[Minutes] = None,
+) -> EventResult:
+    """Calculate the time in the UTC timezone when the sun transits the
+    specificed zenith, or whether the sun is always above or below it.
+
+    The time is found by calculating the sun's position at a time, the time of
+    the transit for that position and repeating with the new time. Each
+    correction is smaller than the last by the rate at which the time of the
+    transit changes with the time the position is calculated for, so the
+    iteration stops when the next correction is estimated to be less than
+    `tolerance` seconds. The first time is the start of the day or `guess`, in
+    minutes after the start of the UTC day, e.g. the previous day's transit.
+
+    The argument to the arc cosine in the hour angle calculation is checked
+    before taking it so that an unreachable zenith is reported without raising
+    an exception.
+    """
+    sl, cl, cz = _transit_terms(observer, zenith, with_refraction)
 
-        eqtime = eq_of_time(jc)
+    jd = julianday(date)
+    timeUTC = 0.0 if guess is None else guess
+    tolerance_minutes = tolerance / 60.0
+
+    stats = _transit_stats
+    stats["calls"] += 1
+    if guess is not None:
+        stats["warm_starts"] += 1
+
+    iteration = 0
+    while True:
+        iteration += 1
+        declination, eqtime = ephemeris(jd + timeUTC / 1440.0)
+        declination_rad = radians(declination)
+
+        h = (cz - sl * sin(declination_rad)) / (cl * cos(declination_rad))
+        if h > 1.0:
+            stats["iterations"] += iteration
+            return EventResult(EventStatus.ALWAYS_BELOW)
+        elif h < -1.0:
+            stats["iterations"] += iteration
+            return EventResult(EventStatus.ALWAYS_ABOVE)
+
+        hourangle = acos(h)
+        if direction == SunDirection.SETTING:
+            hourangle = -hourangle
+
+        delta = -observer.longitude - degrees(hourangle)
         offset = delta * 4.0 - eqtime
 
         if offset < -720.0:
             offset += 1440
 
+        correction = fabs(720.0 + offset - timeUTC)
         timeUTC = 720.0 + offset
-        adjustment = timeUTC / 1440.0
+
+        if _converged(correction, h, declination_rad, sl, cl, tolerance_minutes):
+            break
+
+        if iteration >= max_iterations:
+            stats["unconverged"] += 1
+            break
+
+    stats["iterations"] += iteration
+    if iteration > stats["max_iterations"]:
+        stats["max_iterations"] = iteration
 
     td = minutes_to_timedelta(timeUTC)
     dt = datetime.datetime(date.year, date.month, date.day) + td
     dt = dt.replace(tzinfo=datetime.timezone.utc)  # pylint: disable=E1120
-    return dt
+    return EventResult(EventStatus.OCCURS, dt)
+
+
+def _guess_minutes(
+    guess: Optional[datetime.datetime], date: datetime.date
+) -> Optional[Minutes]:
+    """Convert a time to minutes after the start of the UTC day `date`"""
+    if guess is None:
+        return None
+    if guess.tzinfo is None:
+        guess = guess.replace(tzinfo=datetime.timezone.utc)
+    start = datetime.datetime(
+        date.year, date.month, date.day, tzinfo=datetime.timezone.utc
+    )
+    return (guess - start).total_seconds() / 60.0
+
+
+def time_of_transit(
+    observer: Observer,
+    date: datetime.date,
+    zenith: float,
+    direction: SunDirection,
+    with_refraction: bool = True,
+    tolerance: float = TRANSIT_TOLERANCE,
+    max_iterations: int = TRANSIT_MAX_ITERATIONS,
+    guess: Optional[datetime.datetime] = None,
+) -> datetime.datetime:
+    """Calculate the time in the UTC timezone when the sun transits the
+    specificed zenith
+
+    Args:
+        observer: An observer viewing the sun at a specific, latitude, longitude
+            and elevation
+        date: The date to calculate for
+        zenith: The zenith angle for which to calculate the transit time
+        direction: The direction that the sun is traversing
+        tolerance: The largest correction in seconds which is estimated to be
+            left when the iteration stops
+        max_iterations: The most iterations to make
+        guess: A time close to the transit to start from, such as the previous
+            day's transit plus a day. Naive times are in UTC. Default is the
+            start of the day.
+
+    Raises:
+        ValueError if the zenith is not transitted by the sun
+
+    Returns:
+        the time when the sun transits the specificed zenith
+    """
+    result = _transit(
+        observer,
+        date,
+        zenith,
+        direction,
+        with_refraction,
+        tolerance=tolerance,
+        max_iterations=max_iterations,
+        guess=_guess_minutes(guess, date),
+    )
+    if result.time is None:
+        raise ValueError("math domain error")
+    return result.time
+
+
+def _transit_on_date(
+    observer: Observer,
+    date: datetime.date,
+    zenith: float,
+    direction: SunDirection,
+    tzinfo: datetime.tzinfo,
+    ephemeris: Callable[[float], Tuple[float, Minutes]] = _ephemeris,
+    guess: Optional[datetime.datetime] = None,
+) -> EventResult:
+    """Find the transit of the zenith which occurs on the local date, searching
+    on the next or previous day if the transit for the date falls on another
+    local date.
+
+    The time found for the first day is used as the starting time for the
+    adjacent day, as the transits on neighbouring days are at similar times of
+    day."""
+    result = _transit(
+        observer,
+        date,
+        zenith,
+        direction,
+        True,
+        ephemeris,
+        guess=_guess_minutes(guess, date),
+    )
+    if result.time is None:
+        return result
+
+    tot = _localize(result.time, tzinfo)
+    tot_date = tot.date()
+    if tot_date != date:
+        if tot_date < date:
+            delta = datetime.timedelta(days=1)
+        else:
+            delta = datetime.timedelta(days=-1)
+
+        result = _transit(
+            observer,
+            date + delta,
+            zenith,
+            direction,
+            True,
+            ephemeris,
+            guess=_guess_minutes(result.time + delta, date + delta),
+        )
+        if result.time is None:
+            return result
+
+        tot = _localize(result.time, tzinfo)
+        if tot.date() != date:
+            return EventResult(EventStatus.NOT_ON_DATE)
+    return EventResult(EventStatus.OCCURS, tot)
+
+
+def _horizon_error(result: EventResult, event: str) -> ValueError:
+    if result.status == EventStatus.ALWAYS_ABOVE:
+        msg = "Sun is always above the horizon on this day, at this location."
+    elif result.status == EventStatus.ALWAYS_BELOW:
+        msg = "Sun is always below the horizon on this day, at this location."
+    else:
+        msg = f"Unable to find a {event} time on the date specified"
+    return ValueError(msg)
+
+
+def _depression_error(result: EventResult, event: str, dep: float) -> ValueError:
+    if result.status == EventStatus.NOT_ON_DATE:
+        return ValueError(f"Unable to find a {event} time on the date specified")
+    return ValueError(
+        f"Sun never reaches {dep} degrees below the horizon, at this location."
+    )
+
+
+def time_at_elevation_event(
+    observer: Observer,
+    elevation: float,
+    date: Optional[datetime.date] = None,
+    direction: SunDirection = SunDirection.RISING,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+    with_refraction: bool = True,
+) -> EventResult:
+    """Calculates the time when the sun is at the specified elevation without
+    raising an exception if it never is.
+
+    Takes the same arguments as :func:`time_at_elevation`.
+
+    Returns:
+        The time at which the sun is at the elevation, or a status of
+        ``ALWAYS_ABOVE`` or ``ALWAYS_BELOW`` if the sun does not reach it.
+    """
+    if elevation > 90.0:
+        elevation = 180.0 - elevation
+        direction = SunDirection.SETTING
+
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    if date is None:
+        date = today(tzinfo)  # type: ignore
+
+    result = _transit(observer, date, 90 - elevation, direction, with_refraction)
+    if result.time is None:
+        return result
+    return EventResult(
+        EventStatus.OCCURS, _localize(result.time, tzinfo)  # type: ignore
+    )
 
 
 def time_at_elevation(
@@ -356,59 +841,192 @@ def time_at_elevation(
     Returns:
         Date and time at which the sun is at the specified elevation.
     """
+    result = time_at_elevation_event(
+        observer, elevation, date, direction, tzinfo, with_refraction
+    )
+    if result.time is None:
+        if elevation > 90.0:
+            elevation = 180.0 - elevation
+        raise ValueError(
+            f"Sun never reaches an elevation of {elevation} degrees "
+            "at this location."
+        )
+    return result.time
 
-    if elevation > 90.0:
-        elevation = 180.0 - elevation
-        direction = SunDirection.SETTING
 
+def horizon_crossing_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    direction: SunDirection = SunDirection.RISING,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+    profile: Optional[HorizonProfile] = None,
+    resolution: Minutes = 5.0,
+) -> EventResult:
+    """Calculate the time when the top of the sun first clears (rising) or last
+    drops below (setting) a horizon profile on the specified date, without
+    raising an exception if it does not.
+
+    The sun's path across the sky is calculated at intervals of `resolution`
+    minutes throughout the day to find the interval in which the crossing
+    occurs, and the time is then refined to within a second.
+
+    Args:
+        observer:   Observer to calculate for
+        date:       Date to calculate for. Default is today's date in the
+                    timezone `tzinfo`.
+        direction:  Use ``SunDirection.RISING`` for the first time the sun
+                    clears the profile or ``SunDirection.SETTING`` for the last
+                    time it drops below the profile.
+        tzinfo:     Timezone to return times in. Default is UTC.
+        profile:    The horizon profile. Default is the observer's elevation if it
+                    is a :class:`~astral.HorizonProfile` else a flat horizon.
+        resolution: Minutes between the calculated positions of the sun. A gap
+                    in the profile which the sun passes in less time than this
+                    may be missed.
+
+    Returns:
+        The time at which the sun crosses the horizon profile, or a status of
+        ``ALWAYS_ABOVE`` or ``ALWAYS_BELOW`` if the sun stays on one side of the
+        profile all day and ``NOT_ON_DATE`` if it only crosses in the other
+        direction.
+    """
     if isinstance(tzinfo, str):
         tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
 
     if date is None:
         date = today(tzinfo)  # type: ignore
+    elif isinstance(date, datetime.datetime):
+        tzinfo = date.tzinfo or tzinfo
+        date = date.date()
 
-    zenith = 90 - elevation
-    try:
-        return time_of_transit(
-            observer, date, zenith, direction, with_refraction
-        ).astimezone(
-            tzinfo  # type: ignore
-        )
-    except ValueError as exc:
-        if exc.args[0] == "math domain error":
-            raise ValueError(
-                f"Sun never reaches an elevation of {elevation} degrees "
-                "at this location."
-            ) from exc
+    horizon: HorizonProfile
+    if profile is not None:
+        horizon = profile
+    elif isinstance(observer.elevation, HorizonProfile):
+        horizon = observer.elevation
+    else:
+        horizon = HorizonProfile()
+
+    next_date = date + datetime.timedelta(days=1)
+    start = datetime.datetime(date.year, date.month, date.day, tzinfo=tzinfo)
+    start = start.astimezone(datetime.timezone.utc)
+    end = datetime.datetime(
+        next_date.year, next_date.month, next_date.day, tzinfo=tzinfo
+    )
+    span = (end - start).total_seconds() / 60.0
+
+    # The declination and equation of time change slowly so they are calculated
+    # at the start, middle and end of the day and interpolated between them.
+    jd = julianday(start)
+    jcs = [julianday_to_juliancentury(jd + span * f / 1440.0) for f in (0, 0.5, 1)]
+    terms = [_solar_terms(jc) for jc in jcs]
+    declination = [radians(value) for value, _ in terms]
+    eqtime = [value for _, value in terms]
+
+    latitude = radians(max(min(observer.latitude, 89.8), -89.8))
+    sl = sin(latitude)
+    cl = cos(latitude)
+    start_minutes = start.hour * 60.0 + start.minute + start.second / 60.0
+
+    def clearance(minutes: float) -> float:
+        """The angle of the top of the sun above the profile"""
+        p = minutes / span
+        dec = _interpolate(declination[0], declination[1], declination[2], p)
+        eqt = _interpolate(eqtime[0], eqtime[1], eqtime[2], p)
+        true_solar_time = start_minutes + minutes + eqt + 4.0 * observer.longitude
+        hourangle = radians(true_solar_time / 4.0 - 180.0)
+
+        sd = sin(dec)
+        cd = cos(dec)
+        ch = cos(hourangle)
+        elevation = degrees(asin(max(min(sl * sd + cl * cd * ch, 1.0), -1.0)))
+        azimuth = degrees(atan2(sin(hourangle), ch * sl - sd / cd * cl)) + 180.0
+
+        # Refraction is calculated at the horizon's altitude, as in time_of_transit
+        altitude = horizon.altitude(azimuth) - SUN_APPARENT_RADIUS
+        return elevation - altitude + refraction_at_zenith(90.0 - altitude)
+
+    steps = max(int(ceil(span / resolution)), 1)
+    times = [span * idx / steps for idx in range(steps + 1)]
+    path = [clearance(t) for t in times]
+
+    if direction == SunDirection.RISING:
+        crossings = [idx for idx in range(steps) if path[idx] < 0.0 <= path[idx + 1]]
+    else:
+        crossings = [idx for idx in range(steps) if path[idx + 1] < 0.0 <= path[idx]]
+    if not crossings:
+        if all(value >= 0.0 for value in path):
+            return EventResult(EventStatus.ALWAYS_ABOVE)
+        elif all(value < 0.0 for value in path):
+            return EventResult(EventStatus.ALWAYS_BELOW)
+        return EventResult(EventStatus.NOT_ON_DATE)
+
+    idx = crossings[0] if direction == SunDirection.RISING else crossings[-1]
+    low, high = times[idx], times[idx + 1]
+    low_below = path[idx] < 0.0
+    while high - low > 1.0 / 60.0:
+        mid = (low + high) / 2.0
+        if (clearance(mid) < 0.0) == low_below:
+            low = mid
         else:
-            raise
+            high = mid
 
+    crossing = start + datetime.timedelta(minutes=(low + high) / 2.0)
+    return EventResult(
+        EventStatus.OCCURS, crossing.astimezone(tzinfo)  # type: ignore
+    )
 
-def noon(
+
+def horizon_crossing(
     observer: Observer,
     date: Optional[datetime.date] = None,
+    direction: SunDirection = SunDirection.RISING,
     tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+    profile: Optional[HorizonProfile] = None,
+    resolution: Minutes = 5.0,
 ) -> datetime.datetime:
-    """Calculate solar noon time when the sun is at its highest point.
+    """Calculate the time when the top of the sun first clears (rising) or last
+    drops below (setting) a horizon profile on the specified date.
+
+    The sun's path across the sky is calculated at intervals of `resolution`
+    minutes throughout the day to find the interval in which the crossing
+    occurs, and the time is then refined to within a second.
 
     Args:
-        observer: An observer viewing the sun at a specific, latitude, longitude
-                  and elevation
-        date:     Date to calculate for. Default is today for the specified tzinfo.
-        tzinfo:   Timezone to return times in. Default is UTC.
+        observer:   Observer to calculate for
+        date:       Date to calculate for. Default is today's date in the
+                    timezone `tzinfo`.
+        direction:  Use ``SunDirection.RISING`` for the first time the sun
+                    clears the profile or ``SunDirection.SETTING`` for the last
+                    time it drops below the profile.
+        tzinfo:     Timezone to return times in. Default is UTC.
+        profile:    The horizon profile. Default is the observer's elevation if it
+                    is a :class:`~astral.HorizonProfile` else a flat horizon.
+        resolution: Minutes between the calculated positions of the sun. A gap
+                    in the profile which the sun passes in less time than this
+                    may be missed.
 
     Returns:
-        Date and time at which noon occurs.
+        Date and time at which the sun crosses the horizon profile.
+
+    Raises:
+        ValueError: if the sun does not cross the profile on the specified date
     """
-    if isinstance(tzinfo, str):
-        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+    result = horizon_crossing_event(
+        observer, date, direction, tzinfo, profile, resolution
+    )
+    if result.time is None:
+        event = "sunrise" if direction == SunDirection.RISING else "sunset"
+        raise _horizon_error(result, event)
+    return result.time
 
-    if date is None:
-        date = today(tzinfo)  # type: ignore
 
-    jc = julianday_to_juliancentury(julianday(date))
-    eqtime = eq_of_time(jc)
-    timeUTC = (720.0 - (4 * observer.longitude) - eqtime) / 60.0
+def _noon_utc(
+    date: datetime.date, longitude: float, eqtime: Minutes
+) -> datetime.datetime:
+    """Calculate the time of solar noon in the UTC timezone from the equation of
+    time at the start of the date"""
+    timeUTC = (720.0 - (4 * longitude) - eqtime) / 60.0
 
     hour = int(timeUTC)
     minute = int((timeUTC - hour) * 60)
@@ -435,7 +1053,7 @@ def noon(
         hour += 24
         date -= datetime.timedelta(days=1)
 
-    noon = datetime.datetime(
+    return datetime.datetime(
         date.year,
         date.month,
         date.day,
@@ -444,7 +1062,33 @@ def noon(
         second,
         tzinfo=datetime.timezone.utc,
     )
-    return noon.astimezone(tzinfo)  # type: ignore # pylint: disable=E1120
+
+
+def noon(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> datetime.datetime:
+    """Calculate solar noon time when the sun is at its highest point.
+
+    Args:
+        observer: An observer viewing the sun at a specific, latitude, longitude
+                  and elevation
+        date:     Date to calculate for. Default is today for the specified tzinfo.
+        tzinfo:   Timezone to return times in. Default is UTC.
+
+    Returns:
+        Date and time at which noon occurs.
+    """
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    if date is None:
+        date = today(tzinfo)  # type: ignore
+
+    jc = julianday_to_juliancentury(julianday(date))
+    noon = _noon_utc(date, observer.longitude, _solar_terms(jc)[1])
+    return _localize(noon, tzinfo)  # type: ignore
 
 
 def midnight(
@@ -478,7 +1122,7 @@ def midnight(
     jd = julianday(datetime.datetime.combine(date, midday))
     newt = julianday_to_juliancentury(jd + 0.5 + -observer.longitude / 360.0)
 
-    eqtime = eq_of_time(newt)
+    eqtime = _solar_terms(newt)[1]
     timeUTC = (-observer.longitude * 4.0) - eqtime
 
     timeUTC = timeUTC / 60.0
@@ -513,7 +1157,7 @@ def midnight(
         second,
         tzinfo=datetime.timezone.utc,
     )
-    return midnight.astimezone(tzinfo)  # type: ignore
+    return _localize(midnight, tzinfo)  # type: ignore
 
 
 def zenith_and_azimuth(
@@ -539,8 +1183,7 @@ def zenith_and_azimuth(
 
     jd = julianday(utc_datetime)
     t = julianday_to_juliancentury(jd)
-    declination = sun_declination(t)
-    eqtime = eq_of_time(t)
+    declination, eqtime = _solar_terms(t)
 
     # 360deg * 4 == 1440 minutes, 60*24 = 1440 minutes == 1 rotation
     solarTimeFix = eqtime + (4.0 * longitude) + (60 * zone)
@@ -680,6 +1323,41 @@ def elevation(
     return 90.0 - zenith(observer, dateandtime, with_refraction)
 
 
+def dawn_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    depression: Union[float, Depression] = Depression.CIVIL,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate dawn time without raising an exception if dawn does not occur.
+
+    Takes the same arguments as :func:`dawn`.
+
+    Returns:
+        The time at which dawn occurs, or a status of ``ALWAYS_ABOVE`` or
+        ``ALWAYS_BELOW`` if the sun does not reach the depression and
+        ``NOT_ON_DATE`` if dawn falls on a different date.
+    """
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    if date is None:
+        date = today(tzinfo)  # type: ignore
+    elif isinstance(date, datetime.datetime):
+        tzinfo = date.tzinfo or tzinfo
+        date = date.date()
+
+    dep: float = 0.0
+    if isinstance(depression, Depression):
+        dep = depression.value
+    else:
+        dep = depression
+
+    return _transit_on_date(
+        observer, date, 90.0 + dep, SunDirection.RISING, tzinfo  # type: ignore
+    )
+
+
 def dawn(
     observer: Observer,
     date: Optional[datetime.date] = None,
@@ -702,6 +1380,27 @@ def dawn(
     Raises:
         ValueError: if dawn does not occur on the specified date
     """
+    result = dawn_event(observer, date, depression, tzinfo)
+    if result.time is None:
+        dep = depression.value if isinstance(depression, Depression) else depression
+        raise _depression_error(result, "dawn", dep)
+    return result.time
+
+
+def sunrise_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate sunrise time without raising an exception if sunrise does not occur.
+
+    Takes the same arguments as :func:`sunrise`.
+
+    Returns:
+        The time at which sunrise occurs, or a status of ``ALWAYS_ABOVE`` or
+        ``ALWAYS_BELOW`` if the sun does not reach the horizon and
+        ``NOT_ON_DATE`` if sunrise falls on a different date.
+    """
     if isinstance(tzinfo, str):
         tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
 
@@ -711,48 +1410,18 @@ def dawn(
         tzinfo = date.tzinfo or tzinfo
         date = date.date()
 
-    dep: float = 0.0
-    if isinstance(depression, Depression):
-        dep = depression.value
-    else:
-        dep = depression
-
-    try:
-        tot = time_of_transit(
-            observer, date, 90.0 + dep, SunDirection.RISING
-        ).astimezone(
-            tzinfo  # type: ignore
+    if isinstance(observer.elevation, HorizonProfile):
+        return horizon_crossing_event(
+            observer, date, SunDirection.RISING, tzinfo
         )
 
-        # If the dates don't match search on either the next or previous day.
-        tot_date = tot.date()
-        if tot_date != date:
-            if tot_date < date:
-                delta = datetime.timedelta(days=1)
-            else:
-                delta = datetime.timedelta(days=-1)
-            new_date = date + delta
-
-            tot = time_of_transit(
-                observer,
-                new_date,
-                90.0 + dep,
-                SunDirection.RISING,
-            ).astimezone(
-                tzinfo  # type: ignore
-            )
-            # Still can't get a time then raise the error
-            tot_date = tot.date()
-            if tot_date != date:
-                raise ValueError("Unable to find a dawn time on the date specified")
-        return tot
-    except ValueError as exc:
-        if exc.args[0] == "math domain error":
-            raise ValueError(
-                f"Sun never reaches {dep} degrees below the horizon, at this location."
-            ) from exc
-        else:
-            raise
+    return _transit_on_date(
+        observer,
+        date,
+        90.0 + SUN_APPARENT_RADIUS,
+        SunDirection.RISING,
+        tzinfo,  # type: ignore
+    )
 
 
 def sunrise(
@@ -774,6 +1443,26 @@ def sunrise(
     Raises:
         ValueError: if the sun does not reach the horizon on the specified date
     """
+    result = sunrise_event(observer, date, tzinfo)
+    if result.time is None:
+        raise _horizon_error(result, "sunrise")
+    return result.time
+
+
+def sunset_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate sunset time without raising an exception if sunset does not occur.
+
+    Takes the same arguments as :func:`sunset`.
+
+    Returns:
+        The time at which sunset occurs, or a status of ``ALWAYS_ABOVE`` or
+        ``ALWAYS_BELOW`` if the sun does not reach the horizon and
+        ``NOT_ON_DATE`` if sunset falls on a different date.
+    """
     if isinstance(tzinfo, str):
         tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
 
@@ -783,46 +1472,18 @@ def sunrise(
         tzinfo = date.tzinfo or tzinfo
         date = date.date()
 
-    try:
-        tot = time_of_transit(
-            observer,
-            date,
-            90.0 + SUN_APPARENT_RADIUS,
-            SunDirection.RISING,
-        ).astimezone(
-            tzinfo  # type: ignore
+    if isinstance(observer.elevation, HorizonProfile):
+        return horizon_crossing_event(
+            observer, date, SunDirection.SETTING, tzinfo
         )
 
-        tot_date = tot.date()
-        if tot_date != date:
-            if tot_date < date:
-                delta = datetime.timedelta(days=1)
-            else:
-                delta = datetime.timedelta(days=-1)
-            new_date = date + delta
-
-            tot = time_of_transit(
-                observer,
-                new_date,
-                90.0 + SUN_APPARENT_RADIUS,
-                SunDirection.RISING,
-            ).astimezone(
-                tzinfo  # type: ignore
-            )
-            tot_date = tot.date()
-            if tot_date != date:
-                raise ValueError("Unable to find a sunrise time on the date specified")
-        return tot
-    except ValueError as exc:
-        if exc.args[0] == "math domain error":
-            z = zenith(observer, noon(observer, date))
-            if z > 90.0:
-                msg = "Sun is always below the horizon on this day, at this location."
-            else:
-                msg = "Sun is always above the horizon on this day, at this location."
-            raise ValueError(msg) from exc
-        else:
-            raise
+    return _transit_on_date(
+        observer,
+        date,
+        90.0 + SUN_APPARENT_RADIUS,
+        SunDirection.SETTING,
+        tzinfo,  # type: ignore
+    )
 
 
 def sunset(
@@ -844,7 +1505,27 @@ def sunset(
     Raises:
         ValueError: if the sun does not reach the horizon
     """
+    result = sunset_event(observer, date, tzinfo)
+    if result.time is None:
+        raise _horizon_error(result, "sunset")
+    return result.time
+
+
+def dusk_event(
+    observer: Observer,
+    date: Optional[datetime.date] = None,
+    depression: Union[float, Depression] = Depression.CIVIL,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> EventResult:
+    """Calculate dusk time without raising an exception if dusk does not occur.
+
+    Takes the same arguments as :func:`dusk`.
 
+    Returns:
+        The time at which dusk occurs, or a status of ``ALWAYS_ABOVE`` or
+        ``ALWAYS_BELOW`` if the sun does not reach the depression and
+        ``NOT_ON_DATE`` if dusk falls on a different date.
+    """
     if isinstance(tzinfo, str):
         tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
 
@@ -854,46 +1535,15 @@ def sunset(
         tzinfo = date.tzinfo or tzinfo
         date = date.date()
 
-    try:
-        tot = time_of_transit(
-            observer,
-            date,
-            90.0 + SUN_APPARENT_RADIUS,
-            SunDirection.SETTING,
-        ).astimezone(
-            tzinfo  # type: ignore
-        )
+    dep: float = 0.0
+    if isinstance(depression, Depression):
+        dep = depression.value
+    else:
+        dep = depression
 
-        tot_date = tot.date()
-        if tot_date != date:
-            if tot_date < date:
-                delta = datetime.timedelta(days=1)
-            else:
-                delta = datetime.timedelta(days=-1)
-            new_date = date + delta
-
-            tot = time_of_transit(
-                observer,
-                new_date,
-                90.0 + SUN_APPARENT_RADIUS,
-                SunDirection.SETTING,
-            ).astimezone(
-                tzinfo  # type: ignore
-            )
-            tot_date = tot.date()
-            if tot_date != date:
-                raise ValueError("Unable to find a sunset time on the date specified")
-        return tot
-    except ValueError as exc:
-        if exc.args[0] == "math domain error":
-            z = zenith(observer, noon(observer, date))
-            if z > 90.0:
-                msg = "Sun is always below the horizon on this day, at this location."
-            else:
-                msg = "Sun is always above the horizon on this day, at this location."
-            raise ValueError(msg) from exc
-        else:
-            raise
+    return _transit_on_date(
+        observer, date, 90.0 + dep, SunDirection.SETTING, tzinfo  # type: ignore
+    )
 
 
 def dusk(
@@ -918,56 +1568,11 @@ def dusk(
     Raises:
         ValueError: if dusk does not occur on the specified date
     """
-
-    if isinstance(tzinfo, str):
-        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
-
-    if date is None:
-        date = today(tzinfo)  # type: ignore
-    elif isinstance(date, datetime.datetime):
-        tzinfo = date.tzinfo or tzinfo
-        date = date.date()
-
-    dep: float = 0.0
-    if isinstance(depression, Depression):
-        dep = depression.value
-    else:
-        dep = depression
-
-    try:
-        tot = time_of_transit(
-            observer, date, 90.0 + dep, SunDirection.SETTING
-        ).astimezone(
-            tzinfo  # type: ignore
-        )
-
-        tot_date = tot.date()
-        if tot_date != date:
-            if tot_date < date:
-                delta = datetime.timedelta(days=1)
-            else:
-                delta = datetime.timedelta(days=-1)
-            new_date = date + delta
-
-            tot = time_of_transit(
-                observer,
-                new_date,
-                90.0 + dep,
-                SunDirection.SETTING,
-            ).astimezone(
-                tzinfo  # type: ignore
-            )
-            tot_date = tot.date()
-            if tot_date != date:
-                raise ValueError("Unable to find a dusk time on the date specified")
-        return tot
-    except ValueError as exc:
-        if exc.args[0] == "math domain error":
-            raise ValueError(
-                f"Sun never reaches {dep} degrees below the horizon, at this location."
-            ) from exc
-        else:
-            raise
+    result = dusk_event(observer, date, depression, tzinfo)
+    if result.time is None:
+        dep = depression.value if isinstance(depression, Depression) else depression
+        raise _depression_error(result, "dusk", dep)
+    return result.time
 
 
 def daylight(
@@ -1266,3 +1871,294 @@ def sun(
         "sunset": sunset(observer, date, tzinfo),
         "dusk": dusk(observer, date, dawn_dusk_depression, tzinfo),
     }
+
+
+def sun_range(
+    observer: Observer,
+    start: datetime.date,
+    end: datetime.date,
+    dawn_dusk_depression: Union[float, Depression] = Depression.CIVIL,
+    tzinfo: Union[str, datetime.tzinfo] = datetime.timezone.utc,
+) -> Dict[str, List[Any]]:
+    """Calculate dawn, sunrise, noon, sunset and dusk for every date in a range.
+
+    The sun's declination and the equation of time are calculated once for the
+    whole range and interpolated for each event, so this is much faster than
+    calling :func:`sun` for each date. Times differ from those of :func:`sun` by
+    well under a second.
+
+    Args:
+        observer:             Observer for which to calculate the times of the sun
+        start:                First date to calculate for
+        end:                  Last date to calculate for (inclusive)
+        dawn_dusk_depression: Depression to use to calculate dawn and dusk.
+                              Default is for Civil dusk i.e. 6.0
+        tzinfo:               Timezone to return times in. Default is UTC.
+
+    Returns:
+        Dictionary with keys ``date``, ``dawn``, ``sunrise``, ``noon``, ``sunset``
+        and ``dusk`` whose values are lists with an entry for each date. Events
+        which do not occur on a date, such as sunrise during a polar night,
+        are ``None``.
+    """
+    if isinstance(tzinfo, str):
+        tzinfo = zoneinfo.ZoneInfo(tzinfo)  # type: ignore
+
+    if isinstance(dawn_dusk_depression, Depression):
+        dep = float(dawn_dusk_depression.value)
+    else:
+        dep = dawn_dusk_depression
+
+    oneday = datetime.timedelta(days=1)
+    dates = []
+    date = start
+    while date <= end:
+        dates.append(date)
+        date += oneday
+
+    ephemeris = _InterpolatedEphemeris(
+        julianday(start - oneday) - 1.0, julianday(end + oneday) + 2.0
+    )
+    def events(
+        zenith: float, direction: SunDirection, is_horizon: bool = False
+    ) -> List[Any]:
+        if is_horizon and isinstance(observer.elevation, HorizonProfile):
+            return [
+                horizon_crossing_event(observer, date, direction, tzinfo).time
+                for date in dates
+            ]
+        # Each day's iteration starts from the time on the previous day plus a
+        # day, or the times on the previous two days extrapolated if both exist
+        times: List[Optional[datetime.datetime]] = []
+        for date in dates:
+            guess = times[-1] + oneday if times and times[-1] is not None else None
+            if guess is not None and len(times) > 1 and times[-2] is not None:
+                guess = times[-1] + (times[-1] - times[-2])
+            times.append(
+                _transit_on_date(
+                    observer,
+                    date,
+                    zenith,
+                    direction,
+                    tzinfo,  # type: ignore
+                    ephemeris,  # type: ignore
+                    guess,
+                ).time
+            )
+        return times
+
+    return {
+        "date": dates,
+        "dawn": events(90.0 + dep, SunDirection.RISING),
+        "sunrise": events(
+            90.0 + SUN_APPARENT_RADIUS, SunDirection.RISING, is_horizon=True
+        ),
+        "noon": [
+            _localize(
+                _noon_utc(date, observer.longitude, ephemeris(julianday(date))[1]),
+                tzinfo,  # type: ignore
+            )
+            for date in dates
+        ],
+        "sunset": events(
+            90.0 + SUN_APPARENT_RADIUS, SunDirection.SETTING, is_horizon=True
+        ),
+        "dusk": events(90.0 + dep, SunDirection.SETTING),
+    }
+
+
+def _normalize_longitude(longitude: float) -> float:
+    """Wrap a longitude into the range -180 to 180 degrees"""
+    return (longitude + 180.0) % 360.0 - 180.0
+
+
+class IlluminationSnapshot:
+    """The sun's illumination of the whole Earth at an instant.
+
+    The sun's declination and the equation of time are calculated once when the
+    snapshot is created and are shared by all of the calculations made with it.
+
+    Attributes:
+        time:             The UTC time of the snapshot
+        declination:      The sun's declination in degrees
+        equation_of_time: The equation of time in minutes
+        subsolar_point:   The latitude and longitude at which the sun is
+                          directly overhead
+    """
+
+    def __init__(self, dateandtime: Optional[datetime.datetime] = None):
+        if dateandtime is None:
+            dateandtime = now(datetime.timezone.utc)
+        elif dateandtime.tzinfo is None:
+            dateandtime = dateandtime.replace(tzinfo=datetime.timezone.utc)
+        else:
+            dateandtime = dateandtime.astimezone(datetime.timezone.utc)
+
+        t = julianday_to_juliancentury(julianday(dateandtime))
+        self.time = dateandtime
+        self.declination, self.equation_of_time = _solar_terms(t)
+
+        self._minutes = (
+            dateandtime.hour * 60.0 + dateandtime.minute + dateandtime.second / 60.0
+        )
+        self._sd = sin(radians(self.declination))
+        self._cd = cos(radians(self.declination))
+
+        longitude = (720.0 - self._minutes - self.equation_of_time) / 4.0
+        self.subsolar_point = (self.declination, _normalize_longitude(longitude))
+
+    def _cos_hourangle(self, longitude: float) -> float:
+        trueSolarTime = self._minutes + self.equation_of_time + 4.0 * longitude
+        while trueSolarTime > 1440:
+            trueSolarTime = trueSolarTime - 1440
+
+        hourangle = trueSolarTime / 4.0 - 180.0
+        if hourangle < -180:
+            hourangle = hourangle + 360.0
+        return cos(radians(hourangle))
+
+    def _latitude_terms(self, latitude: float) -> Tuple[float, float]:
+        latitude = min(max(latitude, -89.8), 89.8)
+        return (
+            cos(radians(latitude)) * self._cd,
+            sin(radians(latitude)) * self._sd,
+        )
+
+    @staticmethod
+    def _elevation(csz: float, with_refraction: bool) -> float:
+        zenith = degrees(acos(min(max(csz, -1.0), 1.0)))
+        if with_refraction:
+            zenith -= refraction_at_zenith(zenith)
+        return 90.0 - zenith
+
+    def elevation(
+        self, latitude: float, longitude: float, with_refraction: bool = True
+    ) -> float:
+        """Calculate the sun's elevation in degrees at a position, as
+        :func:`elevation`."""
+        a, b = self._latitude_terms(latitude)
+        return self._elevation(a * self._cos_hourangle(longitude) + b, with_refraction)
+
+    def elevation_raster(
+        self, resolution: float = 1.0, with_refraction: bool = True
+    ) -> List[List[float]]:
+        """Calculate the sun's elevation for a global grid of cells.
+
+        The terms which depend on the latitude are calculated once per row and
+        those which depend on the longitude once per column. For large rasters
+        :func:`astral.vectorized.elevation_grid` performs the same calculation
+        with numpy.
+
+        Args:
+            resolution:      Size of each cell in degrees
+            with_refraction: If True adjust the elevation to take refraction into
+                             account
+
+        Returns:
+            A list of rows from North to South, each a list of the elevations at
+            the centre of the cells from West to East i.e. the cell in row ``i``
+            and column ``j`` is centred on latitude
+            ``90 - (i + 0.5) * resolution`` and longitude
+            ``-180 + (j + 0.5) * resolution``.
+        """
+        rows = int(round(180.0 / resolution))
+        columns = int(round(360.0 / resolution))
+
+        cos_hourangles = [
+            self._cos_hourangle(-180.0 + (column + 0.5) * resolution)
+            for column in range(columns)
+        ]
+        raster = []
+        for row in range(rows):
+            a, b = self._latitude_terms(90.0 - (row + 0.5) * resolution)
+            raster.append(
+                [self._elevation(a * ch + b, with_refraction) for ch in cos_hourangles]
+            )
+        return raster
+
+    def terminator(
+        self, depression: Union[float, Depression] = 0.0, points: int = 360
+    ) -> List[Tuple[float, float]]:
+        """Calculate the boundary between day and night, or between the bands of
+        twilight.
+
+        Every position on the boundary is the same angular distance from the
+        subsolar point, so the boundary is calculated as a circle around it.
+
+        Args:
+            depression: Degrees below the horizon of the boundary. The default of
+                        0 is the line on which the sun rises and sets, as
+                        :func:`sunrise` and :func:`sunset`, and e.g.
+                        ``Depression.CIVIL`` is the line of civil dawn and dusk.
+            points:     Number of points to calculate
+
+        Returns:
+            A closed ring of (latitude, longitude) points with longitudes
+            between -180 and 180 degrees. The first point is not repeated at the
+            end. Where the ring crosses the antimeridian, consecutive points
+            differ in longitude by almost 360 degrees.
+        """
+        if isinstance(depression, Depression):
+            depression = depression.value
+
+        if depression:
+            zenith = 90.0 + float(depression)
+        else:
+            zenith = 90.0 + SUN_APPARENT_RADIUS
+        distance = radians(zenith + refraction_at_zenith(zenith))
+        sin_distance = sin(distance)
+        cos_distance = cos(distance)
+
+        latitude, longitude = self.subsolar_point
+        ring = []
+        for point in range(points):
+            bearing = radians(360.0 * point / points)
+            sin_latitude = (
+                self._sd * cos_distance + self._cd * sin_distance * cos(bearing)
+            )
+            delta = atan2(
+                sin(bearing) * sin_distance * self._cd,
+                cos_distance - self._sd * sin_latitude,
+            )
+            ring.append(
+                (
+                    degrees(asin(min(max(sin_latitude, -1.0), 1.0))),
+                    _normalize_longitude(longitude + degrees(delta)),
+                )
+            )
+        return ring
+
+    def twilight_boundaries(self, points: int = 360) -> Dict[str, List[Any]]:
+        """Calculate the boundaries of the bands of twilight.
+
+        Returns:
+            A dictionary with keys ``horizon``, ``civil``, ``nautical`` and
+            ``astronomical`` whose values are rings as returned by
+            :meth:`terminator`. Civil twilight lies between the ``horizon`` and
+            ``civil`` rings, nautical twilight between the ``civil`` and
+            ``nautical`` rings and astronomical twilight between the
+            ``nautical`` and ``astronomical`` rings.
+        """
+        return {
+            "horizon": self.terminator(0.0, points),
+            "civil": self.terminator(Depression.CIVIL, points),
+            "nautical": self.terminator(Depression.NAUTICAL, points),
+            "astronomical": self.terminator(Depression.ASTRONOMICAL, points),
+        }
+
+
+def illumination(
+    dateandtime: Optional[datetime.datetime] = None,
+) -> IlluminationSnapshot:
+    """Calculate the sun's illumination of the Earth at an instant.
+
+    Args:
+        dateandtime: The date and time of the snapshot. If `dateandtime` is None
+                     the current time is used and if it is a naive Python
+                     datetime then it is assumed to be in the UTC timezone.
+
+    Returns:
+        A snapshot from which the subsolar point, the day/night terminator, the
+        bands of twilight and the sun's elevation at any position can be found.
+    """
+    return IlluminationSnapshot(dateandtime)
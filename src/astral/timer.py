@@ -0,0 +1,414 @@
+"""Call functions at solar and lunar events for many observers.
+
+A :class:`SolarTimer` keeps the next event of every registration in a single
+heap and sleeps until the earliest one is due, instead of running a task per
+observer e.g. ::
+
+    import asyncio
+    import datetime
+
+    from astral.timer import SolarTimer
+
+    timer = SolarTimer()
+    for controller in controllers:
+        timer.register(
+            controller.observer,
+            "sunset",
+            controller.lights_on,
+            offset=datetime.timedelta(minutes=-15),
+        )
+
+    asyncio.run(timer.run())
+
+Each callback is called with a :class:`~astral.schedule.SolarEvent` holding the
+time of the event (including the offset) and its name. Callbacks may be
+coroutine functions, in which case the coroutine is run as a task.
+
+The time until the next event is recalculated from the clock each time the timer
+wakes so sleeping does not accumulate drift. The sun's events come from a
+:class:`~astral.schedule.SolarEventSchedule` shared by all registrations for the
+same observer, event and depression, which calculates several days at a time.
+The moon's rise and set times are found in the same way, a few days at a time.
+
+Cancelling a registration only marks it, and its entry is discarded when it
+reaches the top of the heap, so cancelling and registering again are cheap. Events
+which have passed are dropped from the schedules as the timer fires, and a schedule
+is dropped once all its registrations have been cancelled.
+"""
+
+import asyncio
+import datetime
+import heapq
+import inspect
+import time
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from astral import Depression, Observer
+from astral.intervals import _crossings, _jd2000, _moon_ephemeris
+from astral.moon import _above_horizon
+from astral.schedule import EVENTS as SUN_EVENTS
+from astral.schedule import SolarEvent, SolarEventSchedule
+
+__all__ = ["MOON_EVENTS", "SolarTimer", "TimerHandle"]
+
+MOON_EVENTS = ("moonrise", "moonset")
+
+Callback = Callable[[SolarEvent], Any]
+
+# Entries due within this many seconds are called, and the next event must be
+# this much later, which allows for the rounding of timestamps to datetimes
+_TOLERANCE = 0.001
+
+
+class _MoonSchedule:
+    """The moon's rise or set times, calculated a few days at a time"""
+
+    def __init__(self, observer: Observer, rising: bool, chunk_days: int):
+        self.observer = observer
+        self.rising = rising
+        self.chunk = chunk_days * 86400.0
+        self._times: List[float] = []
+        self._start: Optional[float] = None
+        self._end: Optional[float] = None
+
+    def _extend(self, start: float, end: float) -> None:
+        ephemeris = _moon_ephemeris(start, end)
+
+        def func(timestamp: float) -> float:
+            return _above_horizon(self.observer, _jd2000(timestamp), ephemeris)
+
+        self._times.extend(
+            timestamp
+            for timestamp, rose in _crossings(func, start, end)
+            if rose == self.rising
+        )
+        self._end = end
+
+    def _discard(self, timestamp: float) -> None:
+        """Forget the times before a time"""
+        if self._start is None or timestamp <= self._start:
+            return
+        del self._times[: bisect_left(self._times, timestamp)]
+        self._start = timestamp
+
+    def next_after(self, timestamp: float, max_days: int = 60) -> Optional[float]:
+        if self._start is None or timestamp < self._start:
+            self._start = timestamp
+            self._times = []
+            self._extend(timestamp, timestamp + self.chunk)
+
+        limit = timestamp + max_days * 86400.0
+        while True:
+            idx = bisect_right(self._times, timestamp)
+            if idx < len(self._times):
+                return self._times[idx]
+            assert self._end is not None
+            if self._end > limit:
+                return None
+            self._extend(self._end, self._end + self.chunk)
+
+
+class TimerHandle:
+    """A function registered with :meth:`SolarTimer.register`"""
+
+    def __init__(
+        self,
+        timer: "SolarTimer",
+        observer: Observer,
+        event: str,
+        callback: Callback,
+        offset: datetime.timedelta,
+        key: Tuple[Any, ...],
+        schedule: Union[SolarEventSchedule, _MoonSchedule],
+    ):
+        self.observer = observer
+        self.event = event
+        self.callback = callback
+        self.offset = offset
+        self._timer = timer
+        self._key = key
+        self._schedule = schedule
+        self._when: Optional[float] = None
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        return (
+            f"TimerHandle({self.event!r}, offset={self.offset!r}, "
+            f"when={self.when!r}, cancelled={self._cancelled})"
+        )
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the registration has been cancelled"""
+        return self._cancelled
+
+    @property
+    def when(self) -> Optional[datetime.datetime]:
+        """The time the callback will next be called in UTC, or None if there is
+        no upcoming event"""
+        if self._when is None or self._cancelled:
+            return None
+        return datetime.datetime.fromtimestamp(self._when, datetime.timezone.utc)
+
+    def cancel(self) -> None:
+        """Stop calling the callback"""
+        self._timer._cancel(self)
+
+    def _next_after(self, timestamp: float) -> Optional[float]:
+        """Find the time the callback is next due after a time"""
+        offset = self.offset.total_seconds()
+        if isinstance(self._schedule, _MoonSchedule):
+            when = self._schedule.next_after(timestamp - offset)
+            return None if when is None else when + offset
+
+        after = datetime.datetime.fromtimestamp(
+            timestamp - offset, datetime.timezone.utc
+        )
+        event = self._schedule.next_event(after)
+        return None if event is None else event.time.timestamp() + offset
+
+
+class SolarTimer:
+    """Calls functions at solar and lunar events.
+
+    Args:
+        clock:      A function returning the current time as a POSIX timestamp.
+                    Default is :func:`time.time`
+        chunk_days: The number of days of events to calculate at a time for each
+                    observer
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, chunk_days: int = 7):
+        self.clock = clock
+        self.chunk_days = chunk_days
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._sequence = count()
+        self._schedules: Dict[
+            Tuple[Any, ...], Union[SolarEventSchedule, _MoonSchedule]
+        ] = {}
+        # The registrations which have not been cancelled for each schedule
+        self._handles: Dict[Tuple[Any, ...], Set[TimerHandle]] = {}
+        self._active = 0
+        self._cancelled = 0
+        self._changed: Optional[asyncio.Event] = None
+        self._running = False
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    def __len__(self) -> int:
+        return self._active
+
+    def _schedule(
+        self, key: Tuple[Any, ...], observer: Observer, event: str, depression: float
+    ) -> Union[SolarEventSchedule, _MoonSchedule]:
+        """Find or create the schedule shared by registrations for an observer
+        and event"""
+        try:
+            return self._schedules[key]
+        except KeyError:
+            pass
+
+        schedule: Union[SolarEventSchedule, _MoonSchedule]
+        if event in MOON_EVENTS:
+            schedule = _MoonSchedule(observer, event == "moonrise", self.chunk_days)
+        else:
+            schedule = SolarEventSchedule(
+                observer, [event], depression=depression, chunk_days=self.chunk_days
+            )
+        self._schedules[key] = schedule
+        self._handles[key] = set()
+        return schedule
+
+    def _push(self, handle: TimerHandle, after: float) -> None:
+        handle._when = handle._next_after(after + _TOLERANCE)
+        if handle._when is not None:
+            heapq.heappush(self._heap, (handle._when, next(self._sequence), handle))
+
+    def register(
+        self,
+        observer: Observer,
+        event: str,
+        callback: Callback,
+        offset: datetime.timedelta = datetime.timedelta(0),
+        depression: Union[float, Depression] = Depression.CIVIL,
+    ) -> TimerHandle:
+        """Call a function at every occurrence of an event.
+
+        Args:
+            observer:   An observer at a specific, latitude, longitude and
+                        elevation
+            event:      One of ``dawn``, ``sunrise``, ``noon``, ``sunset``,
+                        ``dusk``, ``moonrise`` or ``moonset``
+            callback:   The function to call with a
+                        :class:`~astral.schedule.SolarEvent`
+            offset:     Time to add to the event
+            depression: Depression to use to calculate dawn and dusk
+
+        Returns:
+            A handle which can be used to cancel the registration.
+        """
+        if event not in SUN_EVENTS and event not in MOON_EVENTS:
+            raise ValueError(f"Unknown event {event!r}")
+        if isinstance(depression, Depression):
+            depression = depression.value
+
+        key = (observer.latitude, observer.longitude, repr(observer.elevation), event)
+        if event in SUN_EVENTS:
+            key += (float(depression),)
+        schedule = self._schedule(key, observer, event, float(depression))
+        handle = TimerHandle(self, observer, event, callback, offset, key, schedule)
+        self._handles[key].add(handle)
+        previous = self._heap[0][0] if self._heap else None
+        self._push(handle, self.clock())
+        self._active += 1
+
+        if self._changed is not None and handle._when is not None:
+            if previous is None or handle._when < previous:
+                self._changed.set()
+        return handle
+
+    def _cancel(self, handle: TimerHandle) -> None:
+        if handle._cancelled:
+            return
+        handle._cancelled = True
+        self._active -= 1
+        handles = self._handles[handle._key]
+        handles.discard(handle)
+        if not handles:
+            del self._handles[handle._key]
+            del self._schedules[handle._key]
+        if handle._when is not None:
+            self._cancelled += 1
+            # Rebuild the heap once most of it is cancelled entries
+            if self._cancelled > 100 and self._cancelled * 2 > len(self._heap):
+                self._heap = [
+                    entry for entry in self._heap if not entry[2]._cancelled
+                ]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _discard_cancelled(self) -> None:
+        while self._heap and self._heap[0][2]._cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled = max(self._cancelled - 1, 0)
+
+    def next_due(self) -> Optional[datetime.datetime]:
+        """The time in UTC of the next callback, or None if there are none"""
+        self._discard_cancelled()
+        if not self._heap:
+            return None
+        return datetime.datetime.fromtimestamp(
+            self._heap[0][0], datetime.timezone.utc
+        )
+
+    def _pop_due(self, now: float) -> List[Tuple[TimerHandle, SolarEvent]]:
+        """Remove the entries which are due, scheduling the next occurrence of
+        each"""
+        due = []
+        keys = set()
+        self._discard_cancelled()
+        while self._heap and self._heap[0][0] <= now + _TOLERANCE:
+            when, _, handle = heapq.heappop(self._heap)
+            if handle._cancelled:
+                self._cancelled = max(self._cancelled - 1, 0)
+                continue
+            event = SolarEvent(
+                datetime.datetime.fromtimestamp(when, datetime.timezone.utc),
+                handle.event,
+            )
+            due.append((handle, event))
+            keys.add(handle._key)
+            # Events missed while the timer was not running are only called once
+            self._push(handle, max(when, now))
+
+        for key in keys:
+            self._discard_past(key, now)
+        return due
+
+    def _discard_past(self, key: Tuple[Any, ...], now: float) -> None:
+        """Drop the events of a schedule which no registration can need again"""
+        handles = self._handles.get(key)
+        if not handles:
+            return
+        offset = max(handle.offset.total_seconds() for handle in handles)
+        self._schedules[key]._discard(now - offset)
+
+    def _call(self, handle: TimerHandle, event: SolarEvent) -> None:
+        result = handle.callback(event)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def fire_due(self, now: Optional[datetime.datetime] = None) -> int:
+        """Call the callbacks which are due.
+
+        This is called by :meth:`run` and can also be used to drive the timer
+        from another loop. Callbacks which return awaitables need a running
+        asyncio event loop.
+
+        Every callback which is due is called even if an earlier one raises an
+        exception; the first exception is raised once they have all been called.
+
+        Args:
+            now: The current time. Default is the time given by the clock.
+
+        Returns:
+            The number of callbacks called.
+        """
+        timestamp = self.clock() if now is None else now.timestamp()
+        due = self._pop_due(timestamp)
+        error: Optional[Exception] = None
+        for handle, event in due:
+            try:
+                self._call(handle, event)
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        if error is not None:
+            raise error
+        return len(due)
+
+    async def run(self) -> None:
+        """Call the callbacks as their events become due until :meth:`stop` is
+        called.
+
+        Exceptions raised by callbacks are passed to the event loop's exception
+        handler.
+        """
+        loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                for handle, event in self._pop_due(self.clock()):
+                    try:
+                        self._call(handle, event)
+                    except Exception as exc:
+                        loop.call_exception_handler(
+                            {
+                                "message": f"Exception in callback for {event}",
+                                "exception": exc,
+                                "handle": handle,
+                            }
+                        )
+
+                self._changed.clear()
+                self._discard_cancelled()
+                timeout = None
+                if self._heap:
+                    timeout = max(self._heap[0][0] - self.clock(), 0.0)
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            self._changed = None
+
+    def stop(self) -> None:
+        """Stop :meth:`run` at the next opportunity"""
+        self._running = False
+        if self._changed is not None:
+            self._changed.set()
@@ -0,0 +1,619 @@
+"""Versions of the sun and moon calculations which operate on numpy arrays.
+
+The functions follow the scalar versions in :mod:`astral.sun` and
+:mod:`astral.moon` but accept arrays of latitudes, longitudes and times, which
+are broadcast against each other, and perform the calculation for all of the
+elements at once e.g. ::
+
+    import numpy as np
+    from astral import vectorized
+
+    times = np.arange("2024-06-21T00", "2024-06-22T00", dtype="datetime64[m]")
+    zenith, azimuth = vectorized.zenith_and_azimuth(51.5, -0.13, times)
+
+Times are numpy ``datetime64`` values in UTC and dates are ``datetime64[D]``
+values. Results which are not defined, such as the sunrise during a polar
+night, are ``NaT``.
+
+For grids of latitudes and longitudes, such as map tiles, :func:`sun_grid` and
+:func:`elevation_grid` calculate the values which only depend on the latitude
+once per row and broadcast them across the longitudes.
+
+This module requires numpy, which can be installed with ``pip install
+astral[pandas]``. :mod:`astral.dataframe` uses these functions to provide a
+pandas accessor.
+"""
+
+from typing import Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "astral.vectorized requires numpy. "
+        "Install it with 'pip install astral[pandas]'"
+    ) from exc
+
+from astral import Depression, SunDirection
+from astral.sun import (
+    _DECLINATION_RATE,
+    _EQTIME_RATE,
+    TRANSIT_MAX_ITERATIONS,
+    TRANSIT_TOLERANCE,
+)
+
+__all__ = [
+    "julianday",
+    "zenith_and_azimuth",
+    "elevation",
+    "time_of_transit",
+    "noon",
+    "sun_events",
+    "sun_grid",
+    "elevation_grid",
+    "daylight_grid",
+    "moon_phase",
+]
+
+ArrayLike = Union[float, "np.ndarray"]
+
+# Using 32 arc minutes as sun's apparent diameter
+SUN_APPARENT_RADIUS = 32.0 / (60.0 * 2.0)
+
+# Julian day of the Unix epoch
+_JD_EPOCH = 2440587.5
+
+
+def julianday(times) -> np.ndarray:
+    """Calculate the julian day of each time, truncated to the second as for
+    :func:`astral.julian.julianday`"""
+    seconds = np.asarray(times, dtype="datetime64[s]").astype(np.int64)
+    return seconds / 86400.0 + _JD_EPOCH
+
+
+def _juliancentury(jd: np.ndarray) -> np.ndarray:
+    return (jd - 2451545.0) / 36525.0
+
+
+def _geom_mean_long_sun(jc: np.ndarray) -> np.ndarray:
+    return (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+
+
+def _geom_mean_anomaly_sun(jc: np.ndarray) -> np.ndarray:
+    return 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+
+
+def _eccentric_location_earth_orbit(jc: np.ndarray) -> np.ndarray:
+    return 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+
+def _sun_apparent_long(jc: np.ndarray) -> np.ndarray:
+    mrad = np.radians(_geom_mean_anomaly_sun(jc))
+    c = (
+        np.sin(mrad) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * mrad) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * mrad) * 0.000289
+    )
+    omega = 125.04 - 1934.136 * jc
+    return _geom_mean_long_sun(jc) + c - 0.00569 - 0.00478 * np.sin(np.radians(omega))
+
+
+def _obliquity_correction(jc: np.ndarray) -> np.ndarray:
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    e0 = 23.0 + (26.0 + (seconds / 60.0)) / 60.0
+    omega = 125.04 - 1934.136 * jc
+    return e0 + 0.00256 * np.cos(np.radians(omega))
+
+
+def sun_declination(jc: np.ndarray) -> np.ndarray:
+    """Calculate the sun's declination in degrees for julian centuries `jc`"""
+    e = np.radians(_obliquity_correction(jc))
+    lambd = np.radians(_sun_apparent_long(jc))
+    return np.degrees(np.arcsin(np.sin(e) * np.sin(lambd)))
+
+
+def eq_of_time(jc: np.ndarray) -> np.ndarray:
+    """Calculate the equation of time in minutes for julian centuries `jc`"""
+    l0 = np.radians(_geom_mean_long_sun(jc))
+    e = _eccentric_location_earth_orbit(jc)
+    m = np.radians(_geom_mean_anomaly_sun(jc))
+    y = np.tan(np.radians(_obliquity_correction(jc)) / 2.0) ** 2
+
+    sinm = np.sin(m)
+    etime = (
+        y * np.sin(2.0 * l0)
+        - 2.0 * e * sinm
+        + 4.0 * e * y * sinm * np.cos(2.0 * l0)
+        - 0.5 * y * y * np.sin(4.0 * l0)
+        - 1.25 * e * e * np.sin(2.0 * m)
+    )
+    return np.degrees(etime) * 4.0
+
+
+def refraction_at_zenith(zenith: ArrayLike) -> np.ndarray:
+    """Calculate the degrees of refraction of the sun due to the sun's elevation."""
+    elevation = 90.0 - np.asarray(zenith, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        te = np.tan(np.radians(elevation))
+        high = 58.1 / te - 0.07 / te**3 + 0.000086 / te**5
+        low = 1735.0 + elevation * (
+            -518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+        )
+        below = -20.774 / te
+
+    correction = np.select(
+        [elevation >= 85.0, elevation > 5.0, elevation > -0.575],
+        [0.0, high, low],
+        below,
+    )
+    return correction / 3600.0
+
+
+def zenith_and_azimuth(
+    latitude: ArrayLike,
+    longitude: ArrayLike,
+    times,
+    with_refraction: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate the zenith and azimuth angles of the sun in degrees.
+
+    Args:
+        latitude:        Latitudes of the observers
+        longitude:       Longitudes of the observers
+        times:           UTC times to calculate for
+        with_refraction: Whether to adjust the zenith for atmospheric refraction
+
+    Returns:
+        Arrays of zenith angles and azimuths, in degrees clockwise from North.
+    """
+    times = np.asarray(times, dtype="datetime64[s]")
+    latitude, longitude, times = np.broadcast_arrays(
+        np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float), times
+    )
+    latitude = np.clip(latitude, -89.8, 89.8)
+
+    jd = julianday(times)
+    jc = _juliancentury(jd)
+    declination = np.radians(sun_declination(jc))
+    eqtime = eq_of_time(jc)
+
+    minutes = (times - times.astype("datetime64[D]")).astype(np.int64) / 60.0
+    true_solar_time = minutes + eqtime + 4.0 * longitude
+    true_solar_time = np.where(
+        true_solar_time > 1440.0, true_solar_time % 1440.0, true_solar_time
+    )
+
+    hourangle = true_solar_time / 4.0 - 180.0
+    hourangle = np.where(hourangle < -180.0, hourangle + 360.0, hourangle)
+
+    latitude_rad = np.radians(latitude)
+    cl = np.cos(latitude_rad)
+    sl = np.sin(latitude_rad)
+    sd = np.sin(declination)
+    cd = np.cos(declination)
+
+    csz = np.clip(cl * cd * np.cos(np.radians(hourangle)) + sl * sd, -1.0, 1.0)
+    zenith = np.degrees(np.arccos(csz))
+
+    az_denom = cl * np.sin(np.radians(zenith))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        az_rad = np.clip((sl * np.cos(np.radians(zenith)) - sd) / az_denom, -1.0, 1.0)
+    azimuth = 180.0 - np.degrees(np.arccos(az_rad))
+    azimuth = np.where(hourangle > 0.0, -azimuth, azimuth)
+    azimuth = np.where(
+        np.abs(az_denom) > 0.001, azimuth, np.where(latitude > 0.0, 180.0, 0.0)
+    )
+    azimuth = np.where(azimuth < 0.0, azimuth + 360.0, azimuth)
+
+    if with_refraction:
+        zenith = zenith - refraction_at_zenith(zenith)
+
+    return zenith, azimuth
+
+
+def elevation(
+    latitude: ArrayLike,
+    longitude: ArrayLike,
+    times,
+    with_refraction: bool = True,
+) -> np.ndarray:
+    """Calculate the elevation angle of the sun in degrees above the horizon.
+
+    Takes the same arguments as :func:`zenith_and_azimuth`.
+    """
+    zenith, _ = zenith_and_azimuth(latitude, longitude, times, with_refraction)
+    return 90.0 - zenith
+
+
+def _to_datetime64(dates: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    """Add a number of minutes, which may be NaN, to dates"""
+    microseconds = np.trunc(minutes * 60e6)
+    valid = np.isfinite(microseconds)
+    offset = np.where(valid, microseconds, 0).astype(np.int64)
+    result = dates.astype("datetime64[us]") + offset.astype("timedelta64[us]")
+    return np.where(valid, result, np.datetime64("NaT"))
+
+
+def time_of_transit(
+    latitude: ArrayLike,
+    longitude: ArrayLike,
+    dates,
+    zenith: ArrayLike,
+    direction: SunDirection = SunDirection.RISING,
+    with_refraction: bool = True,
+    elevation: ArrayLike = 0.0,
+    tolerance: float = TRANSIT_TOLERANCE,
+    max_iterations: int = TRANSIT_MAX_ITERATIONS,
+) -> np.ndarray:
+    """Calculate the UTC times at which the sun transits the zenith on each
+    UTC date, as :func:`astral.sun.time_of_transit`.
+
+    Args:
+        latitude:        Latitudes of the observers
+        longitude:       Longitudes of the observers
+        dates:           UTC dates to calculate for
+        zenith:          Zenith angles in degrees to calculate the transit of
+        direction:       The direction that the sun is traversing
+        with_refraction: Whether to adjust the zenith for atmospheric refraction
+        elevation:       Elevations of the observers in metres
+        tolerance:       The largest correction in seconds which is estimated
+                         to be left when the iteration stops
+        max_iterations:  The most iterations to make
+
+    Returns:
+        An array of ``datetime64[us]`` times which are ``NaT`` where the sun does
+        not reach the zenith.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    latitude, longitude, dates, zenith, elevation = np.broadcast_arrays(
+        np.asarray(latitude, dtype=float),
+        np.asarray(longitude, dtype=float),
+        dates,
+        np.asarray(zenith, dtype=float),
+        np.asarray(elevation, dtype=float),
+    )
+    latitude = np.radians(np.clip(latitude, -89.8, 89.8))
+
+    radius = 6356900.0
+    adjustment_for_elevation = np.where(
+        elevation > 0.0,
+        np.degrees(np.arccos(radius / (radius + np.maximum(elevation, 0.0)))),
+        0.0,
+    )
+    zenith = zenith + adjustment_for_elevation
+    if with_refraction:
+        zenith = zenith + refraction_at_zenith(zenith)
+    cz = np.cos(np.radians(zenith))
+    sl = np.sin(latitude)
+    cl = np.cos(latitude)
+
+    jd = julianday(dates)
+    time_utc = np.zeros(jd.shape)
+    reachable = np.ones(jd.shape, dtype=bool)
+    active = np.ones(jd.shape, dtype=bool)
+    sign = 1.0 if direction == SunDirection.RISING else -1.0
+    tolerance_minutes = tolerance / 60.0
+
+    # Iterate until the next correction is estimated to be less than the
+    # tolerance for every time, as astral.sun._transit does for each one
+    for _ in range(max_iterations):
+        jc = _juliancentury(jd + time_utc / 1440.0)
+        declination = np.radians(sun_declination(jc))
+        h = (cz - sl * np.sin(declination)) / (cl * np.cos(declination))
+        reachable &= ~active | (np.abs(h) <= 1.0)
+        active &= reachable
+        hourangle = sign * np.degrees(np.arccos(np.clip(h, -1.0, 1.0)))
+
+        offset = (-longitude - hourangle) * 4.0 - eq_of_time(jc)
+        offset = np.where(offset < -720.0, offset + 1440.0, offset)
+        correction = np.abs(720.0 + offset - time_utc)
+        time_utc = np.where(active, 720.0 + offset, time_utc)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dh = h * np.tan(declination) - sl / (cl * np.cos(declination))
+            rate = 4.0 * np.abs(dh) / np.sqrt(1.0 - h * h) * _DECLINATION_RATE
+            converged = np.where(
+                h * h < 1.0,
+                correction * (rate + _EQTIME_RATE) < tolerance_minutes,
+                correction < tolerance_minutes,
+            )
+        active &= ~converged
+        if not active.any():
+            break
+
+    return _to_datetime64(dates, np.where(reachable, time_utc, np.nan))
+
+
+def noon(longitude: ArrayLike, dates) -> np.ndarray:
+    """Calculate the UTC times of solar noon for each UTC date, as
+    :func:`astral.sun.noon`"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    longitude, dates = np.broadcast_arrays(np.asarray(longitude, dtype=float), dates)
+    eqtime = eq_of_time(_juliancentury(julianday(dates)))
+    seconds = np.trunc((720.0 - 4.0 * longitude - eqtime) * 60.0)
+    return dates.astype("datetime64[us]") + (seconds * 1e6).astype("timedelta64[us]")
+
+
+def sun_events(
+    latitude: ArrayLike,
+    longitude: ArrayLike,
+    dates,
+    depression: Union[float, Depression] = Depression.CIVIL,
+) -> dict:
+    """Calculate dawn, sunrise, noon, sunset and dusk for each UTC date.
+
+    Unlike :func:`astral.sun.sun`, events are calculated for the UTC date and are
+    not moved to the local date of the observer.
+
+    Returns:
+        A dictionary with keys ``dawn``, ``sunrise``, ``noon``, ``sunset`` and
+        ``dusk`` whose values are arrays of ``datetime64[us]`` UTC times.
+    """
+    if isinstance(depression, Depression):
+        depression = depression.value
+
+    horizon = 90.0 + SUN_APPARENT_RADIUS
+    twilight = 90.0 + float(depression)
+    return {
+        "dawn": time_of_transit(
+            latitude, longitude, dates, twilight, SunDirection.RISING
+        ),
+        "sunrise": time_of_transit(
+            latitude, longitude, dates, horizon, SunDirection.RISING
+        ),
+        "noon": noon(longitude, dates),
+        "sunset": time_of_transit(
+            latitude, longitude, dates, horizon, SunDirection.SETTING
+        ),
+        "dusk": time_of_transit(
+            latitude, longitude, dates, twilight, SunDirection.SETTING
+        ),
+    }
+
+
+def _grid_transit(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    jd: float,
+    zenith: float,
+    direction: SunDirection,
+    with_refraction: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate the minutes after the start of the UTC day at which the sun
+    transits the zenith for each latitude (rows) and longitude (columns).
+
+    The first iteration of :func:`time_of_transit` uses the ephemeris for the
+    start of the day so the hour angle only depends on the latitude and the
+    longitude is a shift of the time. The later iterations need the ephemeris
+    for each time found, which is interpolated from values calculated every
+    6 minutes.
+
+    Returns:
+        The minutes, which are NaN where the sun does not reach the zenith, and
+        an array which is -1 where the sun is always above the zenith, 1 where it
+        is always below and 0 where it is reached.
+    """
+    if with_refraction:
+        zenith = zenith + float(refraction_at_zenith(zenith))
+    cz = np.cos(np.radians(zenith))
+    latitudes = np.radians(np.clip(latitudes, -89.8, 89.8))
+    sl = np.sin(latitudes)[:, np.newaxis]
+    cl = np.cos(latitudes)[:, np.newaxis]
+    sign = 1.0 if direction == SunDirection.RISING else -1.0
+    tolerance_minutes = TRANSIT_TOLERANCE / 60.0
+
+    def _minutes(h: np.ndarray, eqtime: ArrayLike) -> np.ndarray:
+        hourangle = np.degrees(np.arccos(np.clip(h, -1.0, 1.0)))
+        offset = (-longitudes - sign * hourangle) * 4.0 - eqtime
+        return np.where(offset < -720.0, offset + 1440.0, offset) + 720.0
+
+    def _status(h: np.ndarray) -> np.ndarray:
+        return (h > 1.0).astype(np.int8) - (h < -1.0)
+
+    def _converged(
+        h: np.ndarray, sd: np.ndarray, cd: np.ndarray, correction: np.ndarray
+    ) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dh = h * sd / cd - sl / (cl * cd)
+            rate = 4.0 * np.abs(dh) / np.sqrt(1.0 - h * h) * _DECLINATION_RATE
+            return np.where(
+                h * h < 1.0,
+                correction * (rate + _EQTIME_RATE) < tolerance_minutes,
+                correction < tolerance_minutes,
+            )
+
+    jc = _juliancentury(jd)
+    declination = np.radians(sun_declination(jc))
+    sd = np.sin(declination)
+    cd = np.cos(declination)
+    h = (cz - sl * sd) / (cl * cd)
+    status = _status(h)
+    minutes = _minutes(h, eq_of_time(jc))
+    active = (status == 0) & ~_converged(h, sd, cd, minutes)
+
+    # The times found are between 0 and 1.52 days after the start of the date
+    steps = np.linspace(-0.05, 1.6, 397)
+    jc = _juliancentury(jd + steps)
+    declination = np.radians(sun_declination(jc))
+    sin_declination = np.sin(declination)
+    cos_declination = np.cos(declination)
+    eqtime = eq_of_time(jc)
+    for _ in range(TRANSIT_MAX_ITERATIONS - 1):
+        if not active.any():
+            break
+        adjustment = minutes / 1440.0
+        sd = np.interp(adjustment, steps, sin_declination)
+        cd = np.interp(adjustment, steps, cos_declination)
+        h = (cz - sl * sd) / (cl * cd)
+        status = np.where(active & (status == 0), _status(h), status)
+        active &= status == 0
+
+        updated = _minutes(h, np.interp(adjustment, steps, eqtime))
+        correction = np.abs(updated - minutes)
+        minutes = np.where(active, updated, minutes)
+        active &= ~_converged(h, sd, cd, correction)
+
+    return np.where(status == 0, minutes, np.nan), status
+
+
+def sun_grid(
+    latitudes: ArrayLike,
+    longitudes: ArrayLike,
+    date,
+    depression: Union[float, Depression] = Depression.CIVIL,
+    with_refraction: bool = True,
+) -> dict:
+    """Calculate dawn, sunrise, noon, sunset and dusk for a grid of latitudes and
+    longitudes on a UTC date.
+
+    The results agree with :func:`time_of_transit` and :func:`noon` to within a
+    millisecond, but the calculations which only depend on the latitude are made
+    once for each row.
+
+    Args:
+        latitudes:       1 dimensional array of the latitudes of the rows
+        longitudes:      1 dimensional array of the longitudes of the columns
+        date:            UTC date to calculate for
+        depression:      Depression to use to calculate dawn and dusk
+        with_refraction: Whether to adjust for atmospheric refraction
+
+    Returns:
+        A dictionary with keys ``dawn``, ``sunrise``, ``noon``, ``sunset`` and
+        ``dusk`` whose values are arrays of ``datetime64[us]`` UTC times with a
+        row for each latitude and a column for each longitude, which are ``NaT``
+        for events that do not occur. The boolean arrays ``always_above`` and
+        ``always_below`` show where the sun does not rise or set.
+    """
+    if isinstance(depression, Depression):
+        depression = depression.value
+
+    latitudes = np.asarray(latitudes, dtype=float).reshape(-1)
+    longitudes = np.asarray(longitudes, dtype=float).reshape(-1)
+    date = np.datetime64(date, "D")
+    jd = float(julianday(date))
+
+    result = {}
+    status = None
+    for name, zenith, direction in (
+        ("dawn", 90.0 + float(depression), SunDirection.RISING),
+        ("sunrise", 90.0 + SUN_APPARENT_RADIUS, SunDirection.RISING),
+        ("sunset", 90.0 + SUN_APPARENT_RADIUS, SunDirection.SETTING),
+        ("dusk", 90.0 + float(depression), SunDirection.SETTING),
+    ):
+        minutes, event_status = _grid_transit(
+            latitudes, longitudes, jd, zenith, direction, with_refraction
+        )
+        result[name] = _to_datetime64(date, minutes)
+        if name == "sunrise":
+            status = event_status
+
+    seconds = np.trunc((720.0 - 4.0 * longitudes - eq_of_time(_juliancentury(jd))) * 60)
+    noon = date.astype("datetime64[us]") + (seconds * 1e6).astype("timedelta64[us]")
+    result["noon"] = np.broadcast_to(noon, (latitudes.size, longitudes.size))
+
+    events = ("dawn", "sunrise", "noon", "sunset", "dusk")
+    result = {name: result[name] for name in events}
+    result["always_above"] = status < 0
+    result["always_below"] = status > 0
+    return result
+
+
+def _grid_cos_zenith(
+    latitudes: ArrayLike, longitudes: ArrayLike, time
+) -> np.ndarray:
+    """Calculate the cosine of the sun's zenith angle, without refraction, for
+    each latitude (rows) and longitude (columns) at a UTC time"""
+    latitudes = np.clip(np.asarray(latitudes, dtype=float).reshape(-1), -89.8, 89.8)
+    longitudes = np.asarray(longitudes, dtype=float).reshape(-1)
+    time = np.datetime64(time, "s")
+
+    jc = _juliancentury(julianday(time))
+    declination = np.radians(sun_declination(jc))
+    minutes = (time - time.astype("datetime64[D]")).astype(np.int64) / 60.0
+
+    true_solar_time = minutes + eq_of_time(jc) + 4.0 * longitudes
+    true_solar_time = np.where(
+        true_solar_time > 1440.0, true_solar_time % 1440.0, true_solar_time
+    )
+    hourangle = true_solar_time / 4.0 - 180.0
+    hourangle = np.where(hourangle < -180.0, hourangle + 360.0, hourangle)
+
+    latitudes = np.radians(latitudes)
+    csz = np.outer(
+        np.cos(latitudes), np.cos(declination) * np.cos(np.radians(hourangle))
+    )
+    csz += (np.sin(latitudes) * np.sin(declination))[:, np.newaxis]
+    return np.clip(csz, -1.0, 1.0, out=csz)
+
+
+def elevation_grid(
+    latitudes: ArrayLike,
+    longitudes: ArrayLike,
+    time,
+    with_refraction: bool = True,
+) -> np.ndarray:
+    """Calculate the elevation of the sun in degrees for a grid of latitudes and
+    longitudes at a single UTC time, as :func:`elevation`.
+
+    Returns:
+        An array with a row for each latitude and a column for each longitude.
+    """
+    zenith = np.degrees(np.arccos(_grid_cos_zenith(latitudes, longitudes, time)))
+    if with_refraction:
+        zenith -= refraction_at_zenith(zenith)
+    return 90.0 - zenith
+
+
+def daylight_grid(
+    latitudes: ArrayLike,
+    longitudes: ArrayLike,
+    time,
+    depression: float = 0.0,
+) -> np.ndarray:
+    """Calculate where it is day for a grid of latitudes and longitudes at a
+    single UTC time.
+
+    With the default depression of 0 this is where the top of the sun is above
+    the horizon, between the sunrise and sunset found by :func:`sun_grid`. Pass
+    a depression (e.g. ``Depression.CIVIL``) to find where it is after dawn and
+    before dusk instead.
+
+    Returns:
+        A boolean array with a row for each latitude and a column for each
+        longitude which is ``True`` where it is day and ``False`` where it is
+        night.
+    """
+    if isinstance(depression, Depression):
+        depression = depression.value
+
+    # Compare with the zenith used to calculate the events rather than
+    # adjusting every value for refraction
+    if depression:
+        zenith = 90.0 + float(depression)
+    else:
+        zenith = 90.0 + SUN_APPARENT_RADIUS
+    zenith += float(refraction_at_zenith(zenith))
+    return _grid_cos_zenith(latitudes, longitudes, time) > np.cos(np.radians(zenith))
+
+
+def moon_phase(dates) -> np.ndarray:
+    """Calculate the phase of the moon for each date, as :func:`astral.moon.phase`"""
+    jd = julianday(np.asarray(dates, dtype="datetime64[D]"))
+    dt = (jd - 2382148) ** 2 / (41048480 * 86400)
+    t = (jd + dt - 2451545.0) / 36525
+    t2 = t * t
+    t3 = t2 * t
+
+    d = np.radians((297.85 + 445267.1115 * t - 0.0016300 * t2 + t3 / 545868) % 360.0)
+    m = np.radians((357.53 + 35999.0503 * t) % 360.0)
+    m1 = np.radians(
+        (134.96 + 477198.8676 * t + 0.0089970 * t2 + t3 / 69699) % 360.0
+    )
+
+    elong = np.degrees(d) + 6.29 * np.sin(m1)
+    elong -= 2.10 * np.sin(m)
+    elong += 1.27 * np.sin(2 * d - m1)
+    elong += 0.66 * np.sin(2 * d)
+    elong = np.floor(elong % 360.0)
+    moon = ((elong + 6.43) / 360) * 28
+    return np.where(moon >= 28.0, moon - 28.0, moon)
@@ -0,0 +1,45 @@
+"""Time classifying a fleet of devices as in daylight, twilight or night, first
+when all of their events are calculated and then a minute later::
+
+    python src/bench/bench_fleet.py [devices]
+"""
+
+import datetime
+import os
+import sys
+import time
+from typing import Dict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astral.fleet import FleetClassifier  # noqa: E402
+
+NOW = datetime.datetime(2024, 6, 21, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def main(devices: int = 2_000_000) -> Dict[str, float]:
+    rng = np.random.default_rng(0)
+    latitudes = rng.uniform(-90.0, 90.0, devices)
+    longitudes = rng.uniform(-180.0, 180.0, devices)
+    classifier = FleetClassifier(latitudes, longitudes)
+
+    results = {}
+    start = time.perf_counter()
+    classifier.classify(NOW)
+    results["first"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for minute in range(1, 61):
+        classifier.classify(NOW + datetime.timedelta(minutes=minute))
+    results["per minute"] = (time.perf_counter() - start) / 60
+
+    print(f"{devices} devices")
+    for name, seconds in results.items():
+        print(f"{name:20} {seconds * 1000:10.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,44 @@
+"""Time the calculation of the sun's events and a day/night mask for a global
+grid of latitudes and longitudes::
+
+    python src/bench/bench_grid.py [columns] [rows]
+"""
+
+import os
+import sys
+import time
+from typing import Dict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astral import vectorized  # noqa: E402
+
+
+def main(columns: int = 3600, rows: int = 1800) -> Dict[str, float]:
+    # Cell centres
+    latitudes = np.linspace(-90.0, 90.0, rows, endpoint=False) + 90.0 / rows
+    longitudes = np.linspace(-180.0, 180.0, columns, endpoint=False) + 180.0 / columns
+
+    results = {}
+    start = time.perf_counter()
+    vectorized.sun_grid(latitudes, longitudes, "2024-06-21")
+    results["sun_grid"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized.daylight_grid(latitudes, longitudes, "2024-06-21T12:00")
+    results["daylight_grid"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized.elevation_grid(latitudes, longitudes, "2024-06-21T12:00")
+    results["elevation_grid"] = time.perf_counter() - start
+
+    print(f"{columns} x {rows} grid")
+    for name, seconds in results.items():
+        print(f"{name:20} {seconds * 1000:10.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,46 @@
+"""Measure the time taken to import the astral modules.
+
+Each module is imported in a fresh interpreter using ``python -X importtime`` and
+the median cumulative import time, in microseconds, is reported::
+
+    python src/bench/bench_import.py [repeat]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+MODULES = ["astral", "astral.sun", "astral.moon", "astral.location", "astral.geocoder"]
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str) -> int:
+    """Return the cumulative import time in microseconds for `module`"""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    last = result.stderr.strip().splitlines()[-1]
+    return int(last.split("|")[1])
+
+
+def main(repeat: int = 20) -> Dict[str, float]:
+    timings: Dict[str, List[int]] = {module: [] for module in MODULES}
+    for _ in range(repeat):
+        for module in MODULES:
+            timings[module].append(import_time(module))
+
+    results = {module: statistics.median(times) for module, times in timings.items()}
+    for module, median in results.items():
+        print(f"{module:20} {median:10.0f} us")
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
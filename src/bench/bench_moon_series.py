@@ -0,0 +1,106 @@
+"""Compare the speed and accuracy of the moon's position and rise and set times
+calculated with the series truncated at different cutoffs::
+
+    python src/bench/bench_moon_series.py [days between samples]
+
+The errors are the largest differences from the full series between 1900 and
+2100 for positions sampled every `days` / 10 days and rise and set times every
+`days` days at latitudes of 0, 40 and 60 degrees.
+"""
+
+import datetime
+import os
+import sys
+import time
+from math import degrees, pi
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astral import Observer, moon  # noqa: E402
+
+CUTOFFS = (0.0, 0.00005, 0.0001, 0.0005, 0.001, 0.003)
+START = datetime.date(1900, 1, 1)
+END = datetime.date(2100, 1, 1)
+OBSERVERS = (Observer(0.0, 0.0), Observer(40.0, -74.0), Observer(60.0, 25.0))
+
+
+def _angle(a: float, b: float) -> float:
+    """The difference between two angles in arc seconds"""
+    difference = (a - b + pi) % (2 * pi) - pi
+    return abs(degrees(difference)) * 3600
+
+
+def _events(days: float) -> List[float]:
+    """The rise and set times at the sample dates as timestamps, or NaN when
+    there is no event"""
+    events = []
+    date = START
+    while date < END:
+        for observer in OBSERVERS:
+            for func in (moon.moonrise, moon.moonset):
+                try:
+                    events.append(func(observer, date).timestamp())
+                except ValueError:
+                    events.append(float("nan"))
+        date += datetime.timedelta(days=days)
+    return events
+
+
+def main(days: float = 30.0) -> Dict[float, Dict[str, float]]:
+    start = moon.julianday_2000(START)
+    count = int((moon.julianday_2000(END) - start) / (days / 10))
+    samples = [start + idx * days / 10 for idx in range(count)]
+
+    moon.set_series_cutoff(0.0)
+    full = [moon.moon_position(jd2000) for jd2000 in samples]
+    full_events = _events(days)
+
+    results = {}
+    try:
+        for cutoff in CUTOFFS:
+            moon.set_series_cutoff(cutoff)
+            begin = time.perf_counter()
+            positions = [moon.moon_position(jd2000) for jd2000 in samples]
+            per_call = (time.perf_counter() - begin) / len(samples)
+
+            events = _events(days)
+            missing = sum(
+                (a != a) != (b != b) for a, b in zip(events, full_events)  # NaN
+            )
+            results[cutoff] = {
+                "terms": float(sum(len(s) for s in moon._truncated_series(cutoff))),
+                "microseconds": per_call * 1e6,
+                "ra": max(
+                    _angle(p.right_ascension, f.right_ascension)
+                    for p, f in zip(positions, full)
+                ),
+                "dec": max(
+                    _angle(p.declination, f.declination)
+                    for p, f in zip(positions, full)
+                ),
+                "riseset": max(
+                    (
+                        abs(a - b)
+                        for a, b in zip(events, full_events)
+                        if a == a and b == b
+                    ),
+                    default=0.0,
+                ),
+                "missing": float(missing),
+            }
+    finally:
+        moon.set_series_cutoff(0.0)
+
+    print("cutoff   terms   us/call   RA (\")   Dec (\")   rise/set (s)  missing")
+    for cutoff, result in results.items():
+        print(
+            f"{cutoff:<8g} {result['terms']:5.0f} {result['microseconds']:9.1f} "
+            f"{result['ra']:8.1f} {result['dec']:9.1f} {result['riseset']:13.1f} "
+            f"{result['missing']:8.0f}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 30.0)
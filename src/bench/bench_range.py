@@ -0,0 +1,73 @@
+"""Compare the date range methods of Location with calling the single date
+methods for each date::
+
+    python src/bench/bench_range.py [days]
+"""
+
+import datetime
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astral import LocationInfo  # noqa: E402
+from astral.location import Location  # noqa: E402
+
+START = datetime.date(2024, 1, 1)
+
+
+def sun_loop(location: Location, days: int) -> None:
+    for offset in range(days):
+        date = START + datetime.timedelta(days=offset)
+        for method in ("dawn", "sunrise", "noon", "sunset", "dusk"):
+            try:
+                getattr(location, method)(date)
+            except ValueError:
+                pass
+
+
+def moon_loop(location: Location, days: int) -> None:
+    for offset in range(days):
+        date = START + datetime.timedelta(days=offset)
+        for method in ("moonrise", "moonset"):
+            try:
+                getattr(location, method)(date)
+            except ValueError:
+                pass
+        location.moon_phase(date)
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(days: int = 365) -> Dict[str, float]:
+    end = START + datetime.timedelta(days=days - 1)
+    results = {}
+    for info in (
+        LocationInfo("London", "England", "Europe/London", 51.5, -0.13),
+        LocationInfo("Tromso", "Norway", "Europe/Oslo", 69.6, 18.95),
+    ):
+        # A new Location for each run so that no cached results are used
+        results[f"{info.name} sun loop"] = timed(lambda: sun_loop(Location(info), days))
+        results[f"{info.name} sun_range"] = timed(
+            lambda: Location(info).sun_range(START, end)
+        )
+        results[f"{info.name} moon loop"] = timed(
+            lambda: moon_loop(Location(info), days)
+        )
+        results[f"{info.name} moon_range"] = timed(
+            lambda: Location(info).moon_range(START, end)
+        )
+
+    for name, seconds in results.items():
+        print(f"{name:20} {seconds * 1000:10.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 365)
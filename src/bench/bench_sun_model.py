@@ -0,0 +1,115 @@
+"""Compare the speed and accuracy of the fast solar model with the NOAA
+formulae::
+
+    python src/bench/bench_sun_model.py [days between samples]
+
+The errors are the largest differences from the NOAA formulae between 1900 and
+2100 for the declination and equation of time sampled every `days` / 10 days and
+the events every `days` days at latitudes of 0, 40 and 60 degrees.
+"""
+
+import datetime
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astral import Observer, sun  # noqa: E402
+from astral.sun import SolarModel  # noqa: E402
+
+START = datetime.date(1900, 1, 1)
+END = datetime.date(2100, 1, 1)
+OBSERVERS = (Observer(0.0, 0.0), Observer(40.0, 0.0), Observer(60.0, 0.0))
+LONDON = Observer(51.5, -0.13)
+EVENTS: Dict[str, Callable[..., datetime.datetime]] = {
+    "noon": sun.noon,
+    "sunrise": sun.sunrise,
+    "sunset": sun.sunset,
+    "dawn": sun.dawn,
+    "dusk": sun.dusk,
+}
+
+
+def _events(days: float) -> Dict[str, List[Optional[float]]]:
+    """The times of the events at the sample dates as timestamps, or None when
+    there is no event"""
+    events: Dict[str, List[Optional[float]]] = {name: [] for name in EVENTS}
+    date = START
+    while date < END:
+        for observer in OBSERVERS:
+            for name, func in EVENTS.items():
+                try:
+                    events[name].append(func(observer, date).timestamp())
+                except ValueError:
+                    events[name].append(None)
+        date += datetime.timedelta(days=days)
+    return events
+
+
+def timed(func: Callable[[], object], repeat: int = 5) -> float:
+    """The shortest time taken by `repeat` calls"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(days: float = 30.0) -> Dict[str, Dict[str, float]]:
+    start = (sun.julianday(START) - 2451545.0) / 36525.0
+    end = (sun.julianday(END) - 2451545.0) / 36525.0
+    count = int((end - start) * 36525.0 / (days / 10))
+    samples = [start + idx * (end - start) / count for idx in range(count)]
+    dates = [START + datetime.timedelta(days=offset) for offset in range(365)]
+
+    results: Dict[str, Dict[str, float]] = {}
+    terms = {}
+    events = {}
+    try:
+        for model in SolarModel:
+            sun.set_solar_model(model)
+            seconds = timed(lambda: [sun._solar_terms(jc) for jc in samples])
+            terms[model] = [sun._solar_terms(jc) for jc in samples]
+            events[model] = _events(days)
+            results[model.value] = {
+                "terms": seconds / len(samples) * 1e6,
+                "sun": timed(lambda: [sun.sun(LONDON, d) for d in dates])
+                / len(dates)
+                * 1e6,
+            }
+    finally:
+        sun.set_solar_model(SolarModel.NOAA)
+
+    noaa = terms[SolarModel.NOAA]
+    fast = terms[SolarModel.FAST]
+    errors = {
+        "declination (')": max(abs(a[0] - b[0]) for a, b in zip(noaa, fast)) * 60,
+        "equation of time (s)": max(abs(a[1] - b[1]) for a, b in zip(noaa, fast))
+        * 60,
+    }
+    for name in EVENTS:
+        # Events close to midnight can move to the neighbouring day
+        pairs = zip(events[SolarModel.NOAA][name], events[SolarModel.FAST][name])
+        differences = [
+            (a - b + 43200.0) % 86400.0 - 43200.0
+            for a, b in pairs
+            if a is not None and b is not None
+        ]
+        errors[f"{name} (s)"] = max((abs(d) for d in differences), default=0.0)
+    results["errors"] = errors
+
+    for model in SolarModel:
+        print(
+            f"{model.value:5} {results[model.value]['terms']:6.2f} us per position "
+            f"{results[model.value]['sun']:8.1f} us per sun()"
+        )
+    for name, error in errors.items():
+        print(f"{name:22} {error:8.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 30.0)
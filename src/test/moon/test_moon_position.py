@@ -1,5 +1,9 @@
 from datetime import date
+from math import radians
 
+import pytest  # type: ignore
+
+from astral import Observer, moon
 from astral.moon import julianday, moon_position
 
 
@@ -16,5 +20,42 @@ def test_moon_position():
     pass
 
 
+@pytest.mark.parametrize(
+    "cutoff,arcminutes",
+    [(0.00005, 3.0), (0.0001, 5.0), (0.001, 30.0)],
+)
+def test_moon_position_cutoff(cutoff: float, arcminutes: float):
+    jd2000 = julianday(date(2024, 3, 5)) - 2451545
+    full = moon_position(jd2000)
+    truncated = moon_position(jd2000, cutoff)
+    assert truncated != full
+    assert truncated.right_ascension == pytest.approx(
+        full.right_ascension, abs=radians(arcminutes / 60)
+    )
+    assert truncated.declination == pytest.approx(
+        full.declination, abs=radians(arcminutes / 60)
+    )
+
+
+def test_set_series_cutoff():
+    observer = Observer(51.5, -0.13)
+    day = date(2024, 3, 5)
+    expected = moon.moonrise(observer, day)
+    moon.set_series_cutoff(0.0001)
+    try:
+        assert moon.series_cutoff() == 0.0001
+        assert len(moon._truncated_series(0.0001)[0]) < 64
+        assert abs((moon.moonrise(observer, day) - expected).total_seconds()) <= 60
+    finally:
+        moon.set_series_cutoff()
+    assert moon.series_cutoff() == 0.0
+    assert moon.moonrise(observer, day) == expected
+
+
+def test_set_series_cutoff_negative():
+    with pytest.raises(ValueError):
+        moon.set_series_cutoff(-1.0)
+
+
 if __name__ == "__main__":
     test_moon_position()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import dataclasses
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import zoneinfo
@@ -11,7 +12,9 @@ import freezegun
 import pytest  # type: ignore
 from almost_equal import datetime_almost_equal
 
-from astral import LocationInfo
+import astral.moon
+import astral.sun
+from astral import HorizonProfile, LocationInfo, Observer, ephemeris
 from astral.location import Location
 
 
@@ -226,3 +229,111 @@ class TestLocation:
 
         with pytest.raises(ValueError):
             loc.tzinfo
+
+
+class TestLocationCache:
+    """Tests for the caching of results by the Location class"""
+
+    def test_ObserverNotShared(self, london: Location):
+        london.sunrise(datetime.date(2015, 12, 1))
+        observer = london.observer
+        assert observer is not london.observer
+        observer.latitude = 40.0
+        assert london.observer.latitude == london.latitude
+
+        d = datetime.date(2015, 12, 2)
+        expected = astral.sun.sunrise(
+            Observer(london.latitude, london.longitude), d, london.tzinfo
+        )
+        assert london.sunrise(d) == expected
+
+    def test_TzinfoCached(self, london: Location):
+        assert london.tzinfo is london.tzinfo
+
+    def test_ResultCached(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        assert london.sunrise(d) is london.sunrise(d)
+        assert london.sunrise(d, local=False).tzinfo == datetime.timezone.utc
+
+    def test_ResultCacheThreads(self, london: Location):
+        start = datetime.date(2015, 1, 1)
+        dates = [start + datetime.timedelta(days=n) for n in range(200)]
+        expected = [london.noon(d) for d in dates]
+
+        def noons(offset: int):
+            rotated = dates[offset:] + dates[:offset]
+            return [london.noon(d) for d in rotated]
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(noons, range(0, 200, 25)))
+        for offset, result in zip(range(0, 200, 25), results):
+            assert result == expected[offset:] + expected[:offset]
+
+    def test_SunDictCopied(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        sun = london.sun(d)
+        del sun["dawn"]
+        assert "dawn" in london.sun(d)
+
+    def test_LatitudeClearsCache(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        before = london.sunrise(d)
+        london.latitude = 40.0
+        assert london.observer.latitude == 40.0
+        assert london.sunrise(d) != before
+
+    def test_TimezoneClearsCache(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        before = london.noon(d)
+        london.timezone = "Europe/Stockholm"
+        assert london.tzinfo == zoneinfo.ZoneInfo("Europe/Stockholm")  # type: ignore
+        after = london.noon(d)
+        assert after == before
+        assert after.tzinfo != before.tzinfo
+
+    def test_DepressionChange(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        civil = london.dawn(d)
+        london.solar_depression = "nautical"
+        assert london.dawn(d) < civil
+
+    def test_SolarModelChange(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        noaa = london.sunrise(d)
+        astral.sun.set_solar_model("fast")
+        try:
+            fast = london.sunrise(d)
+            assert fast == astral.sun.sunrise(london.observer, d, london.tzinfo)
+            assert fast != noaa
+        finally:
+            astral.sun.set_solar_model("noaa")
+        assert london.sunrise(d) == noaa
+
+    def test_SeriesCutoffChange(self, london: Location):
+        d = datetime.date(2015, 12, 2)
+        full = london.moonrise(d)
+        astral.moon.set_series_cutoff(0.003)
+        try:
+            truncated = london.moonrise(d)
+            assert truncated == astral.moon.moonrise(london.observer, d, london.tzinfo)
+            assert truncated != full
+        finally:
+            astral.moon.set_series_cutoff(0.0)
+
+    def test_EphemerisChange(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        calculated = london.sunrise(d)
+        shared = ephemeris.share_ephemeris(d, d)
+        try:
+            ephemeris.install(shared)
+            interpolated = london.sunrise(d)
+            assert interpolated == astral.sun.sunrise(london.observer, d, london.tzinfo)
+            assert interpolated != calculated
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_UnhashableElevation(self, london: Location):
+        d = datetime.date(2015, 12, 1)
+        profile = HorizonProfile((2.0,))
+        assert london.sunrise(d, observer_elevation=profile) > london.sunrise(d)
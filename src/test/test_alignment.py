@@ -0,0 +1,80 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Observer, SunDirection, moon, sun
+from astral.alignment import moon_alignments, sun_alignments
+
+# Manhattan's streets run at about 29 degrees East of North
+MANHATTAN = Observer(40.758, -73.9855)
+START = datetime.date(2024, 1, 1)
+END = datetime.date(2024, 12, 31)
+
+
+@pytest.mark.parametrize("direction", [SunDirection.RISING, SunDirection.SETTING])
+def test_SunAlignments(direction):
+    bearing = 299.0 if direction == SunDirection.SETTING else 119.0
+    result = sun_alignments(MANHATTAN, bearing, START, END, direction)
+    assert result
+    assert [match.time for match in result] == sorted(match.time for match in result)
+
+    for match in result:
+        assert abs(match.difference) <= 0.5
+        expected = sun.azimuth(MANHATTAN, match.time)
+        assert match.azimuth == pytest.approx(expected, abs=0.01)
+        # The sun sets after midnight UTC so may be found for the previous date
+        assert min(
+            abs((match.time - sun.time_at_elevation(MANHATTAN, 0.0, d, direction)))
+            for d in (match.time.date(), match.time.date() - datetime.timedelta(1))
+        ) < datetime.timedelta(seconds=1)
+
+        # The sun reaches the bearing close to the crossing
+        assert abs(match.aligned - match.time) < datetime.timedelta(minutes=10)
+        assert sun.azimuth(MANHATTAN, match.aligned) == pytest.approx(
+            bearing, abs=0.01
+        )
+        assert match.aligned_elevation == pytest.approx(
+            sun.elevation(MANHATTAN, match.aligned), abs=0.01
+        )
+
+
+def test_SunAlignmentsSummer():
+    result = sun_alignments(MANHATTAN, 299.0, START, END)
+    # Once as the sunset moves North in May and again as it returns in July
+    months = {match.time.month for match in result}
+    assert months == {5, 7}
+
+
+def test_SunAlignmentsElevation():
+    result = sun_alignments(
+        MANHATTAN, 300.0, START, END, elevation=10.0, tolerance=1.0
+    )
+    for match in result:
+        assert sun.elevation(MANHATTAN, match.time) == pytest.approx(10.0, abs=0.01)
+
+
+def test_SunAlignmentsUnreachable():
+    assert sun_alignments(MANHATTAN, 0.0, START, END) == []
+
+
+def test_SunAlignmentsTimezone():
+    result = sun_alignments(MANHATTAN, 299.0, START, END, tzinfo="America/New_York")
+    assert all(match.time.tzinfo.key == "America/New_York" for match in result)
+
+
+def test_MoonAlignments():
+    result = moon_alignments(MANHATTAN, 299.0, START, END, tolerance=2.0)
+    assert result
+    for match in result:
+        assert abs(match.difference) <= 2.0
+        expected = moon.azimuth(MANHATTAN, match.time)
+        assert match.azimuth == pytest.approx(expected, abs=0.01)
+        moonset = moon.moonset(MANHATTAN, match.time.date())
+        assert abs((moonset - match.time).total_seconds()) < 60
+
+        assert moon.azimuth(MANHATTAN, match.aligned) == pytest.approx(
+            299.0, abs=0.01
+        )
+        assert match.aligned_elevation == pytest.approx(
+            moon.elevation(MANHATTAN, match.aligned), abs=0.01
+        )
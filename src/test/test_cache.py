@@ -0,0 +1,261 @@
+import datetime
+import sqlite3
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo  # type: ignore
+
+import pytest  # type: ignore
+
+import astral
+import astral.moon
+import astral.sun
+from astral import Observer, cache, ephemeris, instrumentation
+from astral.location import Location
+
+DATE = datetime.date(2024, 3, 1)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache.enable(path)
+    yield path
+    cache.disable()
+
+
+def test_DisabledByDefault():
+    assert not cache.enabled()
+    assert not hasattr(astral.sun.sunrise, "__wrapped__")
+
+
+def test_EnableDisable(tmp_path):
+    original = astral.sun.sunrise
+    cache.enable(tmp_path / "cache.sqlite")
+    try:
+        assert cache.enabled()
+        assert astral.sun.sunrise.__wrapped__ is original
+        with pytest.raises(RuntimeError):
+            cache.enable(tmp_path / "other.sqlite")
+    finally:
+        cache.disable()
+    assert astral.sun.sunrise is original
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+
+def test_Hit(path, london: Location):
+    first = astral.sun.sunrise(london.observer, DATE, tzinfo=london.tzinfo)
+    assert cache.stats()["misses"] == 1
+    second = astral.sun.sunrise(london.observer, DATE, tzinfo=london.tzinfo)
+    assert cache.stats()["hits"] == 1
+    assert second == first
+    assert second.tzinfo == first.tzinfo
+    assert second.utcoffset() == first.utcoffset()
+
+
+def test_KeywordArguments(path, london: Location):
+    astral.sun.dawn(london.observer, DATE, 6.0)
+    astral.sun.dawn(observer=london.observer, date=DATE, depression=6.0)
+    assert cache.stats()["hits"] == 1
+
+
+def test_Restart(tmp_path, london: Location):
+    path = tmp_path / "cache.sqlite"
+    cache.enable(path)
+    try:
+        expected = astral.sun.sun(london.observer, DATE, tzinfo="Europe/London")
+    finally:
+        cache.disable()
+
+    cache.enable(path)
+    try:
+        result = astral.sun.sun(london.observer, DATE, tzinfo="Europe/London")
+        assert cache.stats()["hits"] == 1
+        assert result == expected
+    finally:
+        cache.disable()
+
+
+@pytest.mark.parametrize(
+    "func,args",
+    [
+        ("daylight", ()),
+        ("golden_hour", (astral.SunDirection.SETTING,)),
+        ("rahukaalam", ()),
+    ],
+)
+def test_Tuples(path, london: Location, func: str, args):
+    expected = getattr(astral.sun, func)(london.observer, DATE, *args)
+    result = getattr(astral.sun, func)(london.observer, DATE, *args)
+    assert cache.stats()["hits"] == 1
+    assert isinstance(result, tuple)
+    assert result == expected
+
+
+def _first_datetime(value):
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (tuple, list)):
+        return _first_datetime(value[0])
+    return value
+
+
+@pytest.mark.parametrize(
+    "module,func,kwargs",
+    [
+        (module, func, {"elevation": 10.0} if func == "time_at_elevation" else {})
+        for module, funcs in cache._CACHED
+        for func in funcs
+        if not func.endswith("_range")
+    ],
+)
+def test_AwareDate(tmp_path, london: Location, module: str, func: str, kwargs):
+    tzinfo = zoneinfo.ZoneInfo("Europe/Berlin")  # type: ignore
+    kwargs["date"] = datetime.datetime(2024, 3, 5, 12, tzinfo=tzinfo)
+    expected = getattr(getattr(astral, module), func)(london.observer, **kwargs)
+
+    cache.enable(tmp_path / "cache.sqlite")
+    try:
+        cached = getattr(getattr(astral, module), func)
+        cached(london.observer, **kwargs)
+        result = cached(london.observer, **kwargs)
+        assert cache.stats()["hits"] >= 1
+    finally:
+        cache.disable()
+    assert result == expected
+    assert _first_datetime(result).tzinfo == _first_datetime(expected).tzinfo
+
+
+def test_Ephemeris(path, london: Location):
+    expected = astral.sun.sunrise(london.observer, DATE)
+    shared = ephemeris.share_ephemeris(DATE, DATE)
+    try:
+        ephemeris.install(shared)
+        interpolated = astral.sun.sunrise(london.observer, DATE)
+        assert cache.stats() == {"hits": 0, "misses": 2, "entries": 2}
+        assert interpolated != expected
+    finally:
+        shared.close()
+        shared.unlink()
+    assert astral.sun.sunrise(london.observer, DATE) == expected
+    assert cache.stats()["hits"] == 1
+
+
+def test_Moon(path, london: Location):
+    date = datetime.date(2024, 3, 5)
+    expected = astral.moon.moonrise(london.observer, date)
+    assert astral.moon.moonrise(london.observer, date) == expected
+    assert cache.stats()["hits"] == 1
+
+
+def test_Range(path, london: Location):
+    end = DATE + datetime.timedelta(days=9)
+    expected = astral.sun.sun_range(london.observer, DATE, end)
+    assert astral.sun.sun_range(london.observer, DATE, end) == expected
+    assert cache.stats()["hits"] == 1
+
+
+def test_Exception(path):
+    observer = Observer(70.0, 0.0)
+    date = datetime.date(2024, 6, 21)
+    for _ in range(2):
+        with pytest.raises(ValueError) as exc:
+            astral.sun.sunset(observer, date)
+    assert cache.stats()["hits"] == 1
+    assert "always above" in str(exc.value)
+
+
+def test_TodayNotCached(path, london: Location):
+    astral.sun.noon(london.observer)
+    astral.sun.noon(london.observer)
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+
+def test_Version(path, london: Location, monkeypatch):
+    astral.sun.noon(london.observer, DATE)
+    monkeypatch.setattr(astral, "__version__", "0.0")
+    astral.sun.noon(london.observer, DATE)
+    assert cache.stats()["misses"] == 2
+
+
+def test_Location(path, london: Location):
+    london.sunset(DATE)
+    assert cache.stats()["misses"] == 1
+
+
+def test_Eviction(tmp_path, london: Location):
+    path = tmp_path / "cache.sqlite"
+    cache.enable(path, max_entries=20)
+    try:
+        for offset in range(100):
+            date = DATE + datetime.timedelta(days=offset)
+            astral.sun.noon(london.observer, date)
+        assert cache.stats()["entries"] <= 20
+        # The most recent results are kept
+        astral.sun.noon(london.observer, DATE + datetime.timedelta(days=99))
+        assert cache.stats()["hits"] == 1
+    finally:
+        cache.disable()
+
+
+def test_ConcurrentReader(path, london: Location):
+    astral.sun.noon(london.observer, DATE)
+    # Another process can read the database while it is in use
+    connection = sqlite3.connect(path)
+    try:
+        (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        assert count == 1
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("cache_first", [True, False])
+@pytest.mark.parametrize("disable_cache_first", [True, False])
+def test_WithInstrumentation(
+    tmp_path, london: Location, cache_first: bool, disable_cache_first: bool
+):
+    original = astral.sun.sunrise
+    enables = [lambda: cache.enable(tmp_path / "cache.sqlite"), instrumentation.enable]
+    disables = [cache.disable, instrumentation.disable]
+    if not cache_first:
+        enables.reverse()
+    if not disable_cache_first:
+        disables.reverse()
+
+    instrumentation.reset()
+    try:
+        for enable in enables:
+            enable()
+        astral.sun.sunrise(london.observer, DATE)
+        assert cache.stats()["misses"] == 1
+        assert instrumentation.snapshot()["sun.sunrise"]["calls"] == 1
+
+        disables[0]()
+        astral.sun.sunrise(london.observer, DATE)
+        assert cache.enabled() == (not disable_cache_first)
+        assert instrumentation.enabled() == disable_cache_first
+        calls = 2 if disable_cache_first else 1
+        assert instrumentation.snapshot()["sun.sunrise"]["calls"] == calls
+
+        disables[1]()
+        assert astral.sun.sunrise is original
+        astral.sun.sunrise(london.observer, DATE)
+        assert instrumentation.snapshot()["sun.sunrise"]["calls"] == calls
+    finally:
+        cache.disable()
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_Replaced(tmp_path, monkeypatch):
+    cache.enable(tmp_path / "cache.sqlite")
+    try:
+        monkeypatch.setattr(astral.sun, "sunrise", lambda *args: None)
+        with pytest.raises(RuntimeError):
+            cache.disable()
+        assert cache.enabled()
+    finally:
+        monkeypatch.undo()
+        cache.disable()
+    assert not cache.enabled()
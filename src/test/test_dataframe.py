@@ -0,0 +1,61 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Observer, moon, sun
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("astral.dataframe")
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "lat": [51.5, 69.6, -41.3],
+            "lon": [-0.13, 18.95, 174.8],
+            "ts": pd.to_datetime(
+                ["2024-06-21 05:30", "2024-12-21 12:00", "2024-03-01 23:59"]
+            ).tz_localize("UTC"),
+        },
+        index=["london", "tromso", "wellington"],
+    )
+
+
+def test_SunPosition(frame):
+    result = frame.astral.sun_position(lat="lat", lon="lon", time="ts")
+    assert list(result.columns) == ["zenith", "azimuth", "elevation"]
+    assert list(result.index) == list(frame.index)
+
+    for name, row in frame.iterrows():
+        observer = Observer(row.lat, row.lon)
+        expected = sun.elevation(observer, row.ts.to_pydatetime())
+        assert result.loc[name, "elevation"] == pytest.approx(expected, abs=1e-9)
+
+
+def test_SunPositionLocalTimes(frame):
+    utc = frame.astral.sun_position(lat="lat", lon="lon", time="ts")
+    frame["ts"] = frame["ts"].dt.tz_convert("Asia/Tokyo")
+    local = frame.astral.sun_position(lat="lat", lon="lon", time="ts")
+    assert local["zenith"].tolist() == pytest.approx(utc["zenith"].tolist())
+
+
+def test_SunEvents(frame):
+    frame["date"] = frame["ts"].dt.date
+    result = frame.astral.sun_events(lat="lat", lon="lon")
+    assert list(result.columns) == ["dawn", "sunrise", "noon", "sunset", "dusk"]
+    assert pd.isna(result.loc["tromso", "sunrise"])
+
+    expected = sun.time_of_transit(
+        Observer(51.5, -0.13),
+        datetime.date(2024, 6, 21),
+        90.0 + sun.SUN_APPARENT_RADIUS,
+        sun.SunDirection.RISING,
+    )
+    assert result.loc["london", "sunrise"].to_pydatetime() == expected
+
+
+def test_MoonPhase(frame):
+    result = frame.astral.moon_phase(date="ts")
+    assert result.name == "moon_phase"
+    assert result["london"] == pytest.approx(moon.phase(datetime.date(2024, 6, 21)))
@@ -0,0 +1,179 @@
+import datetime
+import multiprocessing
+
+import pytest  # type: ignore
+
+from astral import LocationInfo, ephemeris, moon, sun
+
+START = datetime.date(2024, 3, 1)
+END = datetime.date(2024, 3, 10)
+
+
+def _close(a, b, seconds=1.0):
+    return abs((a - b).total_seconds()) < seconds
+
+
+@pytest.fixture
+def shared():
+    shared = ephemeris.share_ephemeris(START, END)
+    yield shared
+    shared.close()
+    shared.unlink()
+
+
+def test_Positions(shared: ephemeris.Ephemeris):
+    for hours in range(0, 10 * 24, 7):
+        jd = 2460370.5 + hours / 24
+        declination, eqtime = shared.sun(jd)
+        expected = sun._ephemeris(jd)
+        assert declination == pytest.approx(expected[0], abs=1e-6)
+        assert eqtime == pytest.approx(expected[1], abs=1e-5)
+
+        jd2000 = jd - 2451545.0
+        position = shared.moon(jd2000)
+        expected_position = moon._moon_position(jd2000)
+        assert position.right_ascension == pytest.approx(
+            expected_position.right_ascension, abs=1e-6
+        )
+        assert position.declination == pytest.approx(
+            expected_position.declination, abs=1e-6
+        )
+        assert position.distance == pytest.approx(expected_position.distance, abs=1e-5)
+
+
+def test_OutsideRange(shared: ephemeris.Ephemeris):
+    assert shared.sun(2460370.5 - 30) is None
+    assert shared.moon(2460370.5 + 30 - 2451545.0) is None
+
+
+def test_Install(shared: ephemeris.Ephemeris, london_info: LocationInfo):
+    observer = london_info.observer
+    date = datetime.date(2024, 3, 5)
+    expected_sun = sun.sun(observer, date)
+    expected_moonrise = moon.moonrise(observer, date)
+
+    ephemeris.install(shared)
+    try:
+        assert ephemeris.installed() is shared
+        assert sun._shared_ephemeris is shared
+        actual_sun = sun.sun(observer, date)
+        for name in ("dawn", "sunrise", "sunset", "dusk"):
+            assert _close(actual_sun[name], expected_sun[name])
+        assert _close(moon.moonrise(observer, date), expected_moonrise)
+
+        # Dates outside the range are calculated
+        later = datetime.date(2024, 6, 1)
+        ephemeris.uninstall()
+        expected = moon.moonset(observer, later)
+        ephemeris.install(shared)
+        assert moon.moonset(observer, later) == expected
+    finally:
+        ephemeris.uninstall()
+    assert sun._shared_ephemeris is None
+    assert moon._shared_ephemeris is None
+
+
+def test_ModelsStored(shared: ephemeris.Ephemeris):
+    assert shared.solar_model is sun.SolarModel.NOAA
+    assert shared.series_cutoff == 0.0
+
+    sun.set_solar_model(sun.SolarModel.FAST)
+    moon.set_series_cutoff(0.001)
+    try:
+        with ephemeris.share_ephemeris(START, END) as other:
+            try:
+                assert other.solar_model is sun.SolarModel.FAST
+                assert other.series_cutoff == 0.001
+            finally:
+                other.unlink()
+    finally:
+        sun.set_solar_model(sun.SolarModel.NOAA)
+        moon.set_series_cutoff(0.0)
+
+
+def test_OtherModelsCalculated(shared: ephemeris.Ephemeris):
+    jd = 2460375.3
+    jd2000 = jd - 2451545.0
+    ephemeris.install(shared)
+    try:
+        assert moon.moon_position(jd2000) == shared.moon(jd2000)
+        assert moon.moon_position(jd2000, 0.001) == moon._moon_position(jd2000, 0.001)
+        assert sun._ephemeris(jd) == shared.sun(jd)
+
+        sun.set_solar_model(sun.SolarModel.FAST)
+        moon.set_series_cutoff(0.001)
+        try:
+            assert sun._ephemeris(jd) == sun._fast_solar_terms(
+                sun.julianday_to_juliancentury(jd)
+            )
+            assert moon.moon_position(jd2000) == moon._moon_position(jd2000)
+            assert moon.moon_position(jd2000, 0.0) == shared.moon(jd2000)
+        finally:
+            sun.set_solar_model(sun.SolarModel.NOAA)
+            moon.set_series_cutoff(0.0)
+    finally:
+        ephemeris.uninstall()
+
+
+def test_File(tmp_path, shared: ephemeris.Ephemeris):
+    path = tmp_path / "ephemeris.bin"
+    ephemeris.write_ephemeris(path, START, END)
+    with ephemeris.open_ephemeris(path) as opened:
+        assert opened.name is None
+        assert opened.start == shared.start
+        assert opened.end == shared.end
+        assert opened.sun(2460375.3) == shared.sun(2460375.3)
+        assert opened.moon(8830.3) == shared.moon(8830.3)
+        with pytest.raises(ValueError):
+            opened.unlink()
+
+
+def test_NotAnEphemeris(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"ASTRALDB" + bytes(100))
+    with pytest.raises(ValueError):
+        ephemeris.open_ephemeris(path)
+
+
+def test_Attach(shared: ephemeris.Ephemeris):
+    assert shared.name is not None
+    with ephemeris.attach_ephemeris(shared.name) as attached:
+        assert attached.moon(8830.3) == shared.moon(8830.3)
+        # The memory is read only
+        with pytest.raises(TypeError):
+            attached._views[-1][0] = 0.0
+
+
+def test_CloseUninstalls(shared: ephemeris.Ephemeris):
+    attached = ephemeris.attach_ephemeris(shared.name)
+    ephemeris.install(attached)
+    attached.close()
+    assert ephemeris.installed() is None
+
+
+def test_EndBeforeStart():
+    with pytest.raises(ValueError):
+        ephemeris.share_ephemeris(END, START)
+
+
+def _worker_init(name: str) -> None:
+    ephemeris.install(ephemeris.attach_ephemeris(name))
+
+
+def _worker_moonrise(day: int) -> datetime.datetime:
+    observer = LocationInfo().observer
+    return moon.moonrise(observer, START + datetime.timedelta(days=day))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_Pool(shared: ephemeris.Ephemeris):
+    context = multiprocessing.get_context("fork")
+    with context.Pool(2, initializer=_worker_init, initargs=(shared.name,)) as pool:
+        results = pool.map(_worker_moonrise, range(1, 6))
+
+    observer = LocationInfo().observer
+    for day, result in enumerate(results, 1):
+        expected = moon.moonrise(observer, START + datetime.timedelta(days=day))
+        assert _close(result, expected)
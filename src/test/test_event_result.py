@@ -0,0 +1,126 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import EventResult, EventStatus, HorizonProfile, Observer, moon, sun
+from astral.location import Location
+
+
+def test_Occurs(london: Location):
+    d = datetime.date(2015, 12, 1)
+    result = sun.sunrise_event(london.observer, d)
+    assert result
+    assert result.status == EventStatus.OCCURS
+    assert result.time == sun.sunrise(london.observer, d)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [sun.dawn_event, sun.sunrise_event, sun.sunset_event, sun.dusk_event],
+)
+def test_MatchesRaisingFunctions(func, new_delhi: Location):
+    name = func.__name__[:-6]
+    d = datetime.date(2022, 7, 20)
+    result = func(new_delhi.observer, d, tzinfo=new_delhi.tzinfo)
+    expected = getattr(sun, name)(new_delhi.observer, d, tzinfo=new_delhi.tzinfo)
+    assert result.time == expected
+
+
+@pytest.mark.parametrize(
+    "func,date,status",
+    [
+        (sun.sunrise_event, datetime.date(2020, 6, 21), EventStatus.ALWAYS_ABOVE),
+        (sun.sunset_event, datetime.date(2020, 6, 21), EventStatus.ALWAYS_ABOVE),
+        (sun.sunrise_event, datetime.date(2020, 12, 21), EventStatus.ALWAYS_BELOW),
+        (sun.sunset_event, datetime.date(2020, 12, 21), EventStatus.ALWAYS_BELOW),
+        (sun.dawn_event, datetime.date(2020, 6, 21), EventStatus.ALWAYS_ABOVE),
+        (sun.dusk_event, datetime.date(2020, 6, 21), EventStatus.ALWAYS_ABOVE),
+    ],
+)
+def test_Polar(func, date, status, tromso: Location):
+    result = func(tromso.observer, date)
+    assert not result
+    assert result.status == status
+    assert result.time is None
+
+
+@pytest.mark.parametrize(
+    "date,msg",
+    [
+        (
+            datetime.date(2020, 6, 21),
+            "Sun is always above the horizon on this day, at this location.",
+        ),
+        (
+            datetime.date(2020, 12, 21),
+            "Sun is always below the horizon on this day, at this location.",
+        ),
+    ],
+)
+def test_PolarMessagesUnchanged(date, msg, tromso: Location):
+    with pytest.raises(ValueError) as exc:
+        sun.sunrise(tromso.observer, date)
+    assert exc.value.args[0] == msg
+
+
+def test_DepressionNotReached():
+    obs = Observer(51.05, -3.733333)
+    d = datetime.date(2016, 5, 29)
+    result = sun.dawn_event(obs, d, 18)
+    assert result.status == EventStatus.ALWAYS_ABOVE
+
+    with pytest.raises(ValueError) as exc:
+        sun.dawn(obs, d, 18)
+    assert exc.value.args[0] == (
+        "Sun never reaches 18 degrees below the horizon, at this location."
+    )
+
+
+def test_TimeAtElevation(london: Location):
+    d = datetime.date(2015, 12, 1)
+    result = sun.time_at_elevation_event(london.observer, 80, d)
+    assert result.status == EventStatus.ALWAYS_BELOW
+
+    result = sun.time_at_elevation_event(london.observer, 10, d)
+    assert result.time == sun.time_at_elevation(london.observer, 10, d)
+
+
+def test_HorizonProfile(tromso: Location):
+    obs = Observer(tromso.latitude, tromso.longitude, HorizonProfile((5.0,)))
+    result = sun.sunrise_event(obs, datetime.date(2020, 12, 21))
+    assert result.status == EventStatus.ALWAYS_BELOW
+
+
+def test_TimeOfTransitStillRaises(tromso: Location):
+    with pytest.raises(ValueError):
+        sun.time_of_transit(
+            tromso.observer,
+            datetime.date(2020, 12, 21),
+            90.0,
+            sun.SunDirection.RISING,
+        )
+
+
+def test_Moon(london: Location):
+    d = datetime.date(2021, 1, 5)
+    result = moon.moonrise_event(london.observer, d)
+    assert result.time == moon.moonrise(london.observer, d)
+
+    # Moonrise moves from 23:43 on the 5th to 01:04 on the 7th
+    result = moon.moonrise_event(london.observer, datetime.date(2021, 1, 6))
+    assert result.status == EventStatus.NOT_ON_DATE
+
+
+@pytest.mark.parametrize(
+    "day,status",
+    [(2, EventStatus.ALWAYS_ABOVE), (10, EventStatus.ALWAYS_BELOW)],
+)
+def test_MoonPolar(day: int, status: EventStatus):
+    obs = Observer(78.2, 15.6)
+    d = datetime.date(2021, 1, day)
+    assert moon.moonrise_event(obs, d).status == status
+    assert moon.moonset_event(obs, d).status == status
+
+
+def test_ResultIsFalsy():
+    assert not EventResult(EventStatus.NOT_ON_DATE)
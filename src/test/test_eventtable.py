@@ -0,0 +1,100 @@
+import datetime
+
+import pytest  # type: ignore
+
+import astral
+from astral import Depression, LocationInfo, Observer, sun
+from astral.eventtable import EVENTS, build_table, open_table
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("eventtable") / "events.bin"
+    sites = [
+        LocationInfo("London", "England", "Europe/London", 51.5, -0.1333333),
+        Observer(69.6, 18.95),
+    ]
+    assert build_table(sites, 2020, path) == 2
+    return path
+
+
+def test_Metadata(table_path):
+    with open_table(table_path) as table:
+        assert len(table) == 2
+        assert table.year == 2020
+        assert table.depression == 6.0
+        metadata = table.metadata
+        assert metadata["astral_version"] == astral.__version__
+        assert metadata["events"] == list(EVENTS)
+        assert metadata["solar_model"] == "noaa"
+
+
+def test_IsCurrent(table_path, monkeypatch):
+    with open_table(table_path) as table:
+        assert table.is_current()
+        assert table.is_current(Depression.CIVIL)
+        assert not table.is_current(Depression.NAUTICAL)
+        sun.set_solar_model("fast")
+        try:
+            assert not table.is_current()
+        finally:
+            sun.set_solar_model("noaa")
+        monkeypatch.setattr(astral, "__version__", "0.0")
+        assert not table.is_current()
+
+
+def test_BeforeStartOfYear(tmp_path):
+    # Tokyo's events on the 1st of January are in the previous year in UTC
+    tokyo = LocationInfo("Tokyo", "Japan", "Asia/Tokyo", 35.6897, 139.6922)
+    day = datetime.date(2020, 1, 1)
+    build_table([tokyo], 2020, tmp_path / "tokyo.bin")
+    with open_table(tmp_path / "tokyo.bin") as table:
+        result = table.day(0, day, tokyo.tzinfo)
+
+    for event in EVENTS:
+        expected = getattr(sun, event)(tokyo.observer, day, tzinfo=tokyo.tzinfo)
+        assert result[event] == expected.replace(microsecond=0)
+
+
+@pytest.mark.parametrize("day", [datetime.date(2020, 1, 1), datetime.date(2020, 7, 4)])
+def test_LocalDays(table_path, day):
+    london = LocationInfo("London", "England", "Europe/London", 51.5, -0.1333333)
+    with open_table(table_path) as table:
+        result = table.day(0, day, london.tzinfo)
+
+    assert result["sunrise"].date() == day
+    for event in EVENTS:
+        expected = getattr(sun, event)(london.observer, day, tzinfo=london.tzinfo)
+        assert result[event] == expected.replace(microsecond=0)
+
+
+def test_MissingEvents(table_path):
+    with open_table(table_path) as table:
+        # Day 356 is the 21st December
+        assert table.time(1, 356, "sunrise") is None
+        assert table.time(1, 356, "noon") is not None
+        assert table.day(1, datetime.date(2020, 6, 21))["dawn"] is None
+
+
+def test_LeapYear(table_path):
+    with open_table(table_path) as table:
+        assert table.time(1, 366, "noon").date() == datetime.date(2020, 12, 31)
+        with pytest.raises(IndexError):
+            table.time(1, 367, "noon")
+
+
+def test_BadLookups(table_path):
+    with open_table(table_path) as table:
+        with pytest.raises(IndexError):
+            table.time(2, 1, "noon")
+        with pytest.raises(ValueError):
+            table.time(0, 1, "moonrise")
+        with pytest.raises(ValueError):
+            table.day(0, datetime.date(2021, 1, 1))
+
+
+def test_NotATable(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not an event table")
+    with pytest.raises(ValueError):
+        open_table(path)
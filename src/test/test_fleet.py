@@ -0,0 +1,101 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Observer, sun
+
+np = pytest.importorskip("numpy")
+fleet = pytest.importorskip("astral.fleet")
+
+NOW = datetime.datetime(2024, 6, 21, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def positions():
+    rng = np.random.default_rng(42)
+    return rng.uniform(-90.0, 90.0, 500), rng.uniform(-180.0, 180.0, 500)
+
+
+@pytest.mark.parametrize("hours", [0, 5, 11, 17])
+def test_Classify(positions, hours: int):
+    latitudes, longitudes = positions
+    classifier = fleet.FleetClassifier(latitudes, longitudes)
+    when = NOW + datetime.timedelta(hours=hours)
+    states = classifier.classify(when)
+    assert states.dtype == np.int8
+    assert len(states) == len(classifier) == 500
+
+    checked = 0
+    for latitude, longitude, state in zip(latitudes, longitudes, states):
+        observer = Observer(latitude, longitude)
+        elevation = sun.elevation(observer, when, with_refraction=False)
+        # Skip observers close to the boundaries, which include refraction
+        if abs(elevation + 0.833) < 0.2 or abs(elevation + 6.05) < 0.2:
+            continue
+        if elevation > -0.833:
+            expected = fleet.LightState.DAY
+        elif elevation > -6.05:
+            expected = fleet.LightState.TWILIGHT
+        else:
+            expected = fleet.LightState.NIGHT
+        assert state == expected
+        checked += 1
+    assert checked > 400
+
+
+def test_Boundaries(london):
+    classifier = fleet.FleetClassifier([london.latitude], [london.longitude])
+    dawn, sunrise, sunset, dusk = classifier.boundaries(NOW)
+    expected = sun.sun(london.observer, NOW.date())
+    for name, values in (
+        ("dawn", dawn),
+        ("sunrise", sunrise),
+        ("sunset", sunset),
+        ("dusk", dusk),
+    ):
+        assert values[0] == pytest.approx(expected[name].timestamp(), abs=1.0)
+
+
+def test_Polar():
+    classifier = fleet.FleetClassifier([80.0, -80.0], [0.0, 0.0])
+    midnight = datetime.datetime(2024, 6, 21, 0, 0, tzinfo=datetime.timezone.utc)
+    states = classifier.classify(midnight)
+    assert list(states) == [fleet.LightState.DAY, fleet.LightState.NIGHT]
+
+    dawn, sunrise, sunset, dusk = classifier.boundaries(midnight)
+    assert np.isneginf(sunrise[0]) and np.isposinf(sunset[0])
+    assert np.isposinf(sunrise[1]) and np.isneginf(sunset[1])
+
+
+def test_OnlyRecalculatesNewDays(positions):
+    latitudes, longitudes = positions
+    classifier = fleet.FleetClassifier(latitudes, longitudes)
+    classifier.classify(NOW)
+    assert classifier.recalculated == 500
+
+    classifier.classify(NOW + datetime.timedelta(seconds=30))
+    assert classifier.recalculated == 500
+
+    # Devices pass their solar midnight as it moves westwards
+    classifier.classify(NOW + datetime.timedelta(hours=1))
+    moved = classifier.recalculated - 500
+    assert moved == np.sum(longitudes >= 165.0)
+
+
+def test_TimeTypes(positions):
+    latitudes, longitudes = positions
+    classifier = fleet.FleetClassifier(latitudes, longitudes)
+    expected = classifier.classify(NOW)
+    assert np.array_equal(classifier.classify(NOW.timestamp()), expected)
+    assert np.array_equal(classifier.classify(NOW.replace(tzinfo=None)), expected)
+    assert np.array_equal(
+        classifier.classify(np.datetime64("2024-06-21T12:00:00")), expected
+    )
+
+
+def test_UpdatePositions():
+    classifier = fleet.FleetClassifier([51.5, 51.5], [-0.13, -0.13])
+    assert list(classifier.classify(NOW)) == [2, 2]
+    # Move the second device to the other side of the world
+    classifier.update_positions([1], [-35.0], [179.0], NOW)
+    assert list(classifier.classify(NOW)) == [2, 0]
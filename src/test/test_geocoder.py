@@ -7,6 +7,7 @@ try:
 except ImportError:
     from backports import zoneinfo  # type: ignore
 
+import pytest  # type: ignore
 from pytest import approx, raises  # type: ignore
 
 import astral.geocoder
@@ -145,5 +146,93 @@ class TestDatabaseAddLocations:
         assert db_location_count(test_database) == count + 2
 
 
+class TestBinaryDatabase:
+    """Test writing and reading the binary database format"""
+
+    @pytest.fixture
+    def binary_database(
+        self, test_database: astral.geocoder.LocationDatabase, tmp_path
+    ):
+        path = tmp_path / "locations.db"
+        astral.geocoder.write_database(test_database, path)
+        with astral.geocoder.open_database(path) as db:
+            yield db
+
+    def test_groups(
+        self,
+        test_database: astral.geocoder.LocationDatabase,
+        binary_database: astral.geocoder.BinaryLocationDatabase,
+    ):
+        assert list(binary_database) == list(test_database)
+        assert len(binary_database) == len(test_database)
+        assert binary_database["europe"] == test_database["europe"]
+        assert astral.geocoder.group("Africa", binary_database) == test_database[
+            "africa"
+        ]
+        with raises(KeyError):
+            astral.geocoder.group("wallyland", binary_database)
+
+    def test_all_locations(
+        self,
+        test_database: astral.geocoder.LocationDatabase,
+        binary_database: astral.geocoder.BinaryLocationDatabase,
+    ):
+        assert list(astral.geocoder.all_locations(binary_database)) == list(
+            astral.geocoder.all_locations(test_database)
+        )
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "London",
+            "africa",
+            "Abu Dhabi",
+            "Abu Dhabi,United Arab Emirates",
+            "Birmingham,England",
+            "birmingham,usa",
+            "St. John's",
+        ],
+    )
+    def test_lookup(
+        self,
+        name: str,
+        test_database: astral.geocoder.LocationDatabase,
+        binary_database: astral.geocoder.BinaryLocationDatabase,
+    ):
+        assert astral.geocoder.lookup(name, binary_database) == astral.geocoder.lookup(
+            name, test_database
+        )
+
+    def test_lookup_not_found(
+        self, binary_database: astral.geocoder.BinaryLocationDatabase
+    ):
+        with raises(KeyError):
+            astral.geocoder.lookup("Nowhere", binary_database)
+
+    def test_added_locations(
+        self, test_database: astral.geocoder.LocationDatabase, tmp_path
+    ):
+        astral.geocoder.add_locations(
+            "Zürich Oerlikon,Schweiz,Europe/Zurich,47°24'N,8°33'E", test_database
+        )
+        path = tmp_path / "locations.db"
+        astral.geocoder.write_database(test_database, path)
+        with astral.geocoder.open_database(path) as db:
+            loc = astral.geocoder.lookup("zürich oerlikon", db)
+            assert isinstance(loc, LocationInfo)
+            assert loc.region == "Schweiz"
+            assert loc.latitude == approx(47.4)
+
+    def test_not_a_database(self, tmp_path):
+        path = tmp_path / "locations.db"
+        path.write_bytes(b"Not a database" * 10)
+        with raises(ValueError):
+            astral.geocoder.open_database(path)
+
+        path.write_bytes(b"ASTRAL")
+        with raises(ValueError):
+            astral.geocoder.open_database(path)
+
+
 def test_SanitizeKey():
     assert astral.geocoder._sanitize_key("Los Angeles") == "los_angeles"  # type: ignore
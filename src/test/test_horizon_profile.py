@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest  # type: ignore
+from almost_equal import datetime_almost_equal
+
+from astral import HorizonProfile, Observer, SunDirection, sun
+from astral.location import Location
+
+
+def test_altitude_interpolation():
+    profile = HorizonProfile((0.0, 10.0, 20.0, 10.0))
+    assert profile.altitude(0.0) == 0.0
+    assert profile.altitude(90.0) == 10.0
+    assert profile.altitude(135.0) == pytest.approx(15.0)
+    assert profile.altitude(315.0) == pytest.approx(5.0)
+    assert profile.altitude(-45.0) == pytest.approx(5.0)
+
+
+def test_from_points():
+    profile = HorizonProfile.from_points([(90.0, 10.0), (270.0, 30.0)], bins=4)
+    assert profile.altitudes == pytest.approx((20.0, 10.0, 20.0, 30.0))
+
+
+def test_empty_profile():
+    with pytest.raises(ValueError):
+        HorizonProfile(())
+
+
+def test_observer_elevation():
+    profile = HorizonProfile((1, 2, 3))
+    obs = Observer(51.5, -0.1, profile)
+    assert obs.elevation is profile
+    assert profile.altitudes == (1.0, 2.0, 3.0)
+
+
+@pytest.mark.parametrize(
+    "date_",
+    [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 6, 1),
+        datetime.date(2024, 10, 27),
+    ],
+)
+def test_flat_profile_matches_sunrise_sunset(date_: datetime.date, london: Location):
+    flat = Observer(london.latitude, london.longitude, HorizonProfile())
+    assert datetime_almost_equal(
+        sun.sunrise(flat, date_, london.tzinfo),
+        sun.sunrise(london.observer, date_, london.tzinfo),
+        seconds=2,
+    )
+    assert datetime_almost_equal(
+        sun.sunset(flat, date_, london.tzinfo),
+        sun.sunset(london.observer, date_, london.tzinfo),
+        seconds=2,
+    )
+
+
+def test_mountains_delay_sunrise(london: Location):
+    date_ = datetime.date(2024, 3, 1)
+    mountains = HorizonProfile.from_points([(0, 2), (90, 15), (180, 5), (270, 10)])
+    obs = Observer(london.latitude, london.longitude, mountains)
+
+    rise = sun.sunrise(obs, date_)
+    assert rise > sun.sunrise(london.observer, date_)
+    assert sun.sunset(obs, date_) < sun.sunset(london.observer, date_)
+
+    azimuth = sun.azimuth(obs, rise)
+    assert sun.elevation(obs, rise) == pytest.approx(
+        mountains.altitude(azimuth) - sun.SUN_APPARENT_RADIUS, abs=0.1
+    )
+
+
+def test_first_clearing_of_gap(london: Location):
+    """The sun rises through a gap in a ridge, disappears behind it and
+    then clears it for good"""
+    date_ = datetime.date(2024, 3, 1)
+    altitudes = [20.0] * 360
+    for azimuth in range(100, 106):
+        altitudes[azimuth] = 0.0
+    profile = HorizonProfile(tuple(altitudes))
+    obs = Observer(london.latitude, london.longitude, profile)
+
+    first = sun.horizon_crossing(obs, date_, resolution=1.0)
+    assert 100.0 <= sun.azimuth(obs, first) <= 106.0
+
+    high = HorizonProfile((20.0,))
+    assert sun.horizon_crossing(obs, date_, profile=high) > first
+
+
+def test_direction_setting(london: Location):
+    date_ = datetime.date(2024, 3, 1)
+    obs = Observer(london.latitude, london.longitude, HorizonProfile((5.0,)))
+    sunset = sun.horizon_crossing(obs, date_, SunDirection.SETTING, "Europe/London")
+    assert sunset < sun.sunset(london.observer, date_)
+    assert sunset.hour == 17
+    assert sunset.tzinfo == london.tzinfo
+
+
+def test_polar(tromso: Location):
+    obs = Observer(tromso.latitude, tromso.longitude, HorizonProfile())
+    with pytest.raises(ValueError, match="always below"):
+        sun.sunrise(obs, datetime.date(2024, 1, 1))
+    with pytest.raises(ValueError, match="always above"):
+        sun.sunset(obs, datetime.date(2024, 6, 21))
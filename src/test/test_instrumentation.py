@@ -0,0 +1,104 @@
+import datetime
+
+import pytest  # type: ignore
+
+import astral.moon
+import astral.sun
+from astral import instrumentation
+from astral.location import Location
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_DisabledByDefault():
+    assert not instrumentation.enabled()
+    assert astral.sun.dawn.__module__ == "astral.sun"
+    assert not hasattr(astral.sun.dawn, "__wrapped__")
+
+
+def test_EnableDisable():
+    original = astral.sun.dawn
+    instrumentation.enable()
+    try:
+        assert instrumentation.enabled()
+        assert astral.sun.dawn is not original
+        assert astral.sun.dawn.__wrapped__ is original
+    finally:
+        instrumentation.disable()
+    assert astral.sun.dawn is original
+
+
+def test_Counts(instrumented, london: Location):
+    d = datetime.date(2015, 12, 1)
+    astral.sun.sun(london.observer, d)
+    stats = instrumentation.snapshot()
+    assert stats["sun.sun"]["calls"] == 1
+    assert stats["sun.dawn"]["calls"] == 1
+    assert stats["sun.noon"]["calls"] == 1
+    assert stats["sun._transit"]["calls"] >= 4
+    assert stats["sun.sun"]["time"] >= stats["sun.dawn"]["time"]
+    assert stats["sun._localize"]["calls"] >= 5
+
+
+def test_Location(instrumented, london: Location):
+    london.sunrise(datetime.date(2015, 12, 1))
+    assert instrumentation.snapshot()["sun.sunrise"]["calls"] == 1
+
+
+def test_Retries(instrumented, new_delhi: Location):
+    # The transit calculated for the date gives dawn on the previous local day
+    d = datetime.date(2022, 7, 20)
+    astral.sun.dawn(new_delhi.observer, d, tzinfo=new_delhi.tzinfo)
+    stats = instrumentation.snapshot()
+    assert stats["sun._transit_on_date"]["retries"] == 1
+    assert stats["sun.dawn"]["retries"] == 1
+    assert stats["sun._transit"]["calls"] == 2
+
+
+def test_NoRetries(instrumented, london: Location):
+    astral.sun.dawn(london.observer, datetime.date(2015, 12, 1))
+    assert instrumentation.snapshot()["sun.dawn"]["retries"] == 0
+
+
+def test_MoonScans(instrumented, london: Location):
+    astral.moon.moonrise(london.observer, datetime.date(2021, 1, 5))
+    stats = instrumentation.snapshot()
+    assert stats["moon.moonrise"]["calls"] == 1
+    assert stats["moon.riseset"]["calls"] >= 1
+
+
+def test_Exceptions(instrumented, tromso: Location):
+    with pytest.raises(ValueError):
+        astral.sun.sunrise(tromso.observer, datetime.date(2020, 12, 21))
+    stats = instrumentation.snapshot()
+    assert stats["sun.sunrise"]["exceptions"] == 1
+    assert stats["sun.sunrise_event"]["exceptions"] == 0
+
+
+def test_Callback(london: Location):
+    records = []
+    instrumentation.enable(records.append)
+    try:
+        astral.sun.noon(london.observer, datetime.date(2015, 12, 1))
+    finally:
+        instrumentation.disable()
+        instrumentation.remove_callback(records.append)
+        instrumentation.reset()
+
+    names = [record.name for record in records]
+    assert names == ["sun._localize", "sun.noon"]
+    assert records[-1].elapsed > 0.0
+    assert records[-1].exception is None
+
+
+def test_Reset(instrumented, london: Location):
+    astral.sun.noon(london.observer, datetime.date(2015, 12, 1))
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,195 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Depression, Observer, SunDirection, moon, sun
+from astral.intervals import (
+    IntervalSet,
+    dark_sky,
+    dark_sky_sites,
+    daylight,
+    moon_above,
+    sun_above,
+    sun_between,
+    twilight,
+)
+from astral.location import Location
+
+UTC = datetime.timezone.utc
+
+
+def _dt(hour: int, minute: int = 0) -> datetime.datetime:
+    return datetime.datetime(2024, 1, 1, hour, minute, tzinfo=UTC)
+
+
+def _assert_close(a: datetime.datetime, b: datetime.datetime):
+    assert abs((a - b).total_seconds()) < 1.0
+
+
+class TestIntervalSet:
+    def test_Merge(self):
+        result = IntervalSet([(_dt(4), _dt(6)), (_dt(1), _dt(5)), (_dt(8), _dt(8))])
+        assert list(result) == [(_dt(1), _dt(6))]
+
+    def test_SetOperations(self):
+        a = IntervalSet([(_dt(1), _dt(5)), (_dt(7), _dt(9))])
+        b = IntervalSet([(_dt(2), _dt(3)), (_dt(4), _dt(8))])
+        assert list(a | b) == [(_dt(1), _dt(9))]
+        assert list(a & b) == [(_dt(2), _dt(3)), (_dt(4), _dt(5)), (_dt(7), _dt(8))]
+        assert list(a - b) == [(_dt(1), _dt(2)), (_dt(3), _dt(4)), (_dt(8), _dt(9))]
+        assert list(b - a) == [(_dt(5), _dt(7))]
+
+    def test_Duration(self):
+        a = IntervalSet([(_dt(1), _dt(2, 30)), (_dt(7), _dt(9))])
+        assert a.duration() == datetime.timedelta(hours=3, minutes=30)
+        assert IntervalSet().duration() == datetime.timedelta(0)
+
+    def test_Contains(self):
+        a = IntervalSet([(_dt(1), _dt(2))])
+        assert _dt(1) in a
+        assert _dt(1, 30) in a
+        assert _dt(2) not in a
+        assert datetime.datetime(2024, 1, 1, 1, 30) in a
+
+    def test_Clip(self):
+        a = IntervalSet([(_dt(1), _dt(5))])
+        assert list(a.clip(_dt(2), _dt(10))) == [(_dt(2), _dt(5))]
+
+    def test_Timestamps(self):
+        a = IntervalSet.from_timestamps([(10.0, 20.0), (15.0, 30.0)])
+        assert a.timestamps() == [(10.0, 30.0)]
+        assert len(a) == 1
+        assert not IntervalSet()
+
+
+def test_SunAbove(london: Location):
+    start = datetime.date(2024, 1, 1)
+    end = datetime.date(2024, 12, 31)
+    result = sun_above(london.observer, 10.0, start, end)
+    assert len(result) == 366
+
+    for rise, setting in list(result)[::30]:
+        date = rise.date()
+        for time, direction in (
+            (rise, SunDirection.RISING),
+            (setting, SunDirection.SETTING),
+        ):
+            _assert_close(
+                time, sun.time_at_elevation(london.observer, 10.0, date, direction)
+            )
+
+
+def test_DatesInTimezone(london: Location):
+    result = daylight(
+        london.observer,
+        datetime.date(2024, 7, 1),
+        datetime.date(2024, 7, 2),
+        tzinfo=london.tzinfo,
+    )
+    assert len(result) == 2
+    expected = sun.sun(london.observer, datetime.date(2024, 7, 1), tzinfo=london.tzinfo)
+    sunrise, sunset = next(result.intervals(london.tzinfo))
+    _assert_close(sunrise, expected["sunrise"])
+    _assert_close(sunset, expected["sunset"])
+
+
+def test_RangeClipsIntervals(london: Location):
+    start = datetime.datetime(2024, 7, 1, 12, tzinfo=UTC)
+    end = datetime.datetime(2024, 7, 2, 12, tzinfo=UTC)
+    result = daylight(london.observer, start, end)
+    assert result.timestamps()[0][0] == start.timestamp()
+    assert result.timestamps()[-1][1] == end.timestamp()
+
+
+def test_PolarDay(tromso: Location):
+    result = daylight(
+        tromso.observer, datetime.date(2024, 5, 1), datetime.date(2024, 8, 31)
+    )
+    longest = max(result, key=lambda interval: interval[1] - interval[0])
+    assert longest[1] - longest[0] > datetime.timedelta(days=60)
+    assert datetime.datetime(2024, 6, 21, tzinfo=UTC) in result
+
+
+def test_PolarNight(tromso: Location):
+    result = daylight(
+        tromso.observer, datetime.date(2024, 12, 10), datetime.date(2024, 12, 31)
+    )
+    assert not result
+
+
+def test_Twilight(london: Location):
+    date = datetime.date(2024, 3, 1)
+    result = twilight(london.observer, date, date, Depression.NAUTICAL)
+    dawn, sunrise = next(iter(result))
+    _assert_close(dawn, sun.dawn(london.observer, date, Depression.NAUTICAL))
+    _assert_close(sunrise, sun.sunrise(london.observer, date))
+
+
+def test_SunBetween():
+    observer = Observer(0.0, 0.0)
+    date = datetime.date(2024, 3, 20)
+    result = sun_between(observer, 10.0, 20.0, date, date)
+    assert len(result) == 2
+    assert result.duration() == pytest.approx(
+        datetime.timedelta(minutes=80), abs=datetime.timedelta(minutes=2)
+    )
+
+
+def test_MoonAbove(london: Location):
+    start = datetime.date(2024, 1, 2)
+    end = datetime.date(2024, 1, 30)
+    result = moon_above(london.observer, start, end)
+    for rise, setting in list(result)[1:-1]:
+        # The moon's rise and set times are rounded to the minute
+        expected = moon.moonrise(london.observer, rise.date())
+        assert abs((rise - expected).total_seconds()) < 60
+        expected = moon.moonset(london.observer, setting.date())
+        assert abs((setting - expected).total_seconds()) < 60
+
+
+def test_DarkSky(london: Location):
+    start = datetime.datetime(2024, 1, 20, tzinfo=UTC)
+    end = start + datetime.timedelta(days=3)
+    result = dark_sky(london.observer, start, end)
+    assert result
+
+    # Moon rises and sets are found to within a second
+    second = datetime.timedelta(seconds=1)
+    sun_up = sun_above(london.observer, -18.0, start, end)
+    moon_up = moon_above(london.observer, start, end)
+    assert not (result & sun_up)
+    assert (result & moon_up).duration() < second
+    expected = IntervalSet([(start, end)]) - sun_up - moon_up
+    assert len(result) == len(expected)
+    assert abs(result.duration() - expected.duration()) < second
+
+
+def test_DarkSkyIllumination(london: Location):
+    start = datetime.date(2024, 1, 1)
+    end = datetime.date(2024, 1, 31)
+    dark = dark_sky(london.observer, start, end)
+    dim = dark_sky(london.observer, start, end, max_illumination=0.5)
+    assert dim.duration() > dark.duration()
+    assert dark - dim == IntervalSet()
+
+    # The new moon on the 11th January is dim enough so the whole night is dark
+    night = IntervalSet(
+        [(datetime.datetime(2024, 1, 11, 12), datetime.datetime(2024, 1, 12, 12))]
+    )
+    astronomical = night - sun_above(london.observer, -18.0, start, end)
+    assert (dim & night) == astronomical
+
+
+def test_DarkSkySites(london: Location, new_delhi: Location):
+    start = datetime.date(2024, 6, 1)
+    end = datetime.date(2024, 6, 7)
+    results = dark_sky_sites([london.observer, new_delhi.observer], start, end)
+    assert results == [
+        dark_sky(london.observer, start, end),
+        dark_sky(new_delhi.observer, start, end),
+    ]
+
+
+def test_MoonIllumination():
+    assert moon.illumination(datetime.date(2024, 1, 11)) < 0.05
+    assert moon.illumination(datetime.datetime(2024, 1, 25, 17, 54)) > 0.99
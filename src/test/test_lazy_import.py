@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+
+import pytest  # type: ignore
+
+import astral
+
+
+def loaded_modules(statement: str) -> str:
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    src = os.path.dirname(os.path.dirname(astral.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout.split()
+
+
+def test_import_astral_does_not_load_submodules():
+    modules = loaded_modules("import astral")
+    assert "astral" in modules
+    assert "astral.sun" not in modules
+    assert "astral.moon" not in modules
+    assert "zoneinfo" not in modules
+
+
+def test_import_location_defers_calculations():
+    modules = loaded_modules("import astral.location")
+    assert "astral.sun" not in modules
+    assert "astral.table4" not in modules
+
+
+def test_submodule_attribute_access():
+    assert astral.sun.sunrise is not None
+    assert "moon" in dir(astral)
+
+
+def test_dir_does_not_import_optional_dependencies():
+    modules = loaded_modules(
+        "import astral; [getattr(astral, name) for name in dir(astral)]"
+    )
+    assert "astral.moon" in modules
+    assert "numpy" not in modules
+    assert "pandas" not in modules
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        astral.not_a_module
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+import json
+
+import pytest  # type: ignore
+
+from astral.__main__ import main
+
+
+def run(argv, stdin=None, monkeypatch=None):
+    output = io.StringIO()
+    if stdin is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    assert main(argv, output) == 0
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def run_csv(argv, stdin=None, monkeypatch=None):
+    output = io.StringIO()
+    if stdin is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    assert main(argv, output) == 0
+    output.seek(0)
+    return list(csv.DictReader(output))
+
+
+def test_single():
+    results = run(["-d", "2024-06-01", "51.5", "-0.1"])
+    assert len(results) == 1
+    assert results[0]["sunrise"] == "2024-06-01T03:48:59Z"
+    assert results[0]["timezone"] == "UTC"
+    assert results[0]["location"] == "Somewhere, On Earth"
+
+
+def test_single_timezone():
+    results = run(["-d", "2024-06-01", "-t", "Europe/London", "51.5", "-0.1"])
+    assert results[0]["sunrise"] == "2024-06-01T04:48:59+0100"
+    assert results[0]["timezone"] == "Europe/London"
+
+
+def test_date_range_with_moon():
+    results = run(["-d", "2024-06-01", "-e", "2024-06-03", "-m", "51.5", "-0.1"])
+    assert [r["date"] for r in results] == ["2024-06-01", "2024-06-02", "2024-06-03"]
+    assert "moonrise" in results[0]
+    assert "moon_phase" in results[0]
+
+
+def test_batch_csv_stdin(monkeypatch):
+    data = (
+        "latitude,longitude,tzname,date,name\n"
+        "51.5,-0.1,Europe/London,2024-06-01,London\n"
+        "78,15,,2024-06-21,Longyearbyen\n"
+    )
+    results = run_csv(["--batch", "-"], data, monkeypatch)
+    assert len(results) == 2
+    assert results[0]["sunrise"] == "2024-06-01T04:48:59+0100"
+    assert results[0]["location"] == "London, On Earth"
+    assert results[0]["error"] == ""
+    assert results[1]["error"]
+
+
+def test_batch_csv_columns(tmp_path):
+    path = tmp_path / "observers.csv"
+    path.write_text("latitude,longitude,date\n51.5,-0.1,2024-06-01\n")
+    output = io.StringIO()
+    main(["-b", str(path), "-m"], output)
+    header = output.getvalue().splitlines()[0]
+    assert header == (
+        "date,dawn,sunrise,noon,sunset,dusk,moonrise,moonset,moon_phase,"
+        "timezone,location,error"
+    )
+
+
+def test_batch_jsonl_file(tmp_path):
+    path = tmp_path / "observers.jsonl"
+    path.write_text(
+        '{"latitude": 51.5, "longitude": -0.1, "date": "2024-06-01"}\n'
+        "\n"
+        '{"latitude": -41.3, "longitude": 174.8, "date": "2024-06-01",'
+        ' "end": "2024-06-02", "tzname": "Pacific/Auckland"}\n'
+    )
+    results = run(["-b", str(path)])
+    assert len(results) == 3
+    assert results[2]["date"] == "2024-06-02"
+
+
+def test_batch_jobs(tmp_path):
+    path = tmp_path / "observers.csv"
+    path.write_text("latitude,longitude\n51.5,-0.1\n40.7,-74.0\n")
+    single = run_csv(["-b", str(path), "-d", "2024-03-01", "-e", "2024-03-05"])
+    multi = run_csv(
+        ["-b", str(path), "-d", "2024-03-01", "-e", "2024-03-05", "-j", "2"]
+    )
+    assert single == multi
+    assert len(single) == 10
+
+
+@pytest.mark.parametrize("option", ["-d", "-e"])
+def test_invalid_date(option, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main([option, "2024-13-01", "51.5", "-0.1"], io.StringIO())
+    assert exc.value.code == 2
+    assert "invalid date '2024-13-01'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+@pytest.mark.parametrize(
+    "row,error",
+    [
+        ('{"longitude": -0.1}', "missing field 'latitude'"),
+        ('{"latitude": "north", "longitude": -0.1}', "could not convert"),
+        ('{"latitude": 51.5, "longitude": -0.1, "date": "2024-13-01"}', "2024-13-01"),
+        ('{"latitude": 51.5, "longitude": -0.1, "tzname": "Not/AZone"}', "Not/AZone"),
+        ('{"latitude": 51.5,', "invalid JSON"),
+        ("[51.5, -0.1]", "expected a JSON object"),
+    ],
+)
+def test_batch_bad_row(tmp_path, jobs, row, error):
+    path = tmp_path / "observers.jsonl"
+    good = '{"latitude": 51.5, "longitude": -0.1, "date": "2024-06-01"}'
+    path.write_text(f"{good}\n{row}\n{good}\n")
+    results = run(["-b", str(path), "-j", jobs])
+    assert len(results) == 3
+    assert "error" not in results[0]
+    assert error in results[1]["error"]
+    assert results[2] == results[0]
+
+
+def test_batch_csv_bad_row(tmp_path):
+    path = tmp_path / "observers.csv"
+    path.write_text(
+        "latitude,longitude,date\n51.5,-0.1,01/06/2024\n51.5,-0.1,2024-06-01\n"
+    )
+    results = run_csv(["-b", str(path)])
+    assert len(results) == 2
+    assert "invalid date '01/06/2024'" in results[0]["error"]
+    assert results[1]["sunrise"] == "2024-06-01T03:48:59Z"
@@ -0,0 +1,132 @@
+import datetime
+from math import atan, degrees, radians, tan
+
+import pytest  # type: ignore
+
+from astral import LocationInfo, Observer, sun
+from astral.prayer import (
+    CONVENTIONS,
+    AsrMethod,
+    Convention,
+    HighLatitudeRule,
+    prayer_times,
+    prayer_times_sites,
+)
+
+START = datetime.date(2024, 3, 1)
+END = datetime.date(2024, 3, 31)
+
+
+def _close(a, b, seconds=1.0):
+    return abs((a - b).total_seconds()) < seconds
+
+
+@pytest.mark.parametrize("name", ["MWL", "ISNA", "Egypt", "Karachi"])
+def test_FajrIsha(london: LocationInfo, name: str):
+    convention = CONVENTIONS[name]
+    result = prayer_times(
+        london.observer, START, END, name, high_latitude=HighLatitudeRule.NONE
+    )
+    assert result["date"][0] == START
+    assert len(result["date"]) == 31
+
+    for idx, date in enumerate(result["date"]):
+        fajr = sun.dawn(london.observer, date, convention.fajr)
+        isha = sun.dusk(london.observer, date, convention.isha)
+        assert _close(result["fajr"][idx], fajr)
+        assert _close(result["isha"][idx], isha)
+        assert _close(result["sunrise"][idx], sun.sunrise(london.observer, date))
+        assert _close(result["maghrib"][idx], sun.sunset(london.observer, date))
+        # sun.noon uses the equation of time at the start of the day
+        assert _close(result["dhuhr"][idx], sun.noon(london.observer, date), 10.0)
+
+
+@pytest.mark.parametrize("method", [AsrMethod.STANDARD, AsrMethod.HANAFI])
+def test_AsrShadowRatio(new_delhi: LocationInfo, method: AsrMethod):
+    observer = new_delhi.observer
+    result = prayer_times(observer, START, END, asr=method)
+    for idx, noon in enumerate(result["dhuhr"]):
+        noon_elevation = sun.elevation(observer, noon, with_refraction=False)
+        shadow = 1.0 / tan(radians(noon_elevation)) + method.value
+        expected = degrees(atan(1.0 / shadow))
+        elevation = sun.elevation(observer, result["asr"][idx], with_refraction=False)
+        assert elevation == pytest.approx(expected, abs=0.01)
+        assert noon < result["asr"][idx] < result["maghrib"][idx]
+
+
+def test_MinutesAfterMaghrib(new_delhi: LocationInfo):
+    result = prayer_times(new_delhi.observer, START, END, "Makkah")
+    for maghrib, isha in zip(result["maghrib"], result["isha"]):
+        assert isha - maghrib == datetime.timedelta(minutes=90)
+
+
+def test_MaghribAngle(new_delhi: LocationInfo):
+    result = prayer_times(new_delhi.observer, START, END, "Tehran")
+    for date, maghrib in zip(result["date"], result["maghrib"]):
+        assert _close(maghrib, sun.dusk(new_delhi.observer, date, 4.5))
+
+
+@pytest.mark.parametrize(
+    "rule,fajr_portion,isha_portion",
+    [
+        (HighLatitudeRule.MIDDLE_OF_NIGHT, 1 / 2, 1 / 2),
+        (HighLatitudeRule.ONE_SEVENTH, 1 / 7, 1 / 7),
+        (HighLatitudeRule.ANGLE_BASED, 18 / 60, 17 / 60),
+    ],
+)
+def test_HighLatitude(rule: HighLatitudeRule, fajr_portion: float, isha_portion: float):
+    # The sun does not reach 18 degrees below the horizon in June
+    observer = Observer(58.0, 10.0)
+    date = datetime.date(2024, 6, 21)
+    unlimited = prayer_times(
+        observer, date, date, "MWL", high_latitude=HighLatitudeRule.NONE
+    )
+    assert unlimited["fajr"] == [None]
+    assert unlimited["isha"] == [None]
+
+    result = prayer_times(observer, date, date, "MWL", high_latitude=rule)
+    sunrise = result["sunrise"][0]
+    sunset = result["maghrib"][0]
+    night = datetime.timedelta(days=1) - (sunset - sunrise)
+    assert _close(result["fajr"][0], sunrise - fajr_portion * night)
+    assert _close(result["isha"][0], sunset + isha_portion * night)
+
+
+def test_PolarDay(tromso: LocationInfo):
+    date = datetime.date(2024, 6, 21)
+    result = prayer_times(tromso.observer, date, date)
+    assert result["sunrise"] == [None]
+    assert result["maghrib"] == [None]
+    assert result["fajr"] == [None]
+    assert result["dhuhr"][0] is not None
+
+
+def test_Sites(london_info: LocationInfo, new_delhi_info: LocationInfo):
+    observer = Observer(21.42, 39.83)
+    results = prayer_times_sites(
+        [london_info, new_delhi_info, observer], START, END, tzinfo="Asia/Riyadh"
+    )
+    assert len(results) == 3
+    assert results[0] == prayer_times(
+        london_info.observer, START, END, tzinfo=london_info.tzinfo
+    )
+    assert results[1]["fajr"][0].tzinfo == new_delhi_info.tzinfo
+    assert str(results[2]["fajr"][0].tzinfo) == "Asia/Riyadh"
+
+
+def test_EndBeforeStart(london_info: LocationInfo):
+    with pytest.raises(ValueError, match="end date is before the start date"):
+        prayer_times_sites([london_info], END, START)
+    with pytest.raises(ValueError, match="end date is before the start date"):
+        prayer_times(london_info.observer, END, START)
+
+
+def test_CustomConvention(london: LocationInfo):
+    convention = Convention(fajr=12.0, isha=12.0)
+    result = prayer_times(london.observer, START, START, convention)
+    assert _close(result["fajr"][0], sun.dawn(london.observer, START, 12.0))
+
+
+def test_UnknownConvention(london: LocationInfo):
+    with pytest.raises(ValueError):
+        prayer_times(london.observer, START, END, "Unknown")
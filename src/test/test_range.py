@@ -0,0 +1,88 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import HorizonProfile, Observer, moon, sun
+from astral.location import Location
+
+START = datetime.date(2020, 1, 1)
+END = datetime.date(2020, 12, 31)
+
+
+def _single(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize("latitude", [51.5, 69.6, -41.3, 0.0, -78.0])
+def test_SunRangeMatchesSun(latitude: float):
+    obs = Observer(latitude, 12.0)
+    result = sun.sun_range(obs, START, END, tzinfo="Europe/Berlin")
+    assert len(result["date"]) == 366
+    assert result["date"][0] == START
+    assert result["date"][-1] == END
+
+    for idx, date in enumerate(result["date"]):
+        for event in ("dawn", "sunrise", "noon", "sunset", "dusk"):
+            expected = _single(getattr(sun, event), obs, date, tzinfo="Europe/Berlin")
+            value = result[event][idx]
+            if expected is None:
+                assert value is None
+            else:
+                assert abs((value - expected).total_seconds()) < 1.0
+
+
+def test_SunRangeDepression():
+    obs = Observer(51.5, -0.13)
+    date = datetime.date(2020, 3, 1)
+    result = sun.sun_range(obs, date, date, 18)
+    expected = sun.dawn(obs, date, 18)
+    assert abs((result["dawn"][0] - expected).total_seconds()) < 1.0
+
+
+def test_SunRangeHorizonProfile():
+    # Only sunrise and sunset use the horizon profile, even when the depression
+    # for dawn and dusk gives the same zenith
+    obs = Observer(51.5, -0.13, HorizonProfile((5.0,)))
+    date = datetime.date(2020, 3, 1)
+    result = sun.sun_range(obs, date, date, sun.SUN_APPARENT_RADIUS)
+    dawn = sun.dawn(obs, date, sun.SUN_APPARENT_RADIUS)
+    assert abs((result["dawn"][0] - dawn).total_seconds()) < 1.0
+    assert result["sunrise"][0] == sun.sunrise(obs, date)
+    assert result["sunrise"][0] - dawn > datetime.timedelta(minutes=10)
+
+
+def test_SunRangeEmpty():
+    obs = Observer(51.5, -0.13)
+    result = sun.sun_range(obs, END, START)
+    assert result["date"] == []
+    assert result["sunrise"] == []
+
+
+def test_MoonRangeMatchesMoon():
+    obs = Observer(51.5, -0.13)
+    result = moon.moon_range(obs, START, datetime.date(2020, 3, 31), "Europe/London")
+    for idx, date in enumerate(result["date"]):
+        for event in ("moonrise", "moonset"):
+            expected = _single(getattr(moon, event), obs, date, "Europe/London")
+            assert result[event][idx] == expected
+        assert result["phase"][idx] == moon.phase(date)
+
+
+def test_LocationRanges(london: Location):
+    result = london.sun_range(START, datetime.date(2020, 1, 7))
+    assert len(result["sunrise"]) == 7
+    assert result["sunrise"][0].tzinfo == london.tzinfo
+
+    result = london.moon_range(START, datetime.date(2020, 1, 7), local=False)
+    assert len(result["moonrise"]) == 7
+    assert result["phase"][0] == london.moon_phase(START)
+
+
+def test_MoonEventAtEndOfDay():
+    # The moon rises in the last half minute of the UTC day
+    obs = Observer(69.6, 18.95)
+    rise, _ = moon.riseset(datetime.date(2024, 5, 7), obs)
+    assert rise == datetime.datetime(2024, 5, 7, 23, 59, tzinfo=datetime.timezone.utc)
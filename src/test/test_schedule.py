@@ -0,0 +1,145 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import LocationInfo, Observer, sun
+from astral.schedule import SolarEventSchedule
+
+NOW = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def _close(a, b, seconds=1.0):
+    return abs((a - b).total_seconds()) < seconds
+
+
+def test_NextEvent(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer)
+    event = schedule.next_event(NOW)
+    assert event is not None
+    assert event.event == "noon"
+    assert _close(event.time, sun.noon(london.observer, NOW.date()), 10.0)
+
+    event = schedule.next_event(event.time)
+    assert event is not None
+    assert event.event == "sunset"
+    assert _close(event.time, sun.sunset(london.observer, NOW.date()))
+
+
+def test_PreviousEvent(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer)
+    event = schedule.previous_event(NOW)
+    assert event is not None
+    assert event.event == "sunrise"
+    assert _close(event.time, sun.sunrise(london.observer, NOW.date()))
+    # The previous event includes one at the time given
+    assert schedule.previous_event(event.time) == event
+
+
+def test_Events(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer, tzinfo=london.tzinfo)
+    start = datetime.datetime(2024, 3, 1, tzinfo=london.tzinfo)
+    end = datetime.datetime(2024, 3, 31, tzinfo=london.tzinfo)
+    events = schedule.events(start, end)
+    assert len(events) == 30 * 5
+    assert [event.time for event in events] == sorted(event.time for event in events)
+    assert all(start <= event.time < end for event in events)
+
+    for event in events:
+        if event.event == "dusk":
+            date = event.time.date()
+            expected = sun.dusk(london.observer, date, tzinfo=london.tzinfo)
+            assert _close(event.time, expected)
+
+
+def test_Offsets(london: LocationInfo):
+    offset = datetime.timedelta(minutes=-30)
+    schedule = SolarEventSchedule(
+        london.observer, events=["sunset"], offsets={"sunset": offset}
+    )
+    event = schedule.next_event(NOW)
+    assert event is not None
+    assert event.event == "sunset"
+    assert _close(event.time, sun.sunset(london.observer, NOW.date()) + offset)
+
+
+def test_Lazy(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer)
+    assert len(schedule) == 0
+    assert schedule.days == 0
+
+    schedule.next_event(NOW)
+    days = schedule.days
+    schedule.next_event(NOW)
+    assert schedule.days == days
+
+    # Polling through a day only calculates the day after
+    for minutes in range(0, 24 * 60, 10):
+        schedule.next_event(NOW + datetime.timedelta(minutes=minutes))
+    assert schedule.days <= days + 1
+
+    schedule.next_event(NOW + datetime.timedelta(days=30))
+    assert days < schedule.days <= 30 + days + schedule.chunk_days
+
+
+def test_Discard(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer)
+    before = schedule.events(NOW, NOW + datetime.timedelta(days=3))
+    later = NOW + datetime.timedelta(days=30)
+    schedule.next_event(later)
+    days = schedule.days
+
+    schedule.discard(later)
+    assert schedule.days < days
+    assert all(time >= NOW.timestamp() for time in schedule._times)
+    assert schedule.next_event(later) is not None
+
+    # Discarded days are calculated again
+    assert schedule.events(NOW, NOW + datetime.timedelta(days=3)) == before
+    assert sorted(schedule._times) == schedule._times
+
+
+def test_DiscardOffsets(london: LocationInfo):
+    offsets = {"sunset": datetime.timedelta(days=2)}
+    schedule = SolarEventSchedule(london.observer, offsets=offsets)
+    later = NOW + datetime.timedelta(days=10)
+    expected = schedule.next_event(later)
+    schedule.discard(later)
+    assert schedule.next_event(later) == expected
+
+
+def test_Naive(london: LocationInfo):
+    schedule = SolarEventSchedule(london.observer, tzinfo=london.tzinfo)
+    naive = datetime.datetime(2024, 7, 1, 12, 0)
+    assert schedule.next_event(naive) == schedule.next_event(
+        naive.replace(tzinfo=london.tzinfo)
+    )
+
+
+def test_PolarDay(tromso: LocationInfo):
+    schedule = SolarEventSchedule(tromso.observer, events=["sunrise", "sunset"])
+    now = datetime.datetime(2024, 6, 21, tzinfo=datetime.timezone.utc)
+
+    event = schedule.next_event(now)
+    assert event is not None
+    assert event.event == "sunrise"
+    assert datetime.date(2024, 7, 20) < event.time.date() < datetime.date(2024, 7, 30)
+
+    event = schedule.previous_event(now)
+    assert event is not None
+    assert event.event == "sunset"
+    assert datetime.date(2024, 5, 10) < event.time.date() < datetime.date(2024, 5, 25)
+
+
+def test_NoEvents():
+    # The sun never reaches 18 degrees below the horizon at the pole in June
+    schedule = SolarEventSchedule(
+        Observer(89.9, 0.0), events=["dawn"], depression=18.0, max_days=30
+    )
+    now = datetime.datetime(2024, 6, 21, tzinfo=datetime.timezone.utc)
+    assert schedule.next_event(now) is None
+    assert schedule.previous_event(now) is None
+
+
+def test_UnknownEvent(london: LocationInfo):
+    with pytest.raises(ValueError):
+        SolarEventSchedule(london.observer, events=["moonrise"])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import pytest  # type: ignore
+
+from astral.geocoder import LocationDatabase, add_locations
+from astral.search import LocationIndex, edit_distance, normalize
+
+
+@pytest.fixture
+def index(test_database: LocationDatabase) -> LocationIndex:
+    add_locations("Zürich Oerlikon,Schweiz,Europe/Zurich,47°24'N,8°33'E", test_database)
+    return LocationIndex(test_database)
+
+
+def names(locations):
+    return [location.name for location in locations]
+
+
+def test_normalize():
+    assert normalize("  São   Tomé ") == "sao tome"
+    assert normalize("St. John's") == "st john s"
+    assert normalize("ZÜRICH") == "zurich"
+
+
+@pytest.mark.parametrize(
+    "a,b,distance",
+    [
+        ("london", "london", 0),
+        ("londn", "london", 1),
+        ("lodnon", "london", 2),
+        ("paris", "london", 3),
+    ],
+)
+def test_edit_distance(a: str, b: str, distance: int):
+    assert edit_distance(a, b, 2) == min(distance, 3)
+
+
+def test_prefix(index: LocationIndex):
+    assert names(index.prefix("lond")) == ["London"]
+    assert names(index.prefix("ZUR")) == ["Zurich", "Zürich Oerlikon"]
+    assert names(index.prefix("york")) == ["New York"]
+    assert index.prefix("") == []
+
+
+def test_prefix_exact_match_first(index: LocationIndex):
+    results = names(index.prefix("san"))
+    assert results[0] == "San Diego"
+    assert "Sana" in results
+
+
+def test_prefix_limit(index: LocationIndex):
+    assert len(index.prefix("b", limit=3)) == 3
+
+
+def test_prefix_duplicate_names(index: LocationIndex):
+    results = index.prefix("abu dhabi")
+    assert len(results) == 2
+    assert {r.region for r in results} == {"UAE", "United Arab Emirates"}
+
+
+def test_fuzzy(index: LocationIndex):
+    assert names(index.fuzzy("londn")) == ["London"]
+    assert names(index.fuzzy("oerlikon zurich", max_distance=1)) == []
+    assert "Paris" in names(index.fuzzy("pari"))
+
+
+def test_search(index: LocationIndex):
+    # Prefix matches first, then fuzzy matches
+    assert names(index.search("lond")) == ["London", "Lome"]
+    assert names(index.search("lodnon")) == ["London"]
+    assert names(index.search("xyzzy")) == []
@@ -238,3 +238,108 @@ def test_ElevationEqualsTimeAtElevation(elevation: float, london: Location):
     et = sun.time_at_elevation(o, elevation, td, with_refraction=True)
     sun_elevation = sun.elevation(o, et, with_refraction=True)
     assert sun_elevation == pytest.approx(elevation, abs=0.1)  # type: ignore
+
+
+# Julian centuries between 1900 and 2100
+@pytest.mark.parametrize("jc", [-1.0, -0.3, 0.0, 0.184134155, 0.5, 1.0])
+def test_FastSolarModel(jc: float):
+    declination, eqtime = sun._fast_solar_terms(jc)
+    assert declination == pytest.approx(sun.sun_declination(jc), abs=0.3 / 60)
+    assert eqtime == pytest.approx(sun.eq_of_time(jc), abs=4.0 / 60)
+
+
+def test_SetSolarModel(london: Location):
+    date = datetime.date(2015, 12, 1)
+    expected = sun.sun(london.observer, date)
+    sun.set_solar_model("fast")
+    try:
+        assert sun.solar_model() is sun.SolarModel.FAST
+        actual = sun.sun(london.observer, date)
+        assert actual != expected
+        for name, value in expected.items():
+            assert abs((actual[name] - value).total_seconds()) < 10
+    finally:
+        sun.set_solar_model()
+    assert sun.solar_model() is sun.SolarModel.NOAA
+    assert sun.sun(london.observer, date) == expected
+
+
+def test_SetSolarModel_Unknown():
+    with pytest.raises(ValueError):
+        sun.set_solar_model("exact")
+
+
+def test_TransitTolerance(london: Location):
+    date = datetime.date(2024, 3, 20)
+    args = (london.observer, date, 90.8333, sun.SunDirection.RISING)
+    sun.reset_transit_stats()
+    exact = sun.time_of_transit(*args, tolerance=1e-6)
+    fixed = sun.time_of_transit(*args, tolerance=0.0, max_iterations=2)
+    assert abs((fixed - exact).total_seconds()) < 1.0
+    assert abs((sun.time_of_transit(*args) - exact).total_seconds()) < 0.1
+
+    stats = sun.transit_stats()
+    assert stats["calls"] == 3
+    assert stats["unconverged"] == 1
+    assert stats["max_iterations"] >= 3
+
+
+def test_TransitHighLatitude():
+    # Two iterations are a minute out where the sun only just reaches 6 degrees
+    # below the horizon
+    observer = Observer(65.0, 10.0)
+    date = datetime.date(2024, 5, 14)
+    args = (observer, date, 96.0, sun.SunDirection.RISING)
+    exact = sun.time_of_transit(*args, tolerance=1e-6, max_iterations=50)
+    fixed = sun.time_of_transit(*args, tolerance=0.0, max_iterations=2)
+    assert abs((fixed - exact).total_seconds()) > 60.0
+    assert abs((sun.time_of_transit(*args) - exact).total_seconds()) < 0.1
+
+
+def test_CrossingTolerance():
+    # The crossings used by the schedules, prayer times, intervals and alignments
+    # iterate to the same tolerance as time_of_transit
+    observer = Observer(65.0, 10.0)
+    jd0 = sun.julianday(datetime.date(2024, 5, 14))
+    args = (
+        jd0,
+        sun._noon_jd(jd0, observer.longitude, sun._ephemeris),
+        sun._transit_terms(observer, 96.0),
+        observer.longitude,
+        sun.SunDirection.RISING,
+        sun._ephemeris,
+    )
+    exact = sun._crossing_jd(*args, tolerance=1e-6, max_iterations=50)[0]
+    fixed = sun._crossing_jd(*args, tolerance=0.0, max_iterations=2)[0]
+    assert abs(fixed - exact) * 86400 > 1.0
+    assert abs(sun._crossing_jd(*args)[0] - exact) * 86400 < 0.1
+
+
+def test_TransitWarmStart(london: Location):
+    date = datetime.date(2024, 3, 20)
+    args = (london.observer, date, 90.8333, sun.SunDirection.SETTING)
+    previous = sun.time_of_transit(
+        london.observer, date - datetime.timedelta(days=1), *args[2:]
+    )
+    cold = sun.time_of_transit(*args)
+
+    sun.reset_transit_stats()
+    warm = sun.time_of_transit(*args, guess=previous + datetime.timedelta(days=1))
+    assert abs((warm - cold).total_seconds()) < 0.1
+    stats = sun.transit_stats()
+    assert stats["warm_starts"] == 1
+    assert stats["iterations"] <= 2
+
+
+def test_SunRangeWarmStart(london: Location):
+    start = datetime.date(2024, 1, 1)
+    end = datetime.date(2024, 1, 31)
+    sun.reset_transit_stats()
+    result = sun.sun_range(london.observer, start, end)
+    stats = sun.transit_stats()
+    assert stats["warm_starts"] >= 4 * 29
+    assert stats["iterations"] < 1.2 * stats["calls"]
+
+    for date, sunrise in zip(result["date"], result["sunrise"]):
+        expected = sun.sunrise(london.observer, date)
+        assert abs((sunrise - expected).total_seconds()) < 1.0
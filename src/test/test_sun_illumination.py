@@ -0,0 +1,79 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Depression, Observer, sun
+
+TIMES = [
+    datetime.datetime(2024, 6, 21, 15, 30, 12, tzinfo=datetime.timezone.utc),
+    datetime.datetime(2024, 12, 21, 0, 0, 0),
+    datetime.datetime(
+        2024, 3, 20, 9, 5, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=5))
+    ),
+]
+
+
+@pytest.mark.parametrize("dt", TIMES)
+def test_SubsolarPoint(dt: datetime.datetime):
+    snapshot = sun.illumination(dt)
+    assert snapshot.time.utcoffset() == datetime.timedelta(0)
+    assert snapshot.subsolar_point[0] == snapshot.declination
+    assert sun.zenith(
+        Observer(*snapshot.subsolar_point), dt, with_refraction=False
+    ) == pytest.approx(0.0, abs=1e-4)
+
+
+@pytest.mark.parametrize("dt", TIMES)
+@pytest.mark.parametrize(
+    "latitude,longitude", [(51.5, -0.13), (-41.3, 174.8), (89.9, 10.0), (0.0, -180.0)]
+)
+def test_Elevation(dt: datetime.datetime, latitude: float, longitude: float):
+    snapshot = sun.IlluminationSnapshot(dt)
+    observer = Observer(latitude, longitude)
+    assert snapshot.elevation(latitude, longitude) == pytest.approx(
+        sun.elevation(observer, dt)
+    )
+
+
+def test_ElevationRaster():
+    dt = TIMES[0]
+    raster = sun.illumination(dt).elevation_raster(2.0)
+    assert len(raster) == 90
+    assert all(len(row) == 180 for row in raster)
+
+    # Row 19 is centred on 51N and column 89 on 1W
+    assert raster[19][89] == pytest.approx(sun.elevation(Observer(51.0, -1.0), dt))
+
+
+@pytest.mark.parametrize("dt", TIMES)
+@pytest.mark.parametrize("depression", [0.0, Depression.CIVIL, 18.0])
+def test_Terminator(dt: datetime.datetime, depression):
+    snapshot = sun.illumination(dt)
+    ring = snapshot.terminator(depression, points=36)
+    assert len(ring) == 36
+
+    if isinstance(depression, Depression):
+        depression = depression.value
+    zenith = 90.0 + (depression or sun.SUN_APPARENT_RADIUS)
+    zenith += sun.refraction_at_zenith(zenith)
+    for latitude, longitude in ring:
+        assert -180.0 <= longitude < 180.0
+        assert sun.zenith(
+            Observer(latitude, longitude), dt, with_refraction=False
+        ) == pytest.approx(zenith, abs=1e-3)
+
+
+def test_TerminatorMatchesSunrise(london):
+    dt = sun.sunrise(london.observer, datetime.date(2024, 3, 20))
+    ring = sun.illumination(dt).terminator()
+    # The ring passes through London, allowing for the spacing of the points
+    assert min(
+        abs(latitude - london.latitude) + abs(longitude - london.longitude)
+        for latitude, longitude in ring
+    ) < 1.0
+
+
+def test_TwilightBoundaries():
+    boundaries = sun.illumination(TIMES[0]).twilight_boundaries(points=8)
+    assert list(boundaries) == ["horizon", "civil", "nautical", "astronomical"]
+    assert all(len(ring) == 8 for ring in boundaries.values())
@@ -0,0 +1,218 @@
+import asyncio
+import datetime
+
+import pytest  # type: ignore
+
+from astral import LocationInfo, Observer, moon, sun
+from astral.schedule import SolarEventSchedule
+from astral.timer import SolarTimer
+
+START = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class Clock:
+    def __init__(self, now: datetime.datetime):
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _close(a, b, seconds=1.0):
+    return abs((a - b).total_seconds()) < seconds
+
+
+def _advance(timer: SolarTimer, end: datetime.datetime) -> None:
+    """Call the timer at each due time until `end`"""
+    due = timer.next_due()
+    while due is not None and due <= end:
+        timer.fire_due(due)
+        due = timer.next_due()
+
+
+def test_Register(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+    offset = datetime.timedelta(minutes=-15)
+    handle = timer.register(london.observer, "sunset", calls.append, offset)
+    assert len(timer) == 1
+
+    sunset = sun.sunset(london.observer, START.date())
+    assert handle.when is not None
+    assert _close(handle.when, sunset + offset)
+    assert timer.next_due() == handle.when
+
+    # Nothing is due yet
+    assert timer.fire_due() == 0
+    assert calls == []
+
+    clock.now = handle.when.timestamp()
+    assert timer.fire_due() == 1
+    assert len(calls) == 1
+    assert calls[0].event == "sunset"
+    assert _close(calls[0].time, sunset + offset)
+
+    # The next day's sunset is scheduled
+    next_sunset = sun.sunset(london.observer, START.date() + datetime.timedelta(1))
+    assert _close(handle.when, next_sunset + offset)
+
+
+def test_Order(london: LocationInfo, new_delhi: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+    for location in (london, new_delhi):
+        for event in ("sunrise", "sunset", "dusk"):
+            timer.register(location.observer, event, calls.append)
+
+    end = START + datetime.timedelta(days=3)
+    _advance(timer, end)
+    assert len(calls) == 2 * 3 * 3
+    assert [call.time for call in calls] == sorted(call.time for call in calls)
+    assert all(START < call.time <= end for call in calls)
+
+
+def test_MissedEvents(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+    handle = timer.register(london.observer, "sunrise", calls.append)
+
+    # Events missed while the timer was not called are only called once
+    later = START + datetime.timedelta(days=10)
+    assert timer.fire_due(later) == 1
+    assert handle.when is not None
+    assert handle.when > later
+
+
+def test_Cancel(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+    handles = [
+        timer.register(london.observer, "sunset", calls.append) for _ in range(200)
+    ]
+    for handle in handles[:150]:
+        handle.cancel()
+    handles[0].cancel()
+    assert len(timer) == 50
+    assert handles[0].cancelled
+    assert handles[0].when is None
+
+    timer.fire_due(START + datetime.timedelta(days=1))
+    assert len(calls) == 50
+
+
+def test_CallbackError(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+
+    def fail(event):
+        raise RuntimeError("callback failed")
+
+    timer.register(london.observer, "sunset", calls.append)
+    timer.register(london.observer, "sunset", fail)
+    timer.register(london.observer, "sunset", calls.append)
+
+    # The other callbacks are still called, then the error is raised
+    with pytest.raises(RuntimeError, match="callback failed"):
+        timer.fire_due(START + datetime.timedelta(days=1))
+    assert len(calls) == 2
+    assert len(timer) == 3
+
+
+def test_DiscardPast(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock, chunk_days=2)
+    calls = []
+    sunset = timer.register(london.observer, "sunset", calls.append)
+    moonrise = timer.register(london.observer, "moonrise", calls.append)
+
+    end = START + datetime.timedelta(days=60)
+    _advance(timer, end)
+    assert len(calls) > 100
+    assert isinstance(sunset._schedule, SolarEventSchedule)
+    assert sunset._schedule.days < 10
+    assert all(
+        time > end.timestamp() - 3 * 86400.0 for time in moonrise._schedule._times
+    )
+
+
+def test_DropSchedule(london: LocationInfo):
+    timer = SolarTimer(Clock(START))
+    first = timer.register(london.observer, "sunset", print)
+    second = timer.register(london.observer, "sunset", print)
+    first.cancel()
+    assert len(timer._schedules) == 1
+    second.cancel()
+    assert timer._schedules == {}
+
+    # Registering again creates a new schedule
+    third = timer.register(london.observer, "sunset", print)
+    assert third._schedule is not first._schedule
+    assert third.when is not None
+
+
+def test_SharedSchedule(london: LocationInfo):
+    timer = SolarTimer(Clock(START))
+    first = timer.register(london.observer, "sunset", print)
+    second = timer.register(
+        london.observer, "sunset", print, datetime.timedelta(hours=1)
+    )
+    assert first._schedule is second._schedule
+    assert isinstance(first._schedule, SolarEventSchedule)
+
+
+def test_Moon(london: LocationInfo):
+    clock = Clock(START)
+    timer = SolarTimer(clock)
+    calls = []
+    timer.register(london.observer, "moonrise", calls.append)
+    _advance(timer, START + datetime.timedelta(days=5))
+
+    assert len(calls) >= 4
+    for call in calls:
+        assert call.event == "moonrise"
+        expected = moon.moonrise(london.observer, call.time.date())
+        assert expected is not None
+        assert _close(call.time, expected, 60.0)
+
+
+def test_PolarDay(tromso: LocationInfo):
+    now = datetime.datetime(2024, 6, 21, tzinfo=datetime.timezone.utc)
+    timer = SolarTimer(Clock(now))
+    handle = timer.register(tromso.observer, "sunset", print)
+    assert handle.when is not None
+    assert handle.when.month == 7
+
+
+def test_UnknownEvent(london: LocationInfo):
+    with pytest.raises(ValueError):
+        SolarTimer().register(london.observer, "eclipse", print)
+
+
+def test_Run(london: LocationInfo):
+    timer = SolarTimer()
+    calls = []
+
+    # Use an offset which makes the next sunset due very soon
+    now = datetime.datetime.now(datetime.timezone.utc)
+    event = SolarEventSchedule(london.observer, ["sunset"]).next_event(now)
+    assert event is not None
+    offset = now + datetime.timedelta(seconds=0.2) - event.time
+
+    async def main():
+        async def callback(event):
+            calls.append(event)
+            timer.stop()
+
+        task = asyncio.ensure_future(timer.run())
+        await asyncio.sleep(0)
+        timer.register(london.observer, "sunset", callback, offset)
+        await asyncio.wait_for(task, 5.0)
+
+    asyncio.run(main())
+    assert len(calls) == 1
+    assert calls[0].time <= datetime.datetime.now(datetime.timezone.utc)
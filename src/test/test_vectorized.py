@@ -0,0 +1,131 @@
+import datetime
+
+import pytest  # type: ignore
+
+from astral import Observer, moon, sun
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("astral.vectorized")
+
+LATITUDES = [51.5, 69.6, -41.3, 0.0, 28.6]
+LONGITUDES = [-0.13, 18.95, 174.8, 30.0, 77.2]
+TIMES = [
+    "2024-06-21T05:30:12",
+    "2024-12-21T12:00:00",
+    "2024-03-01T23:59:59",
+    "2024-09-10T00:00:00",
+    "2024-01-15T17:45:30",
+]
+DATES = [time[:10] for time in TIMES]
+
+
+def _utc(value) -> datetime.datetime:
+    return value.astype(datetime.datetime).replace(tzinfo=datetime.timezone.utc)
+
+
+def test_ZenithAndAzimuth():
+    times = np.array(TIMES, dtype="datetime64[s]")
+    zenith, azimuth = vectorized.zenith_and_azimuth(LATITUDES, LONGITUDES, times)
+    for idx, time in enumerate(times):
+        observer = Observer(LATITUDES[idx], LONGITUDES[idx])
+        expected = sun.zenith_and_azimuth(observer, _utc(time))
+        assert zenith[idx] == pytest.approx(expected[0], abs=1e-9)
+        assert azimuth[idx] == pytest.approx(expected[1], abs=1e-9)
+
+
+def test_Broadcast():
+    times = np.arange("2024-06-21T00", "2024-06-22T00", dtype="datetime64[h]")
+    elevation = vectorized.elevation(51.5, -0.13, times)
+    assert elevation.shape == (24,)
+    assert elevation[12] == pytest.approx(
+        sun.elevation(Observer(51.5, -0.13), _utc(times[12]))
+    )
+
+
+@pytest.mark.parametrize(
+    "zenith,direction",
+    [
+        (90.0 + sun.SUN_APPARENT_RADIUS, sun.SunDirection.RISING),
+        (90.0 + sun.SUN_APPARENT_RADIUS, sun.SunDirection.SETTING),
+        (96.0, sun.SunDirection.RISING),
+        (108.0, sun.SunDirection.SETTING),
+    ],
+)
+def test_TimeOfTransit(zenith, direction):
+    dates = np.array(DATES, dtype="datetime64[D]")
+    times = vectorized.time_of_transit(LATITUDES, LONGITUDES, dates, zenith, direction)
+    for idx, date in enumerate(dates):
+        observer = Observer(LATITUDES[idx], LONGITUDES[idx])
+        try:
+            expected = sun.time_of_transit(
+                observer, date.astype(datetime.date), zenith, direction
+            )
+        except ValueError:
+            assert np.isnat(times[idx])
+        else:
+            assert _utc(times[idx]) == expected
+
+
+def test_SunEvents():
+    dates = np.array(DATES, dtype="datetime64[D]")
+    events = vectorized.sun_events(LATITUDES, LONGITUDES, dates)
+    for idx, date in enumerate(dates):
+        observer = Observer(LATITUDES[idx], LONGITUDES[idx])
+        noon = sun.noon(observer, date.astype(datetime.date))
+        assert _utc(events["noon"][idx]) == noon
+    assert np.isnat(events["sunrise"][1])
+
+
+def test_MoonPhase():
+    dates = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]")
+    phases = vectorized.moon_phase(dates)
+    expected = [moon.phase(date.astype(datetime.date)) for date in dates]
+    assert phases.tolist() == pytest.approx(expected)
+
+
+GRID_LATITUDES = np.linspace(-89.5, 89.5, 37)
+GRID_LONGITUDES = np.linspace(-179.5, 179.5, 49)
+
+
+@pytest.mark.parametrize("date", ["2024-03-20", "2024-06-21", "2024-12-21"])
+def test_SunGrid(date):
+    grid = vectorized.sun_grid(GRID_LATITUDES, GRID_LONGITUDES, date)
+    assert grid["sunrise"].shape == (37, 49)
+
+    latitude, longitude = np.meshgrid(GRID_LATITUDES, GRID_LONGITUDES, indexing="ij")
+    expected = vectorized.sun_events(latitude, longitude, np.datetime64(date))
+    for name, times in expected.items():
+        assert (np.isnat(grid[name]) == np.isnat(times)).all()
+        valid = ~np.isnat(times)
+        error = np.abs((grid[name][valid] - times[valid]).astype(np.int64))
+        assert error.max() < 1000
+
+    polar = np.isnat(grid["sunrise"])
+    assert ((grid["always_above"] | grid["always_below"]) == polar).all()
+
+
+def test_SunGridPolar():
+    grid = vectorized.sun_grid([80.0, -80.0], [0.0], "2024-06-21")
+    assert grid["always_above"].tolist() == [[True], [False]]
+    assert grid["always_below"].tolist() == [[False], [True]]
+
+
+def test_ElevationGrid():
+    time = np.datetime64("2024-06-21T05:30:12")
+    grid = vectorized.elevation_grid(GRID_LATITUDES, GRID_LONGITUDES, time)
+    latitude, longitude = np.meshgrid(GRID_LATITUDES, GRID_LONGITUDES, indexing="ij")
+    assert grid == pytest.approx(vectorized.elevation(latitude, longitude, time))
+
+
+def test_DaylightGrid():
+    date = np.datetime64("2024-03-20")
+    time = date + np.timedelta64(9, "h")
+    day = vectorized.daylight_grid(GRID_LATITUDES, GRID_LONGITUDES, time)
+    grid = vectorized.sun_grid(GRID_LATITUDES, GRID_LONGITUDES, date)
+
+    # Only compare where the sun rises then sets on the UTC date of the time
+    same_day = (grid["sunrise"] >= date) & (grid["sunset"] < date + 1)
+    same_day &= grid["sunrise"] < grid["sunset"]
+    between = (grid["sunrise"] <= time) & (time < grid["sunset"])
+    assert same_day.any()
+    assert (day[same_day] == between[same_day]).all()